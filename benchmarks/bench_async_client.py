@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark: threaded versus asyncio client for many concurrent reads
+
+Verifies N usernames on a local mock server with injected latency, once with
+GitHubAPIClient at several max_workers settings and once with
+AsyncGitHubAPIClient at several max_concurrency settings, and reports
+wall-clock time. Requires aiohttp.
+
+Usage: python3 benchmarks/bench_async_client.py [--users 1000] [--latency 0.1]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, '..', 'src'))
+sys.path.insert(0, current_dir)
+
+from async_client import AsyncGitHubAPIClient
+from github_client import GitHubAPIClient
+from mock_github_server import MockGitHubServer
+
+
+async def verify_async(base_url, names, concurrency):
+    async with AsyncGitHubAPIClient(base_url, max_connections=concurrency, max_concurrency=concurrency) as client:
+        await client.authenticate("mock-token")
+        start = time.perf_counter()
+        results = await client.verify_usernames(names)
+        return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=1000, help="usernames to verify")
+    parser.add_argument("--latency", type=float, default=0.1, help="injected response latency (seconds)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[8, 32, 64], help="threaded max_workers values")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[32, 64, 100],
+                        help="asyncio max_concurrency values")
+    args = parser.parse_args()
+
+    names = [f"user-{i}" for i in range(args.users)]
+    with MockGitHubServer(latency=args.latency) as server:
+        print(f"{args.users} usernames, {args.latency * 1000:.0f} ms latency\n")
+        for workers in args.workers:
+            with GitHubAPIClient(server.base_url, pool_size=workers, max_workers=workers,
+                                 prewarm_connections=0) as client:
+                client.authenticate("mock-token")
+                start = time.perf_counter()
+                results = client.verify_usernames(names)
+                elapsed = time.perf_counter() - start
+            print(f"threads  max_workers={workers:<4}     time={elapsed:6.2f}s  "
+                  f"users/sec={len(results) / elapsed:7.1f}")
+
+        for concurrency in args.concurrency:
+            elapsed, results = asyncio.run(verify_async(server.base_url, names, concurrency))
+            print(f"asyncio  max_concurrency={concurrency:<4} time={elapsed:6.2f}s  "
+                  f"users/sec={len(results) / elapsed:7.1f}")
+
+
+if __name__ == "__main__":
+    main()
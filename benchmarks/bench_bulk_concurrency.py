@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Benchmark: bounded concurrency in add_collaborators_bulk
+
+Adds one user to N repositories on a local mock server with injected latency
+and reports wall-clock time for several max_workers settings.
+
+Usage: python3 benchmarks/bench_bulk_concurrency.py [--repos 200] [--latency 0.05]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, '..', 'src'))
+sys.path.insert(0, current_dir)
+
+from github_client import GitHubAPIClient
+from mock_github_server import MockGitHubServer
+from rate_limit import RateLimitGovernor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repos", type=int, default=200, help="number of repositories")
+    parser.add_argument("--latency", type=float, default=0.05, help="injected response latency (seconds)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8, 16], help="max_workers values")
+    args = parser.parse_args()
+
+    repos = [f"mock-user/repo-{i:06d}" for i in range(args.repos)]
+    with MockGitHubServer(latency=args.latency) as server:
+        print(f"{args.repos} repositories, {args.latency * 1000:.0f} ms latency\n")
+        for workers in args.workers:
+            # Without write pacing, which would otherwise cap every setting at the same rate
+            with GitHubAPIClient(server.base_url, pool_size=max(workers, 1), prewarm_connections=0,
+                                 governor=RateLimitGovernor(writes_per_minute=0, writes_per_hour=0)) as client:
+                client.authenticate("mock-token")
+                start = time.perf_counter()
+                results = client.add_collaborators_bulk(repos, "octocat", max_workers=workers)
+                elapsed = time.perf_counter() - start
+
+            ok = sum(1 for _, success, _ in results if success)
+            print(f"max_workers={workers:<3} time={elapsed:6.2f}s  repos/sec={len(repos) / elapsed:7.1f}  "
+                  f"ok={ok}/{len(results)}")
+
+
+if __name__ == "__main__":
+    main()
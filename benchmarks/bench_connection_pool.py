@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark: connection reuse in GitHubAPIClient
+
+Adds a collaborator to N repositories on a local mock server and reports how
+many TCP connections (handshakes) each client configuration opened.
+
+Usage: python3 benchmarks/bench_connection_pool.py [--calls 200] [--threads 8]
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, '..', 'src'))
+sys.path.insert(0, current_dir)
+
+from github_client import GitHubAPIClient
+from mock_github_server import MockGitHubServer
+from rate_limit import RateLimitGovernor
+
+
+def run_case(server, label, client, calls, threads):
+    """Run `calls` add_collaborator requests and print handshake count and timing"""
+    server.reset_counters()
+    client.authenticate("mock-token")
+    # Let the background pre-warm finish so its handshakes are counted with the run
+    time.sleep(0.2)
+    repos = [f"mock-user/repo-{i:06d}" for i in range(calls)]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(lambda repo: client.add_collaborator(repo, "octocat"), repos))
+    elapsed = time.perf_counter() - start
+    client.close()
+
+    print(f"{label:<34} requests={server.request_count:<5} handshakes={server.connection_count:<5} "
+          f"time={elapsed:6.2f}s")
+
+
+def unpaced():
+    """Governor without the default write pacing, which would dominate the timings"""
+    return RateLimitGovernor(writes_per_minute=0, writes_per_hour=0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200, help="number of add_collaborator calls")
+    parser.add_argument("--threads", type=int, default=8, help="caller threads for the concurrent cases")
+    parser.add_argument("--pool-size", type=int, default=8, help="connection pool size")
+    parser.add_argument("--connect-latency", type=float, default=0.02,
+                        help="simulated handshake cost per new connection (seconds)")
+    args = parser.parse_args()
+
+    with MockGitHubServer(connect_latency=args.connect_latency) as server:
+        print(f"{args.calls} calls, simulated handshake {args.connect_latency * 1000:.0f} ms\n")
+        run_case(server, "no keep-alive, sequential", GitHubAPIClient(
+            server.base_url, keep_alive=False, governor=unpaced()), args.calls, 1)
+        run_case(server, "pooled, sequential", GitHubAPIClient(
+            server.base_url, pool_size=args.pool_size, governor=unpaced()), args.calls, 1)
+        run_case(server, f"no keep-alive, {args.threads} threads", GitHubAPIClient(
+            server.base_url, keep_alive=False, governor=unpaced()), args.calls, args.threads)
+        run_case(server, f"pooled ({args.pool_size}), {args.threads} threads", GitHubAPIClient(
+            server.base_url, pool_size=args.pool_size, governor=unpaced()), args.calls, args.threads)
+
+
+if __name__ == "__main__":
+    main()
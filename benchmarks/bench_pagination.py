@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Benchmark: parallel pagination in get_user_repositories
+
+Lists an account with many repositories on a local mock server with injected
+latency, comparing serial page walking with Link-header fan-out.
+
+Usage: python3 benchmarks/bench_pagination.py [--repos 3000] [--latency 0.05]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, '..', 'src'))
+sys.path.insert(0, current_dir)
+
+from github_client import GitHubAPIClient
+from mock_github_server import MockGitHubServer
+
+
+def run_case(server, label, link_header, workers):
+    """List all repositories once with a fresh client and print timing"""
+    server.link_header = link_header
+    with GitHubAPIClient(server.base_url, pool_size=max(workers, 1), max_workers=workers,
+                         prewarm_connections=0) as client:
+        client.authenticate("mock-token")
+        server.reset_counters()
+        start = time.perf_counter()
+        success, repos, message = client.get_user_repositories()
+        elapsed = time.perf_counter() - start
+
+    assert success, message
+    print(f"{label:<32} repos={len(repos):<7} requests={server.request_count:<4} time={elapsed:6.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repos", type=int, default=3000, help="repositories in the mock account")
+    parser.add_argument("--latency", type=float, default=0.05, help="injected response latency (seconds)")
+    parser.add_argument("--workers", type=int, default=8, help="max_workers for the parallel case")
+    args = parser.parse_args()
+
+    with MockGitHubServer(repo_count=args.repos, latency=args.latency) as server:
+        print(f"{args.repos} repositories, {args.latency * 1000:.0f} ms latency\n")
+        run_case(server, "serial (no Link header)", False, args.workers)
+        run_case(server, "Link header, 1 worker", True, 1)
+        run_case(server, f"Link header, {args.workers} workers", True, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory per repository record
+
+Parses GitHub-shaped JSON pages and keeps either the original per-repository
+dicts or a columnar RepositoryList, measuring retained memory with tracemalloc.
+
+Usage: python3 benchmarks/bench_repo_records.py [--sizes 10000 100000]
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, '..', 'src'))
+sys.path.insert(0, current_dir)
+
+from repo_records import RepositoryList
+from mock_github_server import MockGitHubServer
+
+
+def make_pages(count, per_page=100):
+    """Serialized /user/repos pages, as they would arrive off the wire"""
+    mock = MockGitHubServer(repo_count=count)
+    return [json.dumps([mock.repository(i) for i in range(start, min(start + per_page, count))]).encode()
+            for start in range(0, count, per_page)]
+
+
+def build_dicts(pages):
+    """The original representation: one six-key dict (plus permissions dict) per repository"""
+    repositories = []
+    for payload in pages:
+        for repo in json.loads(payload):
+            repositories.append({
+                "name": repo["name"],
+                "full_name": repo["full_name"],
+                "description": repo.get("description", ""),
+                "private": repo["private"],
+                "url": repo["html_url"],
+                "permissions": repo.get("permissions", {})
+            })
+    return repositories
+
+
+def build_records(pages):
+    """The columnar representation"""
+    repositories = RepositoryList()
+    for payload in pages:
+        repositories.extend(json.loads(payload))
+    return repositories
+
+
+def scan_dicts(repositories):
+    """A typical filtering loop: private repositories the user administers"""
+    return [i for i, repo in enumerate(repositories) if repo["private"] and repo["permissions"].get("admin")]
+
+
+def scan_records(repositories):
+    """The same filter over the packed flag column"""
+    return repositories.select(private=True, permission="admin")
+
+
+def measure(builder, scanner, pages):
+    """Return (retained bytes, build seconds, scan seconds) for one representation"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    repositories = builder(pages)
+    build_time = time.perf_counter() - start
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    scanner(repositories)
+    scan_time = time.perf_counter() - start
+    return retained, build_time, scan_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000], help="repository counts")
+    args = parser.parse_args()
+
+    for count in args.sizes:
+        pages = make_pages(count)
+        print(f"{count} repositories")
+        for label, builder, scanner in (("dicts", build_dicts, scan_dicts),
+                                        ("RepositoryList", build_records, scan_records)):
+            retained, build_time, scan_time = measure(builder, scanner, pages)
+            print(f"  {label:<15} {retained / count:7.0f} bytes/repo  total={retained / 1e6:7.1f} MB  "
+                  f"build={build_time:5.2f}s  scan={scan_time:5.3f}s")
+
+
+if __name__ == "__main__":
+    main()
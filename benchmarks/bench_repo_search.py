@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-keystroke repository filtering
+
+Types queries one character at a time against a 50k repository list and
+reports the latency of each keystroke for the trigram index versus a plain
+scan of every repository's name and description.
+
+Usage: python3 benchmarks/bench_repo_search.py [--repos 50000]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, '..', 'src'))
+
+from repo_records import RepositoryList
+from repo_search import RepositorySearchIndex
+
+
+WORDS = ("api", "web", "client", "server", "data", "tools", "docs", "infra", "mobile", "auth",
+         "billing", "search", "deploy", "config", "metrics", "worker", "sdk", "cli", "ui", "proxy")
+QUERIES = ("billing-api", "deploy", "infra/docs", "service for metrics", "zzz-not-there")
+
+
+def make_repositories(count, seed=1):
+    """Repositories with names and descriptions built from a small vocabulary"""
+    rng = random.Random(seed)
+    repositories = RepositoryList()
+    for i in range(count):
+        name = f"{rng.choice(WORDS)}-{rng.choice(WORDS)}-{i}"
+        repositories.append({
+            "name": name,
+            "full_name": f"org-{i % 40}/{name}",
+            "description": f"Service for {rng.choice(WORDS)} and {rng.choice(WORDS)}",
+            "private": i % 3 == 0,
+            "url": f"https://github.com/org-{i % 40}/{name}",
+            "permissions": {"admin": i % 5 == 0, "push": True, "pull": True},
+        })
+    return repositories
+
+
+def linear_search(repositories, query):
+    """The baseline: lowercase and test every repository on every keystroke"""
+    query = query.lower()
+    return [i for i, repo in enumerate(repositories)
+            if query in repo.full_name.lower() or query in (repo.description or "").lower()]
+
+
+def type_queries(search):
+    """Latency in milliseconds of every keystroke of every query"""
+    latencies = []
+    for query in QUERIES:
+        for length in range(1, len(query) + 1):
+            start = time.perf_counter()
+            search(query[:length])
+            latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def report(label, latencies):
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(f"  {label:<14} p50={statistics.median(ordered):7.2f}ms  p95={p95:7.2f}ms  max={ordered[-1]:7.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repos", type=int, default=50000, help="number of repositories")
+    args = parser.parse_args()
+
+    repositories = make_repositories(args.repos)
+    start = time.perf_counter()
+    index = RepositorySearchIndex(repositories)
+    print(f"{args.repos} repositories, index built in {time.perf_counter() - start:.2f}s")
+
+    report("linear scan", type_queries(lambda query: linear_search(repositories, query)))
+    report("trigram index", type_queries(index.matches))
+    report("index+filters", type_queries(lambda query: index.search(query, private=True, permission="admin")))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,459 @@
+"""
+Local mock of the GitHub REST endpoints used by GitHubAPIClient
+Runs on the standard library HTTP server so benchmarks and tests work offline.
+"""
+
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+
+def _iso_time(epoch):
+    """Format epoch seconds like GitHub's timestamps"""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(epoch))
+
+
+class _MockHandler(BaseHTTPRequestHandler):
+    """Request handler serving a fake GitHub account"""
+
+    # HTTP/1.1 keeps connections open between requests, like api.github.com
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; avoid Nagle/delayed-ACK stalls
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        # One handler instance per accepted TCP connection
+        self.server.mock.record_connection()
+        if self.server.mock.connect_latency:
+            # Stand-in for the extra round trips of a TLS handshake
+            time.sleep(self.server.mock.connect_latency)
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _dispatch(self, method):
+        mock = self.server.mock
+        length = int(self.headers.get("Content-Length") or 0)
+        raw_body = self.rfile.read(length) if length else b""
+
+        token = mock.token_of(self.headers)
+        mock.record_request(method, self.path, token)
+        delay = mock.response_delay()
+        if delay:
+            time.sleep(delay)
+
+        parts = urlsplit(self.path)
+        headers = {}
+        rejected = mock.authorize(token)
+        throttled = rejected or mock.throttle(method, parts.path, headers, token)
+        if throttled:
+            status, body = throttled
+        elif method == "POST" and parts.path == "/graphql":
+            status, body = mock.graphql(json.loads(raw_body or b"{}"))
+        else:
+            status, body = mock.route(method, parts.path, parse_qs(parts.query), self.headers, headers)
+
+        payload = b"" if body is None else json.dumps(body).encode("utf-8")
+        if method == "GET" and status == 200:
+            etag = '"%s"' % hashlib.sha1(payload).hexdigest()
+            headers["ETag"] = etag
+            if self.headers.get("If-None-Match") == etag:
+                mock.record_not_modified()
+                status, payload = 304, b""
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if payload:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        if self.headers.get("Connection", "").lower() == "close":
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class _MockHTTPServer(ThreadingHTTPServer):
+    # Async clients open hundreds of connections at once; the default backlog of 5 drops SYNs
+    request_queue_size = 128
+
+
+class MockGitHubServer:
+    """
+    In-process fake of api.github.com
+
+    Counts accepted TCP connections (a stand-in for TLS handshakes) and requests
+    so benchmarks can compare client configurations.
+    """
+
+    def __init__(self, repo_count: int = 0, latency: float = 0.0, connect_latency: float = 0.0,
+                 login: str = "mock-user", known_users=("octocat",), rate_limit: int = 0,
+                 rate_limit_window: float = 3600.0, secondary_every: int = 0, retry_after: str = "1",
+                 link_header: bool = True, jitter: float = 0.0, max_per_page: int = 100,
+                 forbidden_rate: float = 0.0, unprocessable_rate: float = 0.0, seed: int = 0,
+                 tokens=None):
+        """
+        Args:
+            repo_count: Number of repositories owned by the authenticated user
+            latency: Seconds of delay added to every response
+            connect_latency: Seconds of delay added to every new connection
+            login: Login of the authenticated user
+            known_users: Usernames that exist in addition to the authenticated user
+            rate_limit: Primary request budget per window (0 disables rate-limit headers)
+            rate_limit_window: Seconds until the primary budget resets
+            secondary_every: Answer every Nth write with a secondary-limit 403 (0 disables)
+            retry_after: Retry-After value sent with secondary-limit 403s ("" omits the header)
+            link_header: Send pagination Link headers on repository listings
+            jitter: Up to this many seconds of random delay added to each response's latency
+            max_per_page: Largest page size served for repository listings
+            forbidden_rate: Share of repositories whose collaborator PUTs get a permission 403
+            unprocessable_rate: Share of repositories whose collaborator PUTs get a 422
+            seed: Seed of the jitter random generator
+            tokens: Accepted tokens, as {token: {"login": str, "admin": repository full names}};
+                each has its own primary budget, and PUTs need admin on the repository
+                (no "admin" key: admin everywhere). None accepts any token as `login`
+        """
+        self.repo_count = repo_count
+        self.latency = latency
+        self.connect_latency = connect_latency
+        self.login = login
+        self.known_users = {name.lower() for name in known_users} | {login.lower()}
+        self.rate_limit = rate_limit
+        self.rate_limit_window = rate_limit_window
+        self.secondary_every = secondary_every
+        self.retry_after = retry_after
+        self.link_header = link_header
+        self.jitter = jitter
+        self.max_per_page = max_per_page
+        self.forbidden_rate = forbidden_rate
+        self.unprocessable_rate = unprocessable_rate
+        self._random = random.Random(seed)
+        self.tokens = tokens
+        self.revoked = set()  # Tokens answered with 401
+        self._budgets = {}  # Token (None without `tokens`) -> [remaining, reset epoch]
+        self.write_count = 0
+        self.throttled_count = 0
+        self.not_modified_count = 0
+        self.touched = []  # Repository indices updated since start, most recent last
+        self.collaborators = {}  # Repository full name -> lowercase logins with push access
+        self.invitations = {}  # Repository full name -> lowercase logins with a pending invitation
+        self.base_time = 1700000000
+        self.connection_count = 0
+        self.request_count = 0
+        self.requests_by_route = {}
+        self.requests_by_token = {}
+        self.writes_by_token = {}
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        """Start serving on an ephemeral localhost port and return the base URL"""
+        self._server = _MockHTTPServer(("127.0.0.1", 0), _MockHandler)
+        self._server.daemon_threads = True
+        self._server.mock = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        """Stop the server"""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def reset_counters(self):
+        """Zero the connection and request counters"""
+        with self._lock:
+            self.connection_count = 0
+            self.request_count = 0
+            self.requests_by_route = {}
+            self.requests_by_token = {}
+            self.writes_by_token = {}
+            self.not_modified_count = 0
+
+    def response_delay(self) -> float:
+        """Seconds to hold the current response: latency plus random jitter"""
+        if not self.jitter:
+            return self.latency
+        with self._lock:
+            return self.latency + self._random.uniform(0, self.jitter)
+
+    def put_failure(self, full_name):
+        """Status forced on collaborator PUTs to a repository by the error mix, or None"""
+        # The same repository always fails the same way, so runs are comparable
+        bucket = zlib.crc32(full_name.encode("utf-8")) % 10000 / 10000
+        if bucket < self.forbidden_rate:
+            return 403, {"message": "Must have admin rights to Repository."}
+        if bucket < self.forbidden_rate + self.unprocessable_rate:
+            return 422, {"message": "Validation Failed"}
+        return None
+
+    def record_connection(self):
+        with self._lock:
+            self.connection_count += 1
+
+    def record_not_modified(self):
+        with self._lock:
+            self.not_modified_count += 1
+
+    def record_request(self, method, path, token=None):
+        path = re.sub(r'/[^/?]+/[^/?]+/collaborators/.*', '/{repo}/collaborators/{user}', urlsplit(path).path)
+        path = re.sub(r'^/repos/[^/]+/[^/]+/(collaborators|invitations)$', r'/repos/{repo}/\1', path)
+        path = re.sub(r'^/repos/[^/]+/[^/]+$', '/repos/{repo}', path)
+        route = f"{method} {path}"
+        with self._lock:
+            self.request_count += 1
+            self.requests_by_route[route] = self.requests_by_route.get(route, 0) + 1
+            self.requests_by_token[token] = self.requests_by_token.get(token, 0) + 1
+            if method not in ("GET", "POST"):
+                self.writes_by_token[token] = self.writes_by_token.get(token, 0) + 1
+
+    @staticmethod
+    def token_of(headers):
+        """The token of a request's Authorization header, or None"""
+        authorization = headers.get("Authorization") or ""
+        return authorization.split(" ", 1)[1] if " " in authorization else None
+
+    def authorize(self, token):
+        """(401, body) for a revoked or, with `tokens`, unknown token; otherwise None"""
+        if token in self.revoked or (self.tokens is not None and token is not None and token not in self.tokens):
+            return 401, {"message": "Bad credentials"}
+        return None
+
+    def login_of(self, token):
+        return self.tokens[token]["login"] if self.tokens and token in self.tokens else self.login
+
+    def has_admin(self, token, full_name):
+        """Whether a token may add collaborators to a repository"""
+        if full_name.split("/")[-1].startswith("readonly-"):
+            return False
+        if not self.tokens or token not in self.tokens or "admin" not in self.tokens[token]:
+            return True
+        return full_name in self.tokens[token]["admin"]
+
+    def throttle(self, method, path, headers, token=None):
+        """
+        Apply the simulated rate limits to a request
+
+        Adds rate-limit headers to `headers` and returns (status, body) if the
+        request is rejected, otherwise None.
+        """
+        with self._lock:
+            if method not in ("GET", "POST"):
+                self.write_count += 1
+                if self.secondary_every and self.write_count % self.secondary_every == 0:
+                    self.throttled_count += 1
+                    if self.retry_after:
+                        headers["Retry-After"] = self.retry_after
+                    return 403, {"message": "You have exceeded a secondary rate limit. Please wait a few minutes."}
+
+            if not self.rate_limit or path == "/rate_limit":
+                return None
+
+            now = time.time()
+            budget = self._budgets.setdefault(token if self.tokens else None, [self.rate_limit, 0])
+            if now >= budget[1]:
+                budget[:] = [self.rate_limit, int(now + self.rate_limit_window) + 1]
+            exhausted = budget[0] <= 0
+            if not exhausted:
+                budget[0] -= 1
+            headers["X-RateLimit-Limit"] = str(self.rate_limit)
+            headers["X-RateLimit-Remaining"] = str(budget[0])
+            headers["X-RateLimit-Reset"] = str(budget[1])
+            if exhausted:
+                self.throttled_count += 1
+                return 403, {"message": "API rate limit exceeded"}
+        return None
+
+    def touch(self, *indices):
+        """Mark repositories as just updated, moving them to the front of sort=updated order"""
+        with self._lock:
+            for index in indices:
+                if index in self.touched:
+                    self.touched.remove(index)
+                self.touched.append(index)
+                self.repo_count = max(self.repo_count, index + 1)
+
+    def repository_at(self, position: int) -> dict:
+        """Build the JSON for the repository at a position in sort=updated order"""
+        touched = self.touched
+        if position < len(touched):
+            index = touched[-1 - position]
+            repo = self.repository(index)
+            repo["updated_at"] = _iso_time(self.base_time + 60 * (len(touched) - position))
+            return repo
+
+        # The position-th repository that has not been touched
+        index = position - len(touched)
+        for skipped in sorted(touched):
+            if skipped <= index:
+                index += 1
+            else:
+                break
+        return self.repository(index)
+
+    def repository(self, index: int) -> dict:
+        """Build the JSON for the repository with a given index, as last updated at startup"""
+        name = f"repo-{index:06d}"
+        return {
+            "name": name,
+            "full_name": f"{self.login}/{name}",
+            "description": f"Mock repository number {index}" if index % 3 else None,
+            "private": index % 2 == 0,
+            "html_url": f"https://github.com/{self.login}/{name}",
+            "permissions": {"admin": True, "maintain": True, "push": True, "triage": True, "pull": True},
+            "updated_at": _iso_time(self.base_time - 60 * index),
+        }
+
+    def pagination_link(self, path, query, page, last_page):
+        """Build a GitHub-style Link header for a paginated listing"""
+        def page_url(number):
+            params = {name: values[0] for name, values in query.items()}
+            params["page"] = str(number)
+            return f"{self.base_url}{path}?" + "&".join(f"{name}={value}" for name, value in params.items())
+
+        links = []
+        if page > 1:
+            links.append(f'<{page_url(page - 1)}>; rel="prev"')
+            links.append(f'<{page_url(1)}>; rel="first"')
+        if page < last_page:
+            links.append(f'<{page_url(page + 1)}>; rel="next"')
+            links.append(f'<{page_url(last_page)}>; rel="last"')
+        return ", ".join(links)
+
+    def graphql(self, request):
+        """Answer the GraphQL queries issued by GraphQLTransport"""
+        query = request.get("query", "")
+        variables = request.get("variables") or {}
+
+        if "viewer" in query:
+            start = int(variables.get("cursor") or 0)
+            end = min(start + int(variables.get("pageSize", 100)), self.repo_count)
+            nodes = []
+            for i in range(start, end):
+                repo = self.repository_at(i)
+                nodes.append({
+                    "name": repo["name"],
+                    "nameWithOwner": repo["full_name"],
+                    "description": repo["description"],
+                    "isPrivate": repo["private"],
+                    "url": repo["html_url"],
+                    "viewerPermission": "ADMIN",
+                    "updatedAt": repo["updated_at"],
+                })
+            page_info = {"hasNextPage": end < self.repo_count, "endCursor": str(end)}
+            return 200, {"data": {"viewer": {"repositories": {"pageInfo": page_info, "nodes": nodes}}}}
+
+        data, errors = {}, []
+        for alias, variable in re.findall(r"(\w+): user\(login: \$(\w+)\)", query):
+            login = variables.get(variable, "")
+            if login.lower() in self.known_users:
+                data[alias] = {"login": login, "name": login.title()}
+            else:
+                data[alias] = None
+                errors.append({"type": "NOT_FOUND", "path": [alias],
+                               "message": f"Could not resolve to a User with the login of '{login}'."})
+        body = {"data": data}
+        if errors:
+            body["errors"] = errors
+        return 200, body
+
+    def route(self, method, path, query, headers, response_headers):
+        """Return (status, json_body) for a request, adding any extra headers to response_headers"""
+        if method == "GET" and path == "/user":
+            if not headers.get("Authorization"):
+                return 401, {"message": "Requires authentication"}
+            return 200, {"login": self.login_of(self.token_of(headers)), "name": "Mock User"}
+
+        if method == "GET" and path == "/rate_limit":
+            return 200, {"resources": {"core": {"limit": 5000, "remaining": 5000, "reset": 0}}}
+
+        if method == "GET" and path == "/user/repos":
+            page = int(query.get("page", ["1"])[0])
+            per_page = min(int(query.get("per_page", ["30"])[0]), self.max_per_page)
+            start = (page - 1) * per_page
+            end = min(start + per_page, self.repo_count)
+            if self.link_header:
+                link = self.pagination_link(path, query, page, max(1, -(-self.repo_count // per_page)))
+                if link:
+                    response_headers["Link"] = link
+            return 200, [self.repository_at(i) for i in range(start, end)]
+
+        match = re.fullmatch(r"/users/([^/]+)", path)
+        if method == "GET" and match:
+            username = match.group(1)
+            if username.lower() in self.known_users:
+                return 200, {"login": username, "name": username.title()}
+            return 404, {"message": "Not Found"}
+
+        match = re.fullmatch(r"/repos/([^/]+)/([^/]+)", path)
+        if method == "GET" and match:
+            if match.group(2).startswith("missing-"):
+                return 404, {"message": "Not Found"}
+            full_name = f"{match.group(1)}/{match.group(2)}"
+            admin = self.has_admin(self.token_of(headers), full_name)
+            return 200, {"name": match.group(2), "full_name": full_name,
+                         "permissions": {"admin": admin, "maintain": admin, "push": True, "pull": True}}
+
+        match = re.fullmatch(r"/repos/([^/]+)/([^/]+)/(collaborators|invitations)", path)
+        if method == "GET" and match:
+            if match.group(2).startswith("missing-"):
+                return 404, {"message": "Not Found"}
+            full_name = f"{match.group(1)}/{match.group(2)}"
+            with self._lock:
+                if match.group(3) == "collaborators":
+                    logins = sorted(self.collaborators.get(full_name, ()))
+                    return 200, [{"login": login, "permissions": {"admin": False, "push": True, "pull": True}}
+                                 for login in logins]
+                logins = sorted(self.invitations.get(full_name, ()))
+                return 200, [{"id": i, "invitee": {"login": login}, "permissions": "write"}
+                             for i, login in enumerate(logins, 1)]
+
+        match = re.fullmatch(r"/repos/([^/]+)/([^/]+)/collaborators/([^/]+)", path)
+        if method == "PUT" and match:
+            # Repositories named missing-* do not exist; readonly-* ones lack admin rights
+            if match.group(2).startswith("missing-") or match.group(3).lower() not in self.known_users:
+                return 404, {"message": "Not Found"}
+            full_name, login = f"{match.group(1)}/{match.group(2)}", match.group(3).lower()
+            if not self.has_admin(self.token_of(headers), full_name):
+                return 403, {"message": "Must have admin rights to Repository."}
+            failure = self.put_failure(full_name)
+            if failure:
+                return failure
+            with self._lock:
+                if login in self.collaborators.get(full_name, ()):
+                    return 204, None
+                self.invitations.setdefault(full_name, set()).add(login)
+            return 201, {"id": 1}
+
+        return 404, {"message": "Not Found"}
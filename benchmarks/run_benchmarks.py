@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite: repository listing, username verification and bulk adds
+
+Runs each scenario against the local mock server with injected latency,
+jitter, rate-limit headers and a mix of 403/422 answers, then reports
+throughput, per-request p50/p95/p99 latency and request counts. The
+throttled_add scenario also runs against a small primary budget and
+secondary-limit 403s.
+
+Results are compared with the stored baselines: a scenario that sends more
+requests or gets fewer items right than its baseline fails the run (exit
+code 1). Throughput and latency depend on the machine, so they are only
+compared with --compare-timing, against a baseline saved on the same host.
+
+Usage: python3 benchmarks/run_benchmarks.py [--repos 5000] [--latency 0.02] [--save-baseline]
+       python3 benchmarks/run_benchmarks.py --compare-timing
+       python3 benchmarks/run_benchmarks.py --repos 100000 --no-compare
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, '..', 'src'))
+sys.path.insert(0, current_dir)
+
+from github_client import GitHubAPIClient
+from mock_github_server import MockGitHubServer
+from rate_limit import RateLimitGovernor
+
+
+DEFAULT_BASELINE_PATH = os.path.join(current_dir, "baselines.json")
+DEFAULT_TOLERANCE = 0.25  # Allowed relative slowdown before a scenario counts as a regression
+REQUEST_SLACK = 0.05  # Throttled retries depend on timing, so request counts vary a little
+THROTTLED_BUDGET = 100  # Primary requests per one-second window in the throttled scenario
+THROTTLED_SECONDARY_EVERY = 40  # Every Nth write of the throttled scenario hits a secondary limit
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a list of numbers (0 for an empty list)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * fraction // 1))
+    return ordered[int(rank) - 1]
+
+
+class TimedClient(GitHubAPIClient):
+    """GitHubAPIClient that records the duration of every HTTP request it sends"""
+
+    def __init__(self, *args, **kwargs):
+        self.durations = []
+        self._durations_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def _create_session(self):
+        session = super()._create_session()
+        send = session.request
+
+        def timed_request(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return send(*args, **kwargs)
+            finally:
+                with self._durations_lock:
+                    self.durations.append(time.perf_counter() - start)
+
+        session.request = timed_request
+        return session
+
+
+def measure(server, client, items, run):
+    """Run one scenario and summarize it"""
+    client.authenticate("mock-token")
+    client.durations.clear()
+    server.reset_counters()
+    start = time.perf_counter()
+    ok = run(client)
+    elapsed = time.perf_counter() - start
+    durations = client.durations
+    return {
+        "items": items,
+        "ok": ok,
+        "seconds": round(elapsed, 3),
+        "throughput": round(items / elapsed, 1) if elapsed else 0.0,
+        "requests": server.request_count,
+        "p50_ms": round(percentile(durations, 0.50) * 1000, 2),
+        "p95_ms": round(percentile(durations, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(durations, 0.99) * 1000, 2),
+    }
+
+
+def bench_listing(server, args):
+    def run(client):
+        success, repos, message = client.get_user_repositories()
+        assert success, message
+        return len(repos)
+
+    with TimedClient(server.base_url, max_workers=args.workers, prewarm_connections=0) as client:
+        return measure(server, client, args.repos, run)
+
+
+def bench_verification(server, args):
+    names = [f"user-{i}" for i in range(args.users)]
+
+    def run(client):
+        return sum(1 for _, exists, _ in client.verify_usernames(names) if exists)
+
+    with TimedClient(server.base_url, max_workers=args.workers, prewarm_connections=0) as client:
+        return measure(server, client, len(names), run)
+
+
+def bench_bulk_add(server, args):
+    repos = [f"mock-user/repo-{i:06d}" for i in range(args.adds)]
+
+    def run(client):
+        return sum(1 for _, success, _ in client.add_collaborators_bulk(repos, "octocat") if success)
+
+    # Writes are paced by the governor; the benchmark measures the client, not GitHub's quota
+    with TimedClient(server.base_url, max_workers=args.workers, prewarm_connections=0,
+                     governor=RateLimitGovernor(writes_per_minute=0, writes_per_hour=0)) as client:
+        return measure(server, client, len(repos), run)
+
+
+def bench_throttled_add(server, args):
+    """Bulk add against its own server with a small primary budget and secondary-limit 403s"""
+    repos = [f"mock-user/repo-{i:06d}" for i in range(args.adds // 4)]
+    throttled = MockGitHubServer(
+        latency=args.latency, jitter=args.jitter, rate_limit=THROTTLED_BUDGET, rate_limit_window=1.0,
+        secondary_every=THROTTLED_SECONDARY_EVERY, retry_after="0.2"
+    )
+
+    def run(client):
+        return sum(1 for _, success, _ in client.add_collaborators_bulk(repos, "octocat") if success)
+
+    with throttled, TimedClient(throttled.base_url, max_workers=args.workers, prewarm_connections=0,
+                                governor=RateLimitGovernor(writes_per_minute=0, writes_per_hour=0)) as client:
+        return measure(throttled, client, len(repos), run)
+
+
+SCENARIOS = {
+    "listing": bench_listing,
+    "verification": bench_verification,
+    "bulk_add": bench_bulk_add,
+    "throttled_add": bench_throttled_add,
+}
+
+
+def compare(results, baselines, tolerance, timing=False):
+    """
+    Check results against baselines
+
+    A scenario regresses when it sends more requests (beyond REQUEST_SLACK) or
+    gets more items wrong than the baseline run did. With timing, it also regresses when its
+    throughput drops, or its p95 latency grows, by more than the tolerance.
+
+    Returns:
+        List of human-readable regression descriptions (empty if none)
+    """
+    regressions = []
+    for name, result in results.items():
+        baseline = baselines.get(name)
+        if not baseline:
+            continue
+        if timing and result["throughput"] < baseline["throughput"] * (1 - tolerance):
+            regressions.append(f"{name}: throughput {result['throughput']}/s, baseline {baseline['throughput']}/s")
+        if timing and result["p95_ms"] > baseline["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {result['p95_ms']} ms, baseline {baseline['p95_ms']} ms")
+        if result["requests"] > baseline["requests"] * (1 + REQUEST_SLACK):
+            regressions.append(f"{name}: {result['requests']} requests, baseline {baseline['requests']}")
+        if result["ok"] < baseline["ok"]:
+            regressions.append(f"{name}: {result['ok']} items ok, baseline {baseline['ok']}")
+    return regressions
+
+
+def baseline_key(args):
+    """Baselines are only comparable between runs with the same workload settings"""
+    return (f"repos={args.repos},users={args.users},adds={args.adds},workers={args.workers},"
+            f"latency={args.latency},jitter={args.jitter},per_page={args.per_page},"
+            f"forbidden={args.forbidden},unprocessable={args.unprocessable}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repos", type=int, default=5000, help="repositories in the mock account (up to 100k)")
+    parser.add_argument("--users", type=int, default=200, help="usernames to verify (half of them exist)")
+    parser.add_argument("--adds", type=int, default=500, help="repositories in the bulk add")
+    parser.add_argument("--workers", type=int, default=8, help="client max_workers")
+    parser.add_argument("--latency", type=float, default=0.02, help="injected response latency (seconds)")
+    parser.add_argument("--jitter", type=float, default=0.01, help="random extra latency, up to (seconds)")
+    parser.add_argument("--per-page", type=int, default=100, help="largest page size the server returns")
+    parser.add_argument("--forbidden", type=float, default=0.05, help="share of repositories answering 403")
+    parser.add_argument("--unprocessable", type=float, default=0.02, help="share of repositories answering 422")
+    parser.add_argument("--only", choices=sorted(SCENARIOS), nargs="+", help="scenarios to run")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="baseline file")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="allowed relative slowdown")
+    parser.add_argument("--compare-timing", action="store_true",
+                        help="also compare throughput and p95 latency (baseline must come from this machine)")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--no-compare", action="store_true", help="do not compare with the baseline")
+    args = parser.parse_args(argv)
+
+    server = MockGitHubServer(
+        repo_count=args.repos, latency=args.latency, jitter=args.jitter, max_per_page=args.per_page,
+        known_users=[f"user-{i}" for i in range(0, args.users, 2)] + ["octocat"],
+        rate_limit=10 ** 9, forbidden_rate=args.forbidden, unprocessable_rate=args.unprocessable
+    )
+    results = {}
+    with server:
+        print(f"{args.repos} repositories, {args.latency * 1000:.0f}±{args.jitter * 1000:.0f} ms latency, "
+              f"{args.workers} workers\n")
+        for name in args.only or SCENARIOS:
+            result = SCENARIOS[name](server, args)
+            results[name] = result
+            print(f"{name:<13} items={result['items']:<6} ok={result['ok']:<6} time={result['seconds']:6.2f}s  "
+                  f"{result['throughput']:8.1f}/s  requests={result['requests']:<5} "
+                  f"p50={result['p50_ms']:6.1f}ms p95={result['p95_ms']:6.1f}ms p99={result['p99_ms']:6.1f}ms")
+
+    stored = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as handle:
+            stored = json.load(handle)
+    key = baseline_key(args)
+
+    if args.save_baseline:
+        stored[key] = {**stored.get(key, {}), **results}
+        with open(args.baseline, "w", encoding="utf-8") as handle:
+            json.dump(stored, handle, indent=2, sort_keys=True)
+            handle.write("\n")
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    if args.no_compare:
+        return 0
+    if key not in stored:
+        print("\nNo baseline for these settings; run with --save-baseline to store one")
+        return 0
+
+    regressions = compare(results, stored[key], args.tolerance, timing=args.compare_timing)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if not regressions:
+        print("\nNo regressions against the baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
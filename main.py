@@ -3,13 +3,12 @@
 GitHub Collaborator Manager
 Main entry point for the application
 
-Usage: python3 main.py
+Usage: python3 main.py                   (GUI)
+       python3 main.py repos|verify|add ...  (headless, see --help)
 """
 
 import sys
 import os
-import tkinter as tk
-from tkinter import messagebox
 
 # Add src directory to Python path
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -17,24 +16,39 @@ src_dir = os.path.join(current_dir, 'src')
 sys.path.insert(0, src_dir)
 
 def check_dependencies():
-    """Check if required dependencies are installed"""
-    try:
-        import requests
-        return True, None
-    except ImportError as e:
-        return False, str(e)
+    """Check if required dependencies are installed, without importing them"""
+    from importlib.util import find_spec
+    
+    if find_spec("requests") is None:
+        return False, "No module named 'requests'"
+    return True, None
+
+def show_error(title, message):
+    """Show an error dialog without a main window"""
+    import tkinter as tk
+    from tkinter import messagebox
+    
+    root = tk.Tk()
+    root.withdraw()  # Hide the main window
+    messagebox.showerror(title, message)
 
 def main():
     """Main entry point with error handling"""
+    if len(sys.argv) > 1:
+        # Headless mode: no tkinter import, so no display is needed
+        deps_ok, error = check_dependencies()
+        if not deps_ok:
+            print(f"Required dependency missing: {error}\nRun: pip3 install -r requirements.txt",
+                  file=sys.stderr)
+            return 1
+        from cli import main as run_cli
+        return run_cli(sys.argv[1:])
+    
     try:
         # Check dependencies
         deps_ok, error = check_dependencies()
         if not deps_ok:
-            # Create a simple error dialog
-            root = tk.Tk()
-            root.withdraw()  # Hide the main window
-            
-            messagebox.showerror(
+            show_error(
                 "Missing Dependencies",
                 f"Required dependency missing: {error}\n\n"
                 "Please install required packages:\n"
@@ -49,11 +63,7 @@ def main():
         return 0
         
     except Exception as e:
-        # Create a simple error dialog
-        root = tk.Tk()
-        root.withdraw()  # Hide the main window
-        
-        messagebox.showerror(
+        show_error(
             "Application Error",
             f"An error occurred while starting the application:\n\n{str(e)}\n\n"
             "Please check that all files are present and try again."
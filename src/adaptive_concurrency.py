@@ -0,0 +1,184 @@
+"""
+Adaptive (AIMD) concurrency limit for collaborator writes
+The number of writes in flight grows by one after every limit's worth of
+healthy writes and is cut by a constant factor when GitHub pushes back
+(secondary-limit 403, 429, server error) or write latency spikes. Every
+change is recorded so the policy can be tuned from real runs.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
+from rate_limit import WAIT_RETRY_AFTER, WAIT_SECONDARY
+from request_metrics import RequestEvent
+
+
+DEFAULT_INITIAL = 4
+DEFAULT_MINIMUM = 1
+DEFAULT_MAXIMUM = 32
+DEFAULT_DECREASE = 0.5
+# A write slower than this multiple of the usual write latency counts as a spike
+DEFAULT_LATENCY_FACTOR = 3.0
+# Spikes below this many seconds are noise, e.g. on a fast local network
+DEFAULT_LATENCY_FLOOR = 0.5
+# Weight of each healthy write in the usual-latency average
+LATENCY_SMOOTHING = 0.1
+
+CHANGE_START = "start"
+CHANGE_INCREASE = "increase"
+CHANGE_THROTTLED = "throttled"
+CHANGE_SERVER_ERROR = "server_error"
+CHANGE_LATENCY = "latency"
+
+# Throttle reasons that mean "slow down"; an exhausted primary budget is the governor's business
+_BACKOFF_THROTTLES = (WAIT_SECONDARY, WAIT_RETRY_AFTER)
+
+
+class AdaptiveConcurrency:
+    """
+    Thread-safe AIMD limit on in-flight writes
+
+    Attach it to a client (controller.attach(client)); the client's bulk-add
+    methods then run up to `maximum` workers, each holding a slot() while it
+    writes, and the controller adjusts the number of slots from the outcome
+    of every write attempt. At most one decrease happens per round trip:
+    signals from writes that started before the last decrease are ignored.
+    """
+
+    def __init__(self, initial: int = DEFAULT_INITIAL, minimum: int = DEFAULT_MINIMUM,
+                 maximum: int = DEFAULT_MAXIMUM, decrease: float = DEFAULT_DECREASE,
+                 latency_factor: float = DEFAULT_LATENCY_FACTOR, latency_floor: float = DEFAULT_LATENCY_FLOOR,
+                 clock: Callable[[], float] = time.perf_counter):
+        """
+        Args:
+            initial: In-flight writes allowed at the start
+            minimum: Lowest limit a decrease can reach
+            maximum: Highest limit an increase can reach (and the bulk-add worker count)
+            decrease: Factor the limit is multiplied by on a backoff signal
+            latency_factor: A write slower than this multiple of the usual latency is a spike
+            latency_floor: Latencies at or below this many seconds are never spikes
+            clock: Time source, the one RequestEvent.started is taken from
+        """
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self.latency_floor = latency_floor
+        self._clock = clock
+        self._condition = threading.Condition()
+        self.limit = min(max(initial, self.minimum), self.maximum)
+        self.in_flight = 0
+        self.usual_latency: Optional[float] = None  # Smoothed latency of healthy writes
+        self._healthy = 0  # Healthy writes since the last change
+        self._started = clock()
+        self._last_decrease = float("-inf")
+        self._changes: Dict[str, int] = {}  # Change reason -> count
+        self._history: List[Tuple[float, int, str]] = [(0.0, self.limit, CHANGE_START)]
+
+    def attach(self, client) -> "AdaptiveConcurrency":
+        """
+        Observe a GitHubAPIClient's writes and limit its bulk-add fan-out
+
+        The ceiling is lowered to the client's pool_size, the most workers it runs.
+        """
+        with self._condition:
+            self.maximum = max(self.minimum, min(self.maximum, client.pool_size))
+            self.limit = min(self.limit, self.maximum)
+        client.add_request_hooks(after=self.observe)
+        client.concurrency = self
+        return self
+
+    @contextmanager
+    def slot(self):
+        """Hold one in-flight write slot, waiting while the limit is reached"""
+        with self._condition:
+            while self.in_flight >= self.limit:
+                self._condition.wait()
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self.in_flight -= 1
+                self._condition.notify()
+
+    def observe(self, event: RequestEvent):
+        """Adjust the limit from one completed attempt (reads are ignored)"""
+        if not event.write:
+            return
+        if event.throttled in _BACKOFF_THROTTLES or event.status == 429:
+            self._back_off(event, CHANGE_THROTTLED)
+        elif event.error is not None or (event.status or 0) >= 500:
+            self._back_off(event, CHANGE_SERVER_ERROR)
+        elif event.throttled is None:
+            self._healthy_write(event)
+
+    def _back_off(self, event: RequestEvent, reason: str):
+        with self._condition:
+            if event.started < self._last_decrease:
+                # Sent at the old limit: this round trip already backed off
+                return
+            self._last_decrease = self._clock()
+            self._change(max(self.minimum, int(self.limit * self.decrease)), reason)
+
+    def _healthy_write(self, event: RequestEvent):
+        with self._condition:
+            usual = self.usual_latency
+            if usual is not None and event.elapsed > max(usual * self.latency_factor, self.latency_floor):
+                if event.started >= self._last_decrease:
+                    self._last_decrease = self._clock()
+                    self._change(max(self.minimum, int(self.limit * self.decrease)), CHANGE_LATENCY)
+                return
+            self.usual_latency = event.elapsed if usual is None else (
+                usual + LATENCY_SMOOTHING * (event.elapsed - usual))
+            self._healthy += 1
+            # Only grow a limit that is being used; an idle one proves nothing
+            if self._healthy >= self.limit and self.in_flight >= self.limit - 1 and self.limit < self.maximum:
+                self._change(self.limit + 1, CHANGE_INCREASE)
+
+    def _change(self, limit: int, reason: str):
+        # Called with the condition held
+        self._healthy = 0
+        self._changes[reason] = self._changes.get(reason, 0) + 1
+        if limit != self.limit:
+            self.limit = limit
+            self._history.append((self._clock() - self._started, limit, reason))
+            self._condition.notify_all()
+
+    def history(self) -> List[Tuple[float, int, str]]:
+        """
+        Every limit change
+
+        Returns:
+            List of (seconds since the controller was created, new limit, reason),
+            starting with the initial limit
+        """
+        with self._condition:
+            return list(self._history)
+
+    def stats(self) -> Dict:
+        """
+        Current state
+
+        Returns:
+            Dictionary with limit, in_flight, minimum, maximum, usual_latency (seconds)
+            and the number of adjustments per reason
+        """
+        with self._condition:
+            return {
+                "limit": self.limit,
+                "in_flight": self.in_flight,
+                "minimum": self.minimum,
+                "maximum": self.maximum,
+                "usual_latency": self.usual_latency,
+                "changes": dict(self._changes),
+            }
+
+    def write_history(self, path: str):
+        """Write the limit history as CSV (seconds,limit,reason)"""
+        lines = ["seconds,limit,reason"]
+        lines.extend(f"{seconds:.3f},{limit},{reason}" for seconds, limit, reason in self.history())
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
@@ -0,0 +1,31 @@
+"""
+Per-user storage locations for GitHub Collaborator Manager
+"""
+
+import os
+import sys
+
+
+APP_NAME = "GitHub Collaborator Manager"
+
+
+def user_config_dir() -> str:
+    """
+    Directory for the application's persistent data, created if missing
+
+    ~/Library/Application Support on macOS, %APPDATA% on Windows and
+    $XDG_CONFIG_HOME (default ~/.config) elsewhere.
+
+    Returns:
+        Absolute directory path
+    """
+    if sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Application Support")
+    elif os.name == "nt":
+        base = os.environ.get("APPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+
+    path = os.path.join(base, APP_NAME)
+    os.makedirs(path, exist_ok=True)
+    return path
@@ -0,0 +1,490 @@
+"""
+Asyncio variant of the GitHub API client for high-concurrency workloads
+AsyncGitHubAPIClient keeps hundreds of requests in flight on one thread over
+a shared aiohttp connection pool, bounded by a semaphore and paced by the same
+RateLimitGovernor as the threaded client. BlockingGitHubClient runs it on a
+background event loop behind the threaded client's synchronous method set.
+
+Requires the optional aiohttp package (pip install aiohttp).
+"""
+
+import asyncio
+import json
+import threading
+from typing import AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
+
+import aiohttp
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from github_client import (DEFAULT_BASE_URL, DEFAULT_MAX_RETRIES, DEFAULT_TIMEOUT, MISSING_USER_CACHE_TTL,
+                           REPOS_PER_PAGE, USER_CACHE_TTL, WRITE_METHODS, GitHubAPIError,
+                           collaborator_result, last_page_number, skip_message, user_message)
+from job_journal import JobJournal
+from rate_limit import RESOURCE_CORE, RateLimitExceeded, RateLimitGovernor
+from repo_records import RepositoryList
+from request_metrics import RequestEvent
+from response_cache import ResponseCache, TTLCache
+
+
+DEFAULT_MAX_CONNECTIONS = 100
+# In-flight requests; GitHub's secondary limits allow about 100 concurrent requests
+DEFAULT_MAX_CONCURRENCY = 100
+NETWORK_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+
+
+class AsyncGitHubAPIClient:
+    """
+    Coroutine-based client with the threaded client's core method set
+
+    Create and use it inside one event loop; `async with` closes the pool.
+    """
+
+    def __init__(self, base_url: str = DEFAULT_BASE_URL, max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY, timeout: float = DEFAULT_TIMEOUT,
+                 governor: Optional[RateLimitGovernor] = None, max_retries: int = DEFAULT_MAX_RETRIES,
+                 response_cache: Optional[ResponseCache] = None, user_cache: Optional[TTLCache] = None):
+        """
+        Args:
+            base_url: API root, overridable for GitHub Enterprise or a local mock server
+            max_connections: Maximum number of pooled connections to the API host
+            max_concurrency: Maximum number of requests in flight at once
+            timeout: Per-request timeout in seconds
+            governor: Rate-limit governor shared by every request (a default one is created)
+            max_retries: Retries for a request that GitHub throttled
+            response_cache: ETag cache for repository and user lookups (a default one is created)
+            user_cache: TTL cache of username verification results (a default one is created)
+        """
+        self.base_url = base_url.rstrip("/")
+        self.token = None
+        self.headers = {}
+        self.authenticated_user = None
+        self.max_connections = max(1, max_connections)
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        self.governor = governor or RateLimitGovernor()
+        self.max_retries = max(0, max_retries)
+        self.response_cache = response_cache if response_cache is not None else ResponseCache()
+        self.user_cache = user_cache if user_cache is not None else TTLCache()
+        self._before_request_hooks: List[Callable[[RequestEvent], None]] = []
+        self._after_request_hooks: List[Callable[[RequestEvent], None]] = []
+        self._session = None
+        self._semaphore = None
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        """Create the pool and the concurrency limit on first use, inside the running loop"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections, limit_per_host=self.max_connections)
+            self._session = aiohttp.ClientSession(connector=connector,
+                                                  timeout=aiohttp.ClientTimeout(total=self.timeout))
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def close(self):
+        """Close all pooled connections"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        self._ensure_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def add_request_hooks(self, before: Optional[Callable[[RequestEvent], None]] = None,
+                          after: Optional[Callable[[RequestEvent], None]] = None):
+        """Register callbacks around every HTTP attempt (see GitHubAPIClient.add_request_hooks)"""
+        if before is not None:
+            self._before_request_hooks.append(before)
+        if after is not None:
+            self._after_request_hooks.append(after)
+
+    async def _request(self, method: str, path: str, write: Optional[bool] = None, cache: bool = False,
+                       resource: str = RESOURCE_CORE, params: Optional[Dict] = None,
+                       json_body=None) -> requests.Response:
+        """
+        Send a request through the governor and the shared pool (see GitHubAPIClient._request)
+
+        Returns:
+            The response, as a requests.Response so the threaded client's parsing applies
+
+        Raises:
+            RateLimitExceeded: If GitHub keeps throttling or the wait would exceed the governor's max_wait
+            aiohttp.ClientError, asyncio.TimeoutError: On network errors
+        """
+        url = path if path.startswith(("http://", "https://")) else f"{self.base_url}{path}"
+        if write is None:
+            write = method.upper() in WRITE_METHODS
+        headers = dict(self.headers)
+        body = None
+        if json_body is not None:
+            body = json.dumps(json_body).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+        if params:
+            params = {key: str(value) for key, value in params.items()}
+
+        if not (cache and self.response_cache is not None and method.upper() == "GET"):
+            return await self._send(method, url, write, resource, headers, params, body)
+
+        key = self.response_cache.make_key(self.token, url, params)
+        cached = self.response_cache.get(key)
+        if cached is not None:
+            headers.update(cached.conditional_headers())
+
+        response = await self._send(method, url, write, resource, headers, params, body)
+        if response.status_code == 304 and cached is not None:
+            self.response_cache.record(hit=True)
+            return cached.to_response(response.url)
+        if response.status_code == 200:
+            self.response_cache.record(hit=False)
+            self.response_cache.store(key, response)
+        return response
+
+    async def _send(self, method: str, url: str, write: bool, resource: str, headers: Dict,
+                    params: Optional[Dict], body: Optional[bytes]) -> requests.Response:
+        """Send one request, retrying while the governor reports throttling"""
+        session = self._ensure_session()
+        attempt = 0
+        while True:
+            async with self._semaphore:
+                # Admitted by the governor only once a slot is free, so its write-pacing
+                # timestamps match when requests actually leave
+                await self.governor.before_request_async(write, resource)
+                event = None
+                if self._before_request_hooks or self._after_request_hooks:
+                    event = RequestEvent(method, url, resource, write, attempt)
+                    for hook in self._before_request_hooks:
+                        hook(event)
+                try:
+                    async with session.request(method, url, headers=headers, params=params, data=body) as raw:
+                        content = await raw.read()
+                        response = _to_response(raw, content, method, body)
+                except NETWORK_ERRORS as e:
+                    if event is not None:
+                        event.complete(error=e)
+                        for hook in self._after_request_hooks:
+                            hook(event)
+                    raise
+            throttle = self.governor.observe(response, resource)
+            if event is not None:
+                event.complete(response, throttle)
+                for hook in self._after_request_hooks:
+                    hook(event)
+            if throttle is None:
+                return response
+
+            delay, reason = throttle
+            if attempt >= self.max_retries or delay > self.governor.max_wait:
+                raise RateLimitExceeded(reason, delay)
+            self.governor.pause(delay, reason)
+            attempt += 1
+
+    async def authenticate(self, token: str) -> Tuple[bool, str]:
+        """
+        Authenticate with GitHub using Personal Access Token
+
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        self.token = token
+        self.headers = {
+            "Authorization": f"token {token}",
+            "Accept": "application/vnd.github.v3+json",
+            "User-Agent": "GitHub-Collaborator-Manager"
+        }
+
+        try:
+            response = await self._request("GET", "/user")
+            if response.status_code == 200:
+                self.authenticated_user = response.json()
+                return True, f"Successfully authenticated as {self.authenticated_user['login']}"
+            elif response.status_code == 401:
+                return False, "Invalid Personal Access Token"
+            else:
+                return False, f"Authentication failed: {response.status_code}"
+        except RateLimitExceeded as e:
+            return False, str(e)
+        except NETWORK_ERRORS as e:
+            return False, f"Network error during authentication: {str(e)}"
+
+    async def get_user_repositories(self) -> Tuple[bool, RepositoryList, str]:
+        """
+        Get all repositories for the authenticated user
+
+        Returns:
+            Tuple of (success: bool, repositories: RepositoryList, message: str)
+        """
+        if not self.token:
+            return False, RepositoryList(), "Not authenticated"
+
+        try:
+            repositories = RepositoryList()
+            async for page in self.iter_user_repositories():
+                repositories.extend(page)
+            return True, repositories, f"Found {len(repositories)} repositories"
+        except (GitHubAPIError, RateLimitExceeded) as e:
+            return False, RepositoryList(), str(e)
+        except NETWORK_ERRORS as e:
+            return False, RepositoryList(), f"Network error while fetching repositories: {str(e)}"
+
+    async def iter_user_repositories(self) -> AsyncIterator[RepositoryList]:
+        """
+        Yield the authenticated user's repositories one page at a time
+
+        Once page 1 names the last page, every other page is requested at once
+        (the semaphore bounds how many are in flight); pages are yielded in
+        sort=updated order.
+
+        Raises:
+            GitHubAPIError: If not authenticated or a page request fails
+        """
+        if not self.token:
+            raise GitHubAPIError("Not authenticated")
+
+        seen = set()
+        async for page_repos in self._iter_repository_pages():
+            page = RepositoryList()
+            for repo in page_repos:
+                # A repo updated mid-listing can shift onto two pages
+                if repo["full_name"] not in seen:
+                    seen.add(repo["full_name"])
+                    page.append(repo)
+            yield page
+
+    async def _iter_repository_pages(self) -> AsyncIterator[List[Dict]]:
+        page_repos, response = await self._get_repository_page(1)
+        yield page_repos
+
+        last_page = last_page_number(response)
+        if last_page is None:
+            # No Link header: walk pages until GitHub returns a short one
+            page = 1
+            while len(page_repos) == REPOS_PER_PAGE:
+                page += 1
+                page_repos, _ = await self._get_repository_page(page)
+                yield page_repos
+            return
+
+        tasks = [asyncio.ensure_future(self._get_repository_page(page)) for page in range(2, last_page + 1)]
+        try:
+            for task in tasks:
+                yield (await task)[0]
+        finally:
+            # Stop outstanding fetches if the consumer stops early or a page failed
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _get_repository_page(self, page: int) -> Tuple[List[Dict], requests.Response]:
+        response = await self._request(
+            "GET",
+            "/user/repos",
+            params={"page": page, "per_page": REPOS_PER_PAGE, "sort": "updated", "type": "owner"},
+            cache=True
+        )
+        if response.status_code != 200:
+            raise GitHubAPIError(f"Failed to fetch repositories: {response.status_code}")
+        return response.json(), response
+
+    async def verify_username(self, username: str) -> Tuple[bool, str]:
+        """
+        Verify if a GitHub username exists
+
+        Returns:
+            Tuple of (exists: bool, message: str)
+        """
+        if not username or not username.strip():
+            return False, "Username cannot be empty"
+
+        _, exists, message = (await self.verify_usernames([username]))[0]
+        return exists, message
+
+    async def verify_usernames(self, usernames: List[str]) -> List[Tuple[str, bool, str]]:
+        """
+        Verify many GitHub usernames at once, every cache miss in flight together
+
+        Returns:
+            List of tuples (username, exists, message), one per distinct name in input order
+        """
+        unique = {}
+        for username in usernames:
+            username = (username or "").strip()
+            if username and username.lower() not in unique:
+                unique[username.lower()] = username
+
+        results = {}
+        misses = []
+        for key, username in unique.items():
+            cached = self.user_cache.get(key)
+            if cached is None:
+                misses.append(username)
+            else:
+                exists, name = cached
+                results[key] = (exists, user_message(username, exists, name))
+
+        fetched = await self._run_bounded(misses, self._lookup_user)
+        for username, (exists, name, message) in zip(misses, fetched):
+            if exists is not None:
+                ttl = USER_CACHE_TTL if exists else MISSING_USER_CACHE_TTL
+                self.user_cache.set(username.lower(), (exists, name), ttl)
+                message = user_message(username, exists, name)
+            results[username.lower()] = (bool(exists), message)
+
+        return [(username, *results[key]) for key, username in unique.items()]
+
+    async def _lookup_user(self, username: str) -> Tuple[Optional[bool], Optional[str], str]:
+        """Look up one user; exists is None when the lookup failed"""
+        try:
+            response = await self._request("GET", f"/users/{username}", cache=True)
+            if response.status_code == 200:
+                return True, response.json().get("name") or username, ""
+            elif response.status_code == 404:
+                return False, None, ""
+            else:
+                return None, None, f"Error verifying username: {response.status_code}"
+        except RateLimitExceeded as e:
+            return None, None, str(e)
+        except NETWORK_ERRORS as e:
+            return None, None, f"Network error while verifying username: {str(e)}"
+
+    async def add_collaborator(self, repo_full_name: str, username: str) -> Tuple[bool, str]:
+        """
+        Add a user as collaborator to a repository
+
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        if not self.token:
+            return False, "Not authenticated"
+
+        try:
+            response = await self._request("PUT", f"/repos/{repo_full_name}/collaborators/{username}",
+                                           json_body={"permission": "push"})
+            return collaborator_result(response.status_code, repo_full_name, username)
+        except RateLimitExceeded as e:
+            return False, str(e)
+        except NETWORK_ERRORS as e:
+            return False, f"Network error while adding collaborator: {str(e)}"
+
+    async def add_collaborators_bulk(self, repositories: List[str], username: str,
+                                     on_result: Optional[Callable[[Tuple[str, bool, str]], None]] = None,
+                                     journal: Optional[JobJournal] = None,
+                                     existing_access: Optional[Dict[str, Optional[Set[str]]]] = None
+                                     ) -> List[Tuple[str, bool, str]]:
+        """
+        Add a user as collaborator to multiple repositories, up to max_concurrency at once
+
+        Repositories are fed to max_concurrency worker coroutines, so the number of
+        tasks does not grow with the input. Writes are still paced by the governor
+        (80 per minute and 500 per hour by default).
+
+        Args:
+            repositories: List of repository full names
+            username: Username to add as collaborator
+            on_result: Called with each (repo_name, success, message) as soon as it completes
+            journal, existing_access: Skip pairs already done, as in GitHubAPIClient.add_collaborators_bulk
+
+        Returns:
+            List of tuples (repo_name, success, message), in the order of repositories
+        """
+        async def add(repo):
+            message = skip_message(repo, username, journal, existing_access)
+            if message is not None:
+                result = (repo, True, message)
+            else:
+                result = (repo, *await self.add_collaborator(repo, username))
+                if journal is not None:
+                    journal.record(repo, username, result[1], result[2])
+            if on_result:
+                on_result(result)
+            return result
+
+        return await self._run_bounded(repositories, add)
+
+    async def _run_bounded(self, items: List, work: Callable) -> List:
+        """Await work(item) for every item on at most max_concurrency coroutines; results in input order"""
+        results = [None] * len(items)
+        positions = iter(range(len(items)))
+
+        async def worker():
+            # Workers share one iterator, so each position is taken exactly once
+            for position in positions:
+                results[position] = await work(items[position])
+
+        await asyncio.gather(*(worker() for _ in range(min(self.max_concurrency, len(items)))))
+        return results
+
+
+def _to_response(raw: aiohttp.ClientResponse, content: bytes, method: str, body: Optional[bytes]
+                 ) -> requests.Response:
+    """Copy an aiohttp response into a requests.Response"""
+    response = requests.Response()
+    response.status_code = raw.status
+    response._content = content
+    response.headers = CaseInsensitiveDict(raw.headers)
+    response.url = str(raw.url)
+    response.encoding = "utf-8"  # GitHub always answers in UTF-8
+    response.reason = raw.reason
+    request = requests.PreparedRequest()
+    request.method, request.url, request.body = method, response.url, body
+    response.request = request
+    return response
+
+
+class BlockingGitHubClient:
+    """
+    Synchronous facade over AsyncGitHubAPIClient for threaded callers such as the Tk app
+
+    Owns an event loop on a daemon thread; every method blocks the calling
+    thread (never the loop) until its coroutine finishes. Callbacks such as
+    on_result run on the loop thread.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Arguments are passed to AsyncGitHubAPIClient"""
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        self.client = self._call(self._create(*args, **kwargs))
+
+    @staticmethod
+    async def _create(*args, **kwargs) -> AsyncGitHubAPIClient:
+        return AsyncGitHubAPIClient(*args, **kwargs)
+
+    def _call(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def authenticate(self, token: str) -> Tuple[bool, str]:
+        return self._call(self.client.authenticate(token))
+
+    def get_user_repositories(self) -> Tuple[bool, RepositoryList, str]:
+        return self._call(self.client.get_user_repositories())
+
+    def verify_username(self, username: str) -> Tuple[bool, str]:
+        return self._call(self.client.verify_username(username))
+
+    def verify_usernames(self, usernames: List[str]) -> List[Tuple[str, bool, str]]:
+        return self._call(self.client.verify_usernames(usernames))
+
+    def add_collaborator(self, repo_full_name: str, username: str) -> Tuple[bool, str]:
+        return self._call(self.client.add_collaborator(repo_full_name, username))
+
+    def add_collaborators_bulk(self, repositories: List[str], username: str, **kwargs) -> List[Tuple[str, bool, str]]:
+        return self._call(self.client.add_collaborators_bulk(repositories, username, **kwargs))
+
+    def close(self):
+        """Close the pool and stop the event loop"""
+        if self._loop.is_closed():
+            return
+        self._call(self.client.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
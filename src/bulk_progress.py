@@ -0,0 +1,91 @@
+"""
+Progress of bulk operations
+Counts finished items and estimates throughput and time remaining from the
+completions in a recent window, so a stall shows up as a falling rate.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict
+
+
+DEFAULT_RATE_WINDOW = 10.0  # Seconds of completions used for the throughput estimate
+
+
+def format_duration(seconds: float) -> str:
+    """Format a duration as e.g. "45s", "5m 03s" or "2h 10m" """
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m {seconds:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes:02d}m"
+
+
+class BulkProgress:
+    """
+    Thread-safe completion counter for a bulk run
+
+    Workers call record() as each item finishes; the GUI polls snapshot().
+    """
+
+    def __init__(self, total: int, rate_window: float = DEFAULT_RATE_WINDOW,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            total: Number of items in the run
+            rate_window: Seconds of recent completions used for the rate
+            clock: Time source, replaceable in tests
+        """
+        self.total = total
+        self.rate_window = rate_window
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._started = clock()
+        self._recent = deque()  # Completion times within the rate window
+        self.succeeded = 0
+        self.failed = 0
+
+    @property
+    def done(self) -> int:
+        return self.succeeded + self.failed
+
+    def record(self, success: bool):
+        """Count one finished item"""
+        with self._lock:
+            if success:
+                self.succeeded += 1
+            else:
+                self.failed += 1
+            self._recent.append(self._clock())
+
+    def snapshot(self) -> Dict:
+        """
+        Current counts and estimates
+
+        Returns:
+            Dictionary with done, total, succeeded, failed, elapsed (seconds),
+            rate (items per second over the recent window) and eta (seconds,
+            or None while nothing is completing)
+        """
+        with self._lock:
+            now = self._clock()
+            while self._recent and self._recent[0] <= now - self.rate_window:
+                self._recent.popleft()
+            elapsed = now - self._started
+            span = min(self.rate_window, elapsed)
+            rate = len(self._recent) / span if span > 0 else 0.0
+            done = self.succeeded + self.failed
+            remaining = self.total - done
+            return {
+                "done": done,
+                "total": self.total,
+                "succeeded": self.succeeded,
+                "failed": self.failed,
+                "elapsed": elapsed,
+                "rate": rate,
+                "eta": remaining / rate if rate > 0 else (0.0 if remaining <= 0 else None),
+            }
@@ -0,0 +1,265 @@
+"""
+Headless command-line interface for GitHub Collaborator Manager
+Lists repositories, verifies usernames and adds collaborators without a
+display. Input is read lazily and every result is written as one JSON line
+as soon as it is known, so memory use stays flat for very large inputs.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from itertools import islice
+from typing import IO, Iterator, List, Optional, Tuple
+
+import requests
+
+from adaptive_concurrency import AdaptiveConcurrency
+from github_client import DEFAULT_BASE_URL, DEFAULT_MAX_WORKERS, GitHubAPIClient, GitHubAPIError
+from graphql_transport import GraphQLError
+from rate_limit import DEFAULT_WRITES_PER_HOUR, DEFAULT_WRITES_PER_MINUTE, RateLimitExceeded, RateLimitGovernor
+from request_metrics import RequestMetrics
+
+
+TOKEN_ENV_VARS = ("GITHUB_TOKEN", "GH_TOKEN")
+TOKENS_ENV_VAR = "GITHUB_TOKENS"  # Several tokens, separated by commas or whitespace, pooled for more rate limit
+VERIFY_BATCH = 100  # Usernames verified per verify_usernames call
+FORMAT_CSV = "csv"
+FORMAT_JSONL = "jsonl"
+
+EXIT_OK = 0
+EXIT_FAILURES = 1  # Some items failed
+EXIT_ERROR = 2  # Nothing could be done (bad arguments, authentication)
+
+
+def read_pairs(stream: IO[str], fmt: str) -> Iterator[Tuple[int, Optional[Tuple[str, str]], Optional[str]]]:
+    """
+    Parse (username, repository) pairs from CSV or JSONL, one line at a time
+
+    CSV rows are "user,repo", with an optional header row; JSONL objects
+    carry "user" and "repo" keys.
+
+    Yields:
+        (line number, (repository, username) or None, error message or None)
+    """
+    if fmt == FORMAT_CSV:
+        rows = csv.reader(stream)
+        for number, row in enumerate(rows, 1):
+            row = [field.strip() for field in row]
+            if not any(row):
+                continue
+            if number == 1 and [field.lower() for field in row[:2]] == ["user", "repo"]:
+                continue
+            if len(row) < 2 or not row[0] or not row[1]:
+                yield number, None, "expected user,repo"
+            else:
+                yield number, (row[1], row[0]), None
+        return
+
+    for number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+            yield number, (str(entry["repo"]).strip(), str(entry["user"]).strip()), None
+        except (ValueError, KeyError, TypeError):
+            yield number, None, 'expected {"user": ..., "repo": ...}'
+
+
+def _write(out: IO[str], record: dict):
+    out.write(json.dumps(record) + "\n")
+    out.flush()
+
+
+def _open_input(path: str) -> IO[str]:
+    return sys.stdin if path == "-" else open(path, newline="", encoding="utf-8")
+
+
+def _input_format(path: str, fmt: Optional[str]) -> str:
+    if fmt:
+        return fmt
+    return FORMAT_JSONL if path.lower().endswith((".jsonl", ".ndjson")) else FORMAT_CSV
+
+
+def command_repos(client: GitHubAPIClient, args, out: IO[str]) -> int:
+    """Write one JSON line per repository as each page arrives"""
+    for page in client.iter_user_repositories():
+        for repo in page:
+            _write(out, repo.to_dict())
+    return EXIT_OK
+
+
+def command_verify(client: GitHubAPIClient, args, out: IO[str]) -> int:
+    """Verify usernames given as arguments, or one per line from a file or stdin ("-")"""
+    if args.usernames == ["-"] or args.input:
+        source = _open_input(args.input or "-")
+        names = (line.strip() for line in source if line.strip())
+    else:
+        source = None
+        names = iter(args.usernames)
+
+    status = EXIT_OK
+    try:
+        while True:
+            batch = list(islice(names, VERIFY_BATCH))
+            if not batch:
+                break
+            for username, exists, message in client.verify_usernames(batch):
+                _write(out, {"user": username, "exists": exists, "message": message})
+                if not exists:
+                    status = EXIT_FAILURES
+    finally:
+        if source is not None and source is not sys.stdin:
+            source.close()
+    return status
+
+
+def command_add(client: GitHubAPIClient, args, out: IO[str]) -> int:
+    """Add collaborators for every (user, repo) pair of the input, writing results as they complete"""
+    status = EXIT_OK
+    source = _open_input(args.input)
+
+    def pairs():
+        nonlocal status
+        for number, pair, error in read_pairs(source, _input_format(args.input, args.format)):
+            if error:
+                _write(out, {"line": number, "success": False, "message": error})
+                status = EXIT_FAILURES
+            else:
+                yield pair
+
+    try:
+        for repo, username, success, message in client.iter_add_pairs(pairs(), max_workers=args.workers):
+            _write(out, {"user": username, "repo": repo, "success": success, "message": message})
+            if not success:
+                status = EXIT_FAILURES
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    return status
+
+
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value!r}")
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    """argparse type for limits where 0 means no limit"""
+    try:
+        number = int(value)
+    except ValueError:
+        number = -1
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be a non-negative integer: {value!r}")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="Manage GitHub collaborators without the GUI. The token is read from "
+                    "the GITHUB_TOKEN (or GH_TOKEN) environment variable, or several tokens from "
+                    "GITHUB_TOKENS; results are JSON lines.")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL, help="API root (GitHub Enterprise)")
+    parser.add_argument("--workers", type=positive_int, default=DEFAULT_MAX_WORKERS, help="Maximum in-flight requests")
+    parser.add_argument("--writes-per-minute", type=non_negative_int, default=DEFAULT_WRITES_PER_MINUTE,
+                        help="Pace writes to at most this many per minute (0: no limit)")
+    parser.add_argument("--writes-per-hour", type=non_negative_int, default=DEFAULT_WRITES_PER_HOUR,
+                        help="Pace writes to at most this many per hour (0: no limit)")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="Vary in-flight writes between 1 and --workers as GitHub responds (AIMD)")
+    parser.add_argument("--concurrency-log", metavar="FILE",
+                        help="With --adaptive, write every change of the write limit as CSV on exit")
+    parser.add_argument("--metrics", metavar="FILE",
+                        help="Write request metrics on exit (JSON for .json, OpenMetrics text otherwise)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("repos", help="List the repositories you own")
+
+    verify = commands.add_parser("verify", help="Check that usernames exist")
+    verify.add_argument("usernames", nargs="*", help='Usernames, or "-" to read one per line from stdin')
+    verify.add_argument("--input", help="File with one username per line")
+
+    add = commands.add_parser("add", help="Add collaborators from a stream of (user, repo) pairs")
+    add.add_argument("input", help='CSV or JSONL file, or "-" for stdin')
+    add.add_argument("--format", choices=(FORMAT_CSV, FORMAT_JSONL),
+                     help="Input format (default: from the file extension, CSV for stdin)")
+    return parser
+
+
+COMMANDS = {"repos": command_repos, "verify": command_verify, "add": command_add}
+
+
+def _run(client: GitHubAPIClient, tokens: List[str], args, out: IO[str], err: IO[str]) -> int:
+    success, message = client.authenticate_tokens(tokens)
+    if not success:
+        err.write(message + "\n")
+        return EXIT_ERROR
+    try:
+        return COMMANDS[args.command](client, args, out)
+    except (GitHubAPIError, GraphQLError, RateLimitExceeded) as e:
+        err.write(str(e) + "\n")
+    except requests.exceptions.RequestException as e:
+        err.write(f"Network error: {str(e)}\n")
+    except OSError as e:
+        # After RequestException, which is also an OSError
+        err.write(f"Cannot read input: {str(e)}\n")
+    return EXIT_ERROR
+
+
+def main(argv: Optional[List[str]] = None, out: IO[str] = None, err: IO[str] = None) -> int:
+    """
+    Run one CLI command
+
+    Args:
+        argv: Arguments without the program name (defaults to sys.argv[1:])
+        out: Stream receiving the JSON lines (defaults to stdout)
+        err: Stream receiving error messages (defaults to stderr)
+
+    Returns:
+        Process exit code
+    """
+    out = out or sys.stdout
+    err = err or sys.stderr
+    args = build_parser().parse_args(argv)
+
+    tokens = os.environ.get(TOKENS_ENV_VAR, "").replace(",", " ").split()
+    if not tokens:
+        tokens = [os.environ[name] for name in TOKEN_ENV_VARS if os.environ.get(name)][:1]
+    if not tokens:
+        err.write("Set GITHUB_TOKEN to a Personal Access Token (or GITHUB_TOKENS to several)\n")
+        return EXIT_ERROR
+    if args.command == "verify" and not (args.usernames or args.input):
+        err.write("Give usernames, --input FILE, or - for stdin\n")
+        return EXIT_ERROR
+
+    governor = RateLimitGovernor(writes_per_minute=args.writes_per_minute, writes_per_hour=args.writes_per_hour)
+    with GitHubAPIClient(args.base_url, max_workers=args.workers, prewarm_connections=0,
+                         governor=governor) as client:
+        metrics = RequestMetrics().attach(client) if args.metrics else None
+        concurrency = AdaptiveConcurrency(maximum=args.workers).attach(client) if args.adaptive else None
+        try:
+            return _run(client, tokens, args, out, err)
+        finally:
+            if metrics is not None:
+                try:
+                    metrics.write(args.metrics)
+                except OSError as e:
+                    err.write(f"Cannot write metrics: {str(e)}\n")
+            if concurrency is not None and args.concurrency_log:
+                try:
+                    concurrency.write_history(args.concurrency_log)
+                except OSError as e:
+                    err.write(f"Cannot write concurrency log: {str(e)}\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,19 +3,410 @@ GitHub API Client for Collaborator Manager
 Handles all GitHub API interactions including authentication, repository management, and collaborator operations.
 """
 
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import nullcontext
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlsplit
+
 import requests
-import json
-from typing import List, Dict, Optional, Tuple
+from requests.adapters import HTTPAdapter
+
+from rate_limit import RESOURCE_CORE, RESOURCE_GRAPHQL, RateLimitGovernor, RateLimitExceeded
+from response_cache import ResponseCache, TTLCache
+from graphql_transport import GraphQLTransport, GraphQLError
+from repo_records import RepositoryList
+from repo_index import RepositoryIndex
+from job_journal import JobJournal
+from request_metrics import RequestEvent
+from token_pool import PooledToken, TokenPool, auth_headers
+from adaptive_concurrency import AdaptiveConcurrency
+from matrix_scheduler import MatrixResults, MatrixScheduler, interleave, unique_usernames
+
+
+DEFAULT_BASE_URL = "https://api.github.com"
+DEFAULT_TIMEOUT = 10
+DEFAULT_POOL_SIZE = 10
+DEFAULT_PREWARM_CONNECTIONS = 4
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_RETRIES = 3
+WRITE_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+REPOS_PER_PAGE = 100
+COLLABORATORS_PER_PAGE = 100
+# Invitation permissions at least as strong as the push access add_collaborator grants
+WRITE_INVITATION_PERMISSIONS = ("write", "maintain", "admin")
+FULL_SYNC_INTERVAL = 24 * 3600.0
+USER_CACHE_TTL = 3600.0
+# More cache misses than this are verified with batched GraphQL queries even on the REST backend
+GRAPHQL_USER_THRESHOLD = 50
+MISSING_USER_CACHE_TTL = 300.0
+BACKEND_REST = "rest"
+BACKEND_GRAPHQL = "graphql"
+
+
+class GitHubAPIError(Exception):
+    """Raised by internal helpers when GitHub answers with an unexpected status"""
+
+
+def user_message(username: str, exists: bool, name: Optional[str]) -> str:
+    """Format the result message for a username check"""
+    if exists:
+        return f"User '{username}' found: {name or username}"
+    return f"User '{username}' not found"
+
+
+def collaborator_result(status: int, repo_full_name: str, username: str) -> Tuple[bool, str]:
+    """Interpret the status of a collaborator PUT as (success, message)"""
+    if status == 201:
+        return True, f"Successfully added {username} as collaborator to {repo_full_name}"
+    elif status == 204:
+        return True, f"{username} is already a collaborator on {repo_full_name}"
+    elif status == 403:
+        return False, f"Permission denied: Cannot add collaborators to {repo_full_name}"
+    elif status == 404:
+        return False, f"Repository {repo_full_name} not found or user {username} not found"
+    elif status == 422:
+        return False, f"Cannot add {username} as collaborator (may be repository owner)"
+    else:
+        return False, f"Failed to add collaborator: {status}"
+
+
+def last_page_number(response: requests.Response) -> Optional[int]:
+    """Read the page number of rel="last" from a response's Link header"""
+    last = response.links.get("last")
+    if not last:
+        return None
+    try:
+        return int(parse_qs(urlsplit(last["url"]).query)["page"][0])
+    except (KeyError, IndexError, ValueError):
+        return None
+
+
+def skip_message(repo: str, username: str, journal: Optional[JobJournal],
+                 existing_access: Optional[Dict[str, Optional[Set[str]]]]) -> Optional[str]:
+    """Result message for a pair that needs no request (recorded in the journal), or None"""
+    if journal is not None and journal.is_completed(repo, username):
+        return f"{username} was already added to {repo} (resumed from journal)"
+    if existing_access and username.lower() in (existing_access.get(repo) or ()):
+        message = f"{username} already has access to {repo} (no request sent)"
+        if journal is not None:
+            journal.record(repo, username, True, message)
+        return message
+    return None
 
 
 class GitHubAPIClient:
     """Client for interacting with GitHub API v4 (REST)"""
     
-    def __init__(self):
-        self.base_url = "https://api.github.com"
+    def __init__(self, base_url: str = DEFAULT_BASE_URL, pool_size: int = DEFAULT_POOL_SIZE,
+                 keep_alive: bool = True, prewarm_connections: int = DEFAULT_PREWARM_CONNECTIONS,
+                 timeout: float = DEFAULT_TIMEOUT, max_workers: int = DEFAULT_MAX_WORKERS,
+                 governor: Optional[RateLimitGovernor] = None, max_retries: int = DEFAULT_MAX_RETRIES,
+                 response_cache: Optional[ResponseCache] = None, backend: str = BACKEND_REST,
+                 user_cache: Optional[TTLCache] = None):
+        """
+        Args:
+            base_url: API root, overridable for GitHub Enterprise or a local mock server
+            pool_size: Maximum number of pooled keep-alive connections to the API host
+            keep_alive: Reuse connections between calls; False forces a new connection per request
+            prewarm_connections: Connections to open in the background after a successful authentication
+            timeout: Per-request timeout in seconds
+            max_workers: Default number of in-flight requests for bulk operations
+            governor: Rate-limit governor shared by every request (a default one is created)
+            max_retries: Retries for a request that GitHub throttled
+            response_cache: ETag cache for repository and user lookups (a default one is created)
+            backend: "rest", or "graphql" to fetch repositories and verify users with batched queries
+            user_cache: TTL cache of username verification results (a default one is created)
+        """
+        if backend not in (BACKEND_REST, BACKEND_GRAPHQL):
+            raise ValueError(f"Unknown backend: {backend}")
+
+        self.base_url = base_url.rstrip("/")
         self.token = None
         self.headers = {}
         self.authenticated_user = None
+        self.token_pool: Optional[TokenPool] = None  # Set by authenticate_tokens with several tokens
+        self.concurrency: Optional[AdaptiveConcurrency] = None  # Set by AdaptiveConcurrency.attach
+        self.timeout = timeout
+        self.pool_size = max(1, pool_size)
+        self.keep_alive = keep_alive
+        self.prewarm_connections = min(max(0, prewarm_connections), self.pool_size)
+        self.max_workers = max(1, max_workers)
+        self.governor = governor or RateLimitGovernor()
+        self.max_retries = max(0, max_retries)
+        self.response_cache = response_cache if response_cache is not None else ResponseCache()
+        self.backend = backend
+        self.graphql = GraphQLTransport(self)
+        self.user_cache = user_cache if user_cache is not None else TTLCache()
+        self._before_request_hooks: List[Callable[[RequestEvent], None]] = []
+        self._after_request_hooks: List[Callable[[RequestEvent], None]] = []
+        self.session = self._create_session()
+    
+    def _create_session(self) -> requests.Session:
+        """Create the shared HTTP session backing every API call"""
+        session = requests.Session()
+        # Retries are decided per status code by the caller, not by urllib3
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=0)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+    
+    def _request(self, method: str, path: str, write: Optional[bool] = None, cache: bool = False,
+                 resource: str = RESOURCE_CORE, repository: Optional[str] = None, **kwargs) -> requests.Response:
+        """
+        Send a request through the rate-limit governor and the shared session
+        
+        Throttled responses (secondary limits, Retry-After, exhausted budget) pause
+        all callers and are retried up to max_retries times.
+        
+        Args:
+            method: HTTP method
+            path: API path relative to base_url, or an absolute URL (e.g. from a Link header)
+            write: Whether the governor should pace this as a write (defaults from the method)
+            cache: Revalidate a cached copy with If-None-Match / If-Modified-Since (GET only);
+                a 304 is returned as the cached 200 response
+            resource: Rate-limit resource whose primary budget the request spends
+            repository: Repository a write goes to; with a token pool, the write is sent
+                with a token that has admin on it
+            **kwargs: Extra arguments passed to requests.Session.request
+            
+        Returns:
+            The HTTP response
+            
+        Raises:
+            RateLimitExceeded: If GitHub keeps throttling or the wait would exceed the governor's max_wait
+            requests.exceptions.RequestException: On network errors
+        """
+        url = path if path.startswith(("http://", "https://")) else f"{self.base_url}{path}"
+        if write is None:
+            write = method.upper() in WRITE_METHODS
+        kwargs.setdefault("headers", self.headers)
+        kwargs.setdefault("timeout", self.timeout)
+        
+        if not (cache and self.response_cache is not None and method.upper() == "GET"):
+            return self._send(method, url, write, resource, repository, **kwargs)
+        
+        key = self.response_cache.make_key(self.token, url, kwargs.get("params"))
+        cached = self.response_cache.get(key)
+        if cached is not None:
+            kwargs["headers"] = {**kwargs["headers"], **cached.conditional_headers()}
+        
+        response = self._send(method, url, write, resource, repository, **kwargs)
+        if response.status_code == 304 and cached is not None:
+            self.response_cache.record(hit=True)
+            return cached.to_response(response.url)
+        if response.status_code == 200:
+            self.response_cache.record(hit=False)
+            self.response_cache.store(key, response)
+        return response
+    
+    def _send(self, method: str, url: str, write: bool, resource: str = RESOURCE_CORE,
+              repository: Optional[str] = None, pooled: Optional[PooledToken] = None,
+              **kwargs) -> requests.Response:
+        """
+        Send one request, retrying while the governor reports throttling
+        
+        With a token pool, the request goes out with the token _pooled_token picks
+        (or `pooled`, which is then never swapped). A 401 revokes the token and the
+        request moves to another one; a throttled token is paused and the request
+        moves to whichever token can send soonest, whose own governor then paces it,
+        so an exhausted token fails over instead of raising RateLimitExceeded.
+        """
+        fixed = pooled is not None
+        if not fixed:
+            pooled = self._pooled_token(url, write, resource, repository)
+        attempt = 0
+        while True:
+            governor = self.governor if pooled is None else pooled.governor
+            if pooled is not None:
+                kwargs["headers"] = {**kwargs["headers"], **pooled.headers}
+            governor.before_request(write, resource)
+            event = None
+            if self._before_request_hooks or self._after_request_hooks:
+                event = RequestEvent(method, url, resource, write, attempt)
+                for hook in self._before_request_hooks:
+                    hook(event)
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.exceptions.RequestException as e:
+                if event is not None:
+                    event.complete(error=e)
+                    for hook in self._after_request_hooks:
+                        hook(event)
+                raise
+            throttle = governor.observe(response, resource)
+            if event is not None:
+                event.complete(response, throttle)
+                for hook in self._after_request_hooks:
+                    hook(event)
+            
+            if pooled is not None and response.status_code == 401:
+                self._revoke_token(pooled)
+                replacement = None if fixed else self._pooled_token(url, write, resource, repository)
+                if replacement is None or replacement.revoked:
+                    return response
+                response.close()
+                pooled = replacement
+                continue
+            if throttle is None:
+                return response
+            
+            delay, reason = throttle
+            if not fixed and pooled is not None:
+                # Hold the throttled token back and retry with whichever token can send soonest;
+                # that token's own before_request paces the retry
+                governor.pause(delay, reason)
+                pooled = self._pooled_token(url, write, resource, repository)
+                delay = pooled.governor.required_wait(write, resource)
+                if attempt >= self.max_retries or delay > pooled.governor.max_wait:
+                    raise RateLimitExceeded(reason, delay)
+            else:
+                if attempt >= self.max_retries or delay > governor.max_wait:
+                    raise RateLimitExceeded(reason, delay)
+                governor.pause(delay, reason)
+            response.close()
+            attempt += 1
+    
+    def _pooled_token(self, url: str, write: bool, resource: str,
+                      repository: Optional[str]) -> Optional[PooledToken]:
+        """Token of the pool to send a request with, or None without a pool"""
+        pool = self.token_pool
+        if pool is None:
+            return None
+        path = url[len(self.base_url):] if url.startswith(self.base_url) else urlsplit(url).path
+        if resource == RESOURCE_GRAPHQL or path.split("?")[0] in ("/user", "/user/repos"):
+            # Answers depend on who asks: always the primary account
+            return pool.primary
+        if write and repository:
+            admins = self._admin_tokens(repository)
+            ranked = pool.rank(write, resource, candidates=admins) if admins else []
+            if ranked:
+                return ranked[0]
+        return pool.select(write, resource) or pool.primary
+    
+    def _admin_tokens(self, repository: str) -> List[PooledToken]:
+        """
+        Active tokens whose permissions on a repository include admin
+        
+        Every token is checked once per repository with GET /repos/{owner}/{repo}
+        and the answer is remembered, so writes (and their failover) can be spread
+        over all of them. With one active token nothing is checked. When no token
+        has admin the list is empty and GitHub's 403 is reported as with one token.
+        """
+        pool = self.token_pool
+        admins = pool.admins_for(repository)
+        if admins is not None:
+            return admins
+        active = pool.active()
+        if len(active) <= 1:
+            return active
+        admins = []
+        for candidate in active:
+            response = self._send("GET", f"{self.base_url}/repos/{repository}", False, pooled=candidate,
+                                  headers=self.headers, timeout=self.timeout)
+            if response.status_code == 200 and (response.json().get("permissions") or {}).get("admin"):
+                admins.append(candidate)
+        pool.set_admins(repository, admins)
+        return admins
+    
+    def _revoke_token(self, entry: PooledToken):
+        """Drop a rejected token; if it was the primary one, the next active token takes over"""
+        pool = self.token_pool
+        pool.revoke(entry)
+        primary = pool.primary
+        if not primary.revoked and primary.token != self.token:
+            self.token = primary.token
+            self.headers = primary.headers
+            self.governor = primary.governor
+            self.authenticated_user = primary.user
+    
+    def current_wait(self) -> Optional[Tuple[str, float]]:
+        """
+        The longest rate-limit wait a request is sleeping through right now
+        
+        Returns:
+            (reason, seconds left) across every active token, or None if nothing is held back
+        """
+        governors = [entry.governor for entry in self.token_pool.active()] if self.token_pool else [self.governor]
+        waits = [wait for wait in (governor.current_wait() for governor in governors) if wait]
+        return max(waits, key=lambda wait: wait[1]) if waits else None
+    
+    def add_request_hooks(self, before: Optional[Callable[[RequestEvent], None]] = None,
+                          after: Optional[Callable[[RequestEvent], None]] = None):
+        """
+        Register callbacks around every HTTP attempt, including throttled retries
+        
+        Hooks run on the thread sending the request, so they should be quick
+        and thread-safe. Without hooks no events are built.
+        
+        Args:
+            before: Called with the RequestEvent just before the request is sent
+            after: Called with the same event once the response (or a network error) arrived
+        """
+        if before is not None:
+            self._before_request_hooks.append(before)
+        if after is not None:
+            self._after_request_hooks.append(after)
+    
+    def warm_up(self, connections: Optional[int] = None) -> int:
+        """
+        Open pooled connections ahead of time so later calls skip the TCP/TLS handshake
+        
+        Uses the /rate_limit endpoint, which does not count against the rate limit.
+        
+        Args:
+            connections: Number of connections to open (defaults to prewarm_connections)
+            
+        Returns:
+            Number of warm-up requests that completed
+        """
+        count = self.prewarm_connections if connections is None else min(connections, self.pool_size)
+        if count <= 0 or not self.keep_alive:
+            return 0
+        
+        def ping(_):
+            try:
+                self._request("GET", "/rate_limit").close()
+                return True
+            except requests.exceptions.RequestException:
+                return False
+        
+        # Concurrent requests force the pool to hold distinct connections
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            return sum(executor.map(ping, range(count)))
+    
+    def rate_limit_stats(self) -> Dict:
+        """
+        Get rate-limit counters from the governor
+        
+        Returns:
+            Dictionary with remaining budget, throttle counts and wait time per reason
+        """
+        return self.governor.stats()
+    
+    def cache_stats(self) -> Dict:
+        """
+        Get conditional-request cache counters
+        
+        Returns:
+            Dictionary with hits (304s served from cache), misses, evictions and size
+        """
+        return self.response_cache.stats() if self.response_cache is not None else {}
+    
+    def close(self):
+        """Close all pooled connections"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def authenticate(self, token: str) -> Tuple[bool, str]:
         """
@@ -28,82 +419,302 @@ class GitHubAPIClient:
             Tuple of (success: bool, message: str)
         """
         self.token = token
-        self.headers = {
-            "Authorization": f"token {token}",
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "GitHub-Collaborator-Manager"
-        }
+        self.headers = auth_headers(token)
+        self.token_pool = None
         
         try:
-            response = requests.get(f"{self.base_url}/user", headers=self.headers, timeout=10)
+            response = self._request("GET", "/user")
             
             if response.status_code == 200:
                 self.authenticated_user = response.json()
+                if self.prewarm_connections > 1:
+                    threading.Thread(target=self.warm_up, daemon=True).start()
                 return True, f"Successfully authenticated as {self.authenticated_user['login']}"
             elif response.status_code == 401:
                 return False, "Invalid Personal Access Token"
             else:
                 return False, f"Authentication failed: {response.status_code}"
                 
+        except RateLimitExceeded as e:
+            return False, str(e)
         except requests.exceptions.RequestException as e:
             return False, f"Network error during authentication: {str(e)}"
     
-    def get_user_repositories(self) -> Tuple[bool, List[Dict], str]:
+    def authenticate_tokens(self, tokens: List[str]) -> Tuple[bool, str]:
+        """
+        Authenticate with several Personal Access Tokens and spread requests across them
+        
+        Every token is checked with GET /user and gets its own rate-limit governor.
+        The first valid one is the primary token: it identifies the account and
+        answers /user, /user/repos and GraphQL. Other reads go to the token that can
+        send soonest with the most budget left; writes go to the best-placed token
+        with admin on the repository; a token GitHub stops accepting is dropped,
+        and if it was the primary one the next valid token takes over. When only
+        one token is valid, no pool is kept.
+        
+        Args:
+            tokens: Personal Access Tokens; with one token this is authenticate()
+            
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        tokens = list(dict.fromkeys(token.strip() for token in tokens if token and token.strip()))
+        if len(tokens) <= 1:
+            return self.authenticate(tokens[0] if tokens else "")
+        
+        pool = TokenPool([PooledToken(token, self.governor if i == 0 else self.governor.clone())
+                          for i, token in enumerate(tokens)])
+        self.token_pool = pool
+        try:
+            for entry in pool.entries:
+                response = self._send("GET", f"{self.base_url}/user", False, pooled=entry,
+                                      headers=entry.headers, timeout=self.timeout)
+                if response.status_code == 200:
+                    entry.user = response.json()
+                elif response.status_code != 401:
+                    pool.revoke(entry)
+        except (RateLimitExceeded, requests.exceptions.RequestException) as e:
+            self.token_pool = None
+            if isinstance(e, RateLimitExceeded):
+                return False, str(e)
+            return False, f"Network error during authentication: {str(e)}"
+        
+        valid = pool.active()
+        if not valid:
+            self.token_pool = None
+            return False, "Invalid Personal Access Token"
+        
+        # A single valid token needs no pool (nor per-repository admin checks)
+        self.token_pool = TokenPool(valid) if len(valid) > 1 else None
+        primary = valid[0]
+        self.token = primary.token
+        self.headers = primary.headers
+        self.governor = primary.governor
+        self.authenticated_user = primary.user
+        if self.prewarm_connections > 1:
+            threading.Thread(target=self.warm_up, daemon=True).start()
+        
+        count = f"{len(valid)} token{'' if len(valid) == 1 else 's'}"
+        message = f"Successfully authenticated as {primary.login} with {count}"
+        if len(valid) < len(tokens):
+            message += f" ({len(tokens) - len(valid)} rejected)"
+        return True, message
+    
+    def token_stats(self) -> List[Dict]:
+        """
+        Get per-token counters of the token pool
+        
+        Returns:
+            List with one dictionary per token (see TokenPool.stats), empty without a pool
+        """
+        return self.token_pool.stats() if self.token_pool is not None else []
+    
+    def get_user_repositories(self, on_page: Optional[Callable[[RepositoryList], None]] = None
+                              ) -> Tuple[bool, RepositoryList, str]:
         """
         Get all repositories for the authenticated user
         
+        Args:
+            on_page: Called with each page of repositories as soon as it is parsed,
+                so callers can render rows before the listing completes
+        
         Returns:
-            Tuple of (success: bool, repositories: List[Dict], message: str)
+            Tuple of (success: bool, repositories: RepositoryList, message: str);
+            each repository supports dict-style access (repo["full_name"])
         """
         if not self.token:
-            return False, [], "Not authenticated"
-        
-        repositories = []
-        page = 1
-        per_page = 100
+            return False, RepositoryList(), "Not authenticated"
         
         try:
-            while True:
-                response = requests.get(
-                    f"{self.base_url}/user/repos",
-                    headers=self.headers,
-                    params={
-                        "page": page,
-                        "per_page": per_page,
-                        "sort": "updated",
-                        "type": "owner"  # Only repos owned by the user
-                    },
-                    timeout=10
-                )
-                
-                if response.status_code != 200:
-                    return False, [], f"Failed to fetch repositories: {response.status_code}"
-                
-                page_repos = response.json()
-                if not page_repos:
-                    break
-                
-                # Extract relevant repository information
-                for repo in page_repos:
-                    repositories.append({
-                        "name": repo["name"],
-                        "full_name": repo["full_name"],
-                        "description": repo.get("description", ""),
-                        "private": repo["private"],
-                        "url": repo["html_url"],
-                        "permissions": repo.get("permissions", {})
-                    })
-                
+            repositories = RepositoryList()
+            for page in self.iter_user_repositories():
+                repositories.extend(page)
+                if on_page:
+                    on_page(page)
+            
+            return True, repositories, f"Found {len(repositories)} repositories"
+            
+        except (GitHubAPIError, GraphQLError) as e:
+            return False, RepositoryList(), str(e)
+        except RateLimitExceeded as e:
+            return False, RepositoryList(), str(e)
+        except requests.exceptions.RequestException as e:
+            return False, RepositoryList(), f"Network error while fetching repositories: {str(e)}"
+    
+    def iter_user_repositories(self) -> Iterator[RepositoryList]:
+        """
+        Yield the authenticated user's repositories one page at a time
+        
+        Page 1 is yielded as soon as it arrives. With the REST backend, when its
+        Link header names the last page, the remaining pages are fetched
+        concurrently and yielded in sort=updated order. The GraphQL backend
+        walks cursor pages of the same size and order.
+        
+        Yields:
+            RepositoryList for each page
+            
+        Raises:
+            GitHubAPIError: If not authenticated or a page request fails
+            GraphQLError: If the GraphQL backend rejects the query
+            requests.exceptions.RequestException: On network errors
+        """
+        if not self.token:
+            raise GitHubAPIError("Not authenticated")
+        
+        if self.backend == BACKEND_GRAPHQL:
+            pages = self.graphql.iter_repository_pages()
+        else:
+            pages = self._iter_repository_pages()
+        
+        seen = set()
+        for page_repos in pages:
+            page = RepositoryList()
+            for repo in page_repos:
+                # A repo updated mid-listing can shift onto two pages
+                if repo["full_name"] not in seen:
+                    seen.add(repo["full_name"])
+                    page.append(repo)
+            yield page
+    
+    def _iter_repository_pages(self) -> Iterator[List[Dict]]:
+        """Yield raw repository JSON pages in page order"""
+        page_repos, response = self._get_repository_page(1)
+        yield page_repos
+        
+        last_page = last_page_number(response)
+        if last_page is None:
+            # No Link header: walk pages until GitHub returns a short one
+            page = 1
+            while len(page_repos) == REPOS_PER_PAGE:
                 page += 1
-                
-                # GitHub API returns less than per_page items on the last page
-                if len(page_repos) < per_page:
+                page_repos, _ = self._get_repository_page(page)
+                yield page_repos
+            return
+        
+        if last_page <= 1:
+            return
+        
+        workers = min(self.max_workers, self.pool_size, last_page - 1)
+        executor = ThreadPoolExecutor(max_workers=workers)
+        futures = [executor.submit(self._get_repository_page, page) for page in range(2, last_page + 1)]
+        try:
+            # Wait on futures in page order so the merged list keeps sort=updated order
+            for future in futures:
+                yield future.result()[0]
+        finally:
+            # Stop outstanding fetches if the consumer stops early or a page failed
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+    
+    def _get_repository_page(self, page: int) -> Tuple[List[Dict], requests.Response]:
+        """
+        Fetch one page of the authenticated user's repositories
+        
+        Args:
+            page: 1-based page number
+            
+        Returns:
+            Tuple of (raw repository JSON list, response)
+            
+        Raises:
+            GitHubAPIError: If GitHub does not answer with 200
+        """
+        response = self._request(
+            "GET",
+            "/user/repos",
+            params={
+                "page": page,
+                "per_page": REPOS_PER_PAGE,
+                "sort": "updated",
+                "type": "owner"  # Only repos owned by the user
+            },
+            cache=True
+        )
+        
+        if response.status_code != 200:
+            raise GitHubAPIError(f"Failed to fetch repositories: {response.status_code}")
+        
+        return response.json(), response
+    
+    def account_key(self) -> Optional[str]:
+        """Identify the authenticated account, including the API host, for local storage"""
+        if not self.authenticated_user:
+            return None
+        return f"{urlsplit(self.base_url).netloc}/{self.authenticated_user['login']}"
+    
+    def sync_repositories(self, index: RepositoryIndex, full: bool = False,
+                          on_page: Optional[Callable[[RepositoryList], None]] = None,
+                          full_sync_interval: float = FULL_SYNC_INTERVAL) -> Tuple[bool, RepositoryList, str]:
+        """
+        Bring the local repository index up to date and return its contents
+        
+        The first sync (or one after full_sync_interval) lists everything. Later
+        syncs read pages sorted by last update and stop at the first repository
+        not newer than what the index already holds, usually after one request.
+        Deletions and transfers are only picked up by full syncs.
+        
+        Args:
+            index: Local repository index
+            full: Force a complete listing
+            on_page: Passed to get_user_repositories during a full listing
+            full_sync_interval: Seconds after which a complete listing is done anyway
+            
+        Returns:
+            Tuple of (success: bool, repositories: RepositoryList, message: str)
+        """
+        account = self.account_key()
+        if not self.token or not account:
+            return False, RepositoryList(), "Not authenticated"
+        
+        try:
+            newest = index.newest_updated_at(account)
+            last_full = index.full_synced_at(account)
+            if full or not newest or last_full is None or time.time() - last_full > full_sync_interval:
+                success, repositories, message = self.get_user_repositories(on_page=on_page)
+                if success:
+                    try:
+                        index.replace(account, repositories)
+                    except sqlite3.Error as e:
+                        # The listing itself is still good
+                        message = f"{message} (local index not updated: {str(e)})"
+                return success, repositories, message
+            
+            changed = RepositoryList()
+            for page_repos in self._iter_repository_pages_serial():
+                rows = list(RepositoryList(page_repos).rows())
+                # Pages are newest first; keep rows until the first already-known one
+                fresh = [row for row in rows if row[5] >= newest]
+                changed.extend(RepositoryList.from_rows(fresh))
+                if len(fresh) < len(rows):
                     break
             
-            return True, repositories, f"Found {len(repositories)} repositories"
+            index.update(account, changed)
+            repositories = index.load(account)
+            return True, repositories, f"Found {len(repositories)} repositories ({len(changed)} updated since last sync)"
             
+        except (GitHubAPIError, GraphQLError) as e:
+            return False, RepositoryList(), str(e)
+        except RateLimitExceeded as e:
+            return False, RepositoryList(), str(e)
         except requests.exceptions.RequestException as e:
-            return False, [], f"Network error while fetching repositories: {str(e)}"
+            return False, RepositoryList(), f"Network error while fetching repositories: {str(e)}"
+        except sqlite3.Error as e:
+            return False, RepositoryList(), f"Local repository index error: {str(e)}"
+    
+    def _iter_repository_pages_serial(self) -> Iterator[List[Dict]]:
+        """Yield raw repository pages one request at a time, newest first, so callers can stop early"""
+        if self.backend == BACKEND_GRAPHQL:
+            yield from self.graphql.iter_repository_pages()
+            return
+        
+        page = 1
+        while True:
+            page_repos, _ = self._get_repository_page(page)
+            yield page_repos
+            if len(page_repos) < REPOS_PER_PAGE:
+                return
+            page += 1
     
     def verify_username(self, username: str) -> Tuple[bool, str]:
         """
@@ -118,25 +729,102 @@ class GitHubAPIClient:
         if not username or not username.strip():
             return False, "Username cannot be empty"
         
-        username = username.strip()
+        _, exists, message = self.verify_usernames([username])[0]
+        return exists, message
+    
+    def verify_usernames(self, usernames: List[str]) -> List[Tuple[str, bool, str]]:
+        """
+        Verify many GitHub usernames at once
+        
+        Names are stripped and deduplicated case-insensitively. Results, including
+        "not found" (kept for a shorter time), are cached; only cache misses hit
+        the network. More than GRAPHQL_USER_THRESHOLD misses (or any, on the GraphQL
+        backend) are sent as batched GraphQL queries of 50 names; otherwise, and for
+        names a batch could not answer, REST lookups run on up to pool_size threads,
+        since reads are not paced like writes.
+        
+        Args:
+            usernames: GitHub usernames to verify
+            
+        Returns:
+            List of tuples (username, exists, message), one per distinct name in input order
+        """
+        unique = {}
+        for username in usernames:
+            username = (username or "").strip()
+            if username and username.lower() not in unique:
+                unique[username.lower()] = username
+        
+        results = {}
+        misses = []
+        for key, username in unique.items():
+            cached = self.user_cache.get(key)
+            if cached is None:
+                misses.append(username)
+            else:
+                exists, name = cached
+                results[key] = (exists, user_message(username, exists, name))
         
+        if misses:
+            fetched = {}
+            if self.backend == BACKEND_GRAPHQL or len(misses) > GRAPHQL_USER_THRESHOLD:
+                fetched = self._lookup_users_graphql(misses)
+                if self.backend != BACKEND_GRAPHQL:
+                    # E.g. a token GraphQL refuses: fall back to REST for what is still unknown
+                    fetched = {username: result for username, result in fetched.items() if result[0] is not None}
+            remaining = [username for username in misses if username not in fetched]
+            if remaining:
+                workers = min(self.pool_size, len(remaining))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    fetched.update(zip(remaining, executor.map(self._lookup_user, remaining)))
+            
+            for username, (exists, name, message) in fetched.items():
+                if exists is not None:
+                    ttl = USER_CACHE_TTL if exists else MISSING_USER_CACHE_TTL
+                    self.user_cache.set(username.lower(), (exists, name), ttl)
+                    message = user_message(username, exists, name)
+                results[username.lower()] = (bool(exists), message)
+        
+        return [(username, *results[key]) for key, username in unique.items()]
+    
+    def _lookup_user(self, username: str) -> Tuple[Optional[bool], Optional[str], str]:
+        """
+        Look up one user over REST
+        
+        Returns:
+            Tuple of (exists, display name, error message); exists is None when the lookup failed
+        """
         try:
-            response = requests.get(
-                f"{self.base_url}/users/{username}",
-                headers=self.headers,
-                timeout=10
-            )
+            response = self._request("GET", f"/users/{username}", cache=True)
             
             if response.status_code == 200:
                 user_data = response.json()
-                return True, f"User '{username}' found: {user_data.get('name', username)}"
+                return True, user_data.get('name') or username, ""
             elif response.status_code == 404:
-                return False, f"User '{username}' not found"
+                return False, None, ""
             else:
-                return False, f"Error verifying username: {response.status_code}"
+                return None, None, f"Error verifying username: {response.status_code}"
                 
+        except RateLimitExceeded as e:
+            return None, None, str(e)
         except requests.exceptions.RequestException as e:
-            return False, f"Network error while verifying username: {str(e)}"
+            return None, None, f"Network error while verifying username: {str(e)}"
+    
+    def _lookup_users_graphql(self, usernames: List[str]) -> Dict[str, Tuple[Optional[bool], Optional[str], str]]:
+        """Look up users with batched GraphQL queries, in the same shape as _lookup_user"""
+        try:
+            found = self.graphql.lookup_users(usernames)
+        except (RateLimitExceeded, GraphQLError) as e:
+            return {username: (None, None, str(e)) for username in usernames}
+        except requests.exceptions.RequestException as e:
+            return {username: (None, None, f"Network error while verifying username: {str(e)}")
+                    for username in usernames}
+        
+        return {
+            username: (False, None, "") if found[username] is None
+            else (True, found[username].get("name") or username, "")
+            for username in usernames
+        }
     
     def add_collaborator(self, repo_full_name: str, username: str) -> Tuple[bool, str]:
         """
@@ -149,49 +837,298 @@ class GitHubAPIClient:
         Returns:
             Tuple of (success: bool, message: str)
         """
+        _, success, message = self._put_collaborator(repo_full_name, username)
+        return success, message
+    
+    def _put_collaborator(self, repo_full_name: str, username: str) -> Tuple[Optional[int], bool, str]:
+        """Send the collaborator PUT; returns (status code or None if none arrived, success, message)"""
         if not self.token:
-            return False, "Not authenticated"
+            return None, False, "Not authenticated"
         
         try:
-            response = requests.put(
-                f"{self.base_url}/repos/{repo_full_name}/collaborators/{username}",
-                headers=self.headers,
-                json={"permission": "push"},  # Default to push permission
-                timeout=10
+            response = self._request(
+                "PUT",
+                f"/repos/{repo_full_name}/collaborators/{username}",
+                repository=repo_full_name,
+                json={"permission": "push"}  # Default to push permission
             )
             
-            if response.status_code == 201:
-                return True, f"Successfully added {username} as collaborator to {repo_full_name}"
-            elif response.status_code == 204:
-                return True, f"{username} is already a collaborator on {repo_full_name}"
-            elif response.status_code == 403:
-                return False, f"Permission denied: Cannot add collaborators to {repo_full_name}"
-            elif response.status_code == 404:
-                return False, f"Repository {repo_full_name} not found or user {username} not found"
-            elif response.status_code == 422:
-                return False, f"Cannot add {username} as collaborator (may be repository owner)"
-            else:
-                return False, f"Failed to add collaborator: {response.status_code}"
+            return (response.status_code,
+                    *collaborator_result(response.status_code, repo_full_name, username))
                 
+        except RateLimitExceeded as e:
+            return None, False, str(e)
         except requests.exceptions.RequestException as e:
-            return False, f"Network error while adding collaborator: {str(e)}"
+            return None, False, f"Network error while adding collaborator: {str(e)}"
+    
+    def get_repository_access(self, repositories: List[str], max_workers: Optional[int] = None
+                              ) -> Dict[str, Optional[Set[str]]]:
+        """
+        Find who already has push access to each repository, before any write
+        
+        Collaborator and invitation listings are fetched concurrently through the
+        conditional-request cache, so a repeated pre-flight mostly costs 304s.
+        
+        Args:
+            repositories: List of repository full names
+            max_workers: Maximum in-flight requests (see add_collaborators_bulk)
+            
+        Returns:
+            Dictionary of repository full name to the lowercase logins of collaborators
+            with push access and of users with a pending write invitation; None where
+            the lookup failed, so callers fall back to sending the write
+        """
+        if not self.token or not repositories:
+            return {repo: None for repo in repositories}
+        
+        workers = min(max_workers or self.max_workers, self.pool_size, len(repositories))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(repositories, executor.map(self._lookup_repository_access, repositories)))
+    
+    def _lookup_repository_access(self, repo_full_name: str) -> Optional[Set[str]]:
+        """Collect logins with push access or a pending write invitation; None if a listing failed"""
+        try:
+            logins = set()
+            for collaborator in self._get_paginated(f"/repos/{repo_full_name}/collaborators"):
+                permissions = collaborator.get("permissions") or {}
+                if permissions.get("push") or permissions.get("maintain") or permissions.get("admin"):
+                    logins.add(collaborator["login"].lower())
+            for invitation in self._get_paginated(f"/repos/{repo_full_name}/invitations"):
+                invitee = invitation.get("invitee") or {}
+                if invitee.get("login") and invitation.get("permissions") in WRITE_INVITATION_PERMISSIONS:
+                    logins.add(invitee["login"].lower())
+            return logins
+        except (GitHubAPIError, RateLimitExceeded, requests.exceptions.RequestException):
+            return None
+    
+    def _get_paginated(self, path: str) -> Iterator[Dict]:
+        """
+        Yield the items of a cached list endpoint, following rel="next" links
+        
+        Raises:
+            GitHubAPIError: If a page does not answer with 200
+        """
+        url, params = path, {"per_page": COLLABORATORS_PER_PAGE}
+        while url:
+            response = self._request("GET", url, params=params, cache=True)
+            if response.status_code != 200:
+                raise GitHubAPIError(f"Failed to fetch {path}: {response.status_code}")
+            yield from response.json()
+            # The next link already carries the query string
+            url, params = response.links.get("next", {}).get("url"), None
     
-    def add_collaborators_bulk(self, repositories: List[str], username: str) -> List[Tuple[str, bool, str]]:
+    def add_collaborators_bulk(self, repositories: List[str], username: str,
+                               max_workers: Optional[int] = None,
+                               on_result: Optional[Callable[[Tuple[str, bool, str]], None]] = None,
+                               journal: Optional[JobJournal] = None,
+                               existing_access: Optional[Dict[str, Optional[Set[str]]]] = None
+                               ) -> List[Tuple[str, bool, str]]:
         """
         Add a user as collaborator to multiple repositories
         
+        Requests run on a bounded worker pool, so wall-clock time is roughly
+        len(repositories) / max_workers request latencies instead of their sum.
+        
         Args:
             repositories: List of repository full names
             username: Username to add as collaborator
+            max_workers: Maximum in-flight requests (defaults to the client's max_workers, or the
+                ceiling of an attached AdaptiveConcurrency, which then varies the number in
+                flight; capped at pool_size so every worker has a pooled connection)
+            on_result: Called with each (repo_name, success, message) as soon as it completes,
+                on the thread that called add_collaborators_bulk
+            journal: Checkpoint journal; repositories it records as done for this user are
+                skipped without a request, and every new result is recorded in it
+            existing_access: Result of get_repository_access; repositories where the user
+                already has push access or a pending invitation are skipped without a request
+            
+        Returns:
+            List of tuples (repo_name, success, message), in the order of repositories
+        """
+        results = [None] * len(repositories)
+        pending = []
+        for position, repo in enumerate(repositories):
+            message = skip_message(repo, username, journal, existing_access)
+            if message is None:
+                pending.append(position)
+                continue
+            results[position] = (repo, True, message)
+            if on_result:
+                on_result(results[position])
+        
+        remaining = [repositories[position] for position in pending]
+        for position, result in self._iter_add_results(remaining, username, max_workers):
+            results[pending[position]] = result
+            if journal is not None:
+                journal.record(result[0], username, result[1], result[2])
+            if on_result:
+                on_result(result)
+        return results
+    
+    def add_collaborators_matrix(self, repositories: List[str], usernames: List[str],
+                                 max_workers: Optional[int] = None,
+                                 on_result: Optional[Callable[[Tuple[str, str, bool, str]], None]] = None,
+                                 journal: Optional[JobJournal] = None,
+                                 existing_access: Optional[Dict[str, Optional[Set[str]]]] = None
+                                 ) -> MatrixResults:
+        """
+        Add every user as collaborator to every repository in one job
+        
+        Cells are interleaved across repositories and users, and a repository
+        never has two writes in flight, so the worker pool is not serialized
+        behind one busy resource while the governor paces the writes overall.
+        After a non-throttling 403 (no admin rights on the repository) the
+        repository's remaining cells fail without sending a request.
+        
+        Args:
+            repositories: List of repository full names
+            usernames: Usernames to add as collaborators; repeats (in any letter case) are dropped
+            max_workers: Maximum in-flight requests (see add_collaborators_bulk)
+            on_result: Called with each (repo_name, username, success, message) as soon as
+                it completes, on the thread that called add_collaborators_matrix
+            journal: Checkpoint journal (see add_collaborators_bulk)
+            existing_access: Result of get_repository_access (see add_collaborators_bulk)
             
         Returns:
-            List of tuples (repo_name, success, message)
+            MatrixResults with per-cell results and aggregate counts
         """
-        results = []
+        usernames = unique_usernames(usernames)
+        results = MatrixResults(repositories, usernames)
         
-        for repo in repositories:
-            success, message = self.add_collaborator(repo, username)
-            results.append((repo, success, message))
+        def emit(repo, username, success, message):
+            results.record(repo, username, success, message)
+            if on_result:
+                on_result((repo, username, success, message))
         
+        cells = []
+        for repo, username in interleave(repositories, usernames):
+            message = skip_message(repo, username, journal, existing_access)
+            if message is None:
+                cells.append((repo, username))
+            else:
+                emit(repo, username, True, message)
+        if not cells:
+            return results
+        
+        scheduler = MatrixScheduler(cells)
+        completed = queue.Queue()
+        
+        def work():
+            while True:
+                cell = scheduler.next_cell()
+                if cell is None:
+                    return
+                repo, username, blocked = cell
+                if blocked is not None:
+                    completed.put((repo, username, False, blocked))
+                    continue
+                status, success, message = None, False, "Request was not sent"
+                try:
+                    with self._write_slot():
+                        status, success, message = self._put_collaborator(repo, username)
+                finally:
+                    scheduler.done(repo, message if status == 403 else None)
+                    completed.put((repo, username, success, message))
+        
+        workers = min(max_workers or self._bulk_workers(), self.pool_size, len(cells))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for _ in range(workers):
+                executor.submit(work)
+            try:
+                for _ in range(len(cells)):
+                    repo, username, success, message = completed.get()
+                    if journal is not None:
+                        journal.record(repo, username, success, message)
+                    emit(repo, username, success, message)
+            finally:
+                scheduler.cancel()
         return results
-
+    
+    def iter_add_collaborators(self, repositories: List[str], username: str,
+                               max_workers: Optional[int] = None) -> Iterator[Tuple[str, bool, str]]:
+        """
+        Add a user as collaborator to multiple repositories, yielding results as they complete
+        
+        Args:
+            repositories: List of repository full names
+            username: Username to add as collaborator
+            max_workers: Maximum in-flight requests (see add_collaborators_bulk)
+            
+        Yields:
+            Tuples (repo_name, success, message) in completion order. Closing the
+            iterator early cancels requests that have not started.
+        """
+        for _, result in self._iter_add_results(repositories, username, max_workers):
+            yield result
+    
+    def iter_add_pairs(self, pairs: Iterable[Tuple[str, str]], max_workers: Optional[int] = None
+                       ) -> Iterator[Tuple[str, str, bool, str]]:
+        """
+        Add collaborators for a stream of (repository, username) pairs
+        
+        Pairs are read lazily and at most twice max_workers requests are queued
+        or in flight, so memory use does not grow with the length of the input.
+        
+        Args:
+            pairs: Iterable of (repository full name, username), e.g. a file being read
+            max_workers: Maximum in-flight requests (see add_collaborators_bulk)
+            
+        Yields:
+            Tuples (repo_name, username, success, message) in completion order
+        """
+        workers = max(1, min(max_workers or self._bulk_workers(), self.pool_size))
+        
+        def add(repo, username):
+            with self._write_slot():
+                success, message = self.add_collaborator(repo, username)
+            return repo, username, success, message
+        
+        pairs = iter(pairs)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            running = set()
+            try:
+                while True:
+                    for repo, username in pairs:
+                        running.add(executor.submit(add, repo, username))
+                        if len(running) >= 2 * workers:
+                            break
+                    if not running:
+                        return
+                    finished, running = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        yield future.result()
+            finally:
+                for future in running:
+                    future.cancel()
+    
+    def _bulk_workers(self) -> int:
+        """Default worker count of bulk adds: the adaptive limit's ceiling, if one is attached"""
+        return self.concurrency.maximum if self.concurrency is not None else self.max_workers
+    
+    def _write_slot(self):
+        """Context manager holding an adaptive-concurrency slot for one bulk write"""
+        return self.concurrency.slot() if self.concurrency is not None else nullcontext()
+    
+    def _iter_add_results(self, repositories: List[str], username: str,
+                          max_workers: Optional[int]) -> Iterator[Tuple[int, Tuple[str, bool, str]]]:
+        """Yield (position in repositories, result) pairs in completion order"""
+        workers = min(max_workers or self._bulk_workers(), self.pool_size, max(1, len(repositories)))
+        
+        def add(repo):
+            with self._write_slot():
+                success, message = self.add_collaborator(repo, username)
+            return repo, success, message
+        
+        if workers <= 1:
+            for position, repo in enumerate(repositories):
+                yield position, add(repo)
+            return
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(add, repo): position for position, repo in enumerate(repositories)}
+            try:
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
@@ -0,0 +1,157 @@
+"""
+GraphQL transport for batched GitHub reads
+Fetches repositories in cursor pages and looks up many usernames in one
+aliased query, returning data in the same shapes as the REST client.
+"""
+
+from typing import Dict, Iterator, List, Optional
+
+from rate_limit import RESOURCE_GRAPHQL
+
+
+GRAPHQL_PAGE_SIZE = 100  # The maximum GitHub allows for a connection
+USERS_PER_QUERY = 50
+
+REPOSITORIES_QUERY = """
+query($pageSize: Int!, $cursor: String) {
+  viewer {
+    repositories(first: $pageSize, after: $cursor, ownerAffiliations: OWNER,
+                 orderBy: {field: UPDATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes { name nameWithOwner description isPrivate url viewerPermission updatedAt }
+    }
+  }
+}
+"""
+
+# REST permission flags implied by each GraphQL viewerPermission
+_PERMISSIONS = {
+    "ADMIN": ("admin", "maintain", "push", "triage", "pull"),
+    "MAINTAIN": ("maintain", "push", "triage", "pull"),
+    "WRITE": ("push", "triage", "pull"),
+    "TRIAGE": ("triage", "pull"),
+    "READ": ("pull",),
+}
+_PERMISSION_NAMES = ("admin", "maintain", "push", "triage", "pull")
+
+
+class GraphQLError(Exception):
+    """Raised when the GraphQL endpoint rejects a query"""
+
+
+def graphql_url(base_url: str) -> str:
+    """
+    Derive the GraphQL endpoint from a REST base URL
+
+    Args:
+        base_url: REST API root, e.g. https://api.github.com or https://ghe.example.com/api/v3
+
+    Returns:
+        GraphQL endpoint URL
+    """
+    if base_url.endswith("/api/v3"):
+        return base_url[:-len("v3")] + "graphql"
+    return f"{base_url}/graphql"
+
+
+def permissions_from_viewer(viewer_permission: Optional[str]) -> Dict[str, bool]:
+    """Convert a GraphQL viewerPermission into the REST permissions dictionary"""
+    granted = _PERMISSIONS.get(viewer_permission or "", ())
+    return {name: name in granted for name in _PERMISSION_NAMES}
+
+
+def users_query(count: int) -> str:
+    """Build an aliased query looking up `count` logins passed as $l0..$lN"""
+    variables = ", ".join(f"$l{i}: String!" for i in range(count))
+    fields = "\n".join(f"  u{i}: user(login: $l{i}) {{ login name }}" for i in range(count))
+    return f"query({variables}) {{\n{fields}\n}}"
+
+
+class GraphQLTransport:
+    """Batched reads over GitHub's GraphQL API, sent through a GitHubAPIClient"""
+
+    def __init__(self, client):
+        """
+        Args:
+            client: GitHubAPIClient whose session, governor and token are used
+        """
+        self.client = client
+
+    def execute(self, query: str, variables: Optional[Dict] = None) -> Dict:
+        """
+        Run a GraphQL query
+
+        Args:
+            query: GraphQL document
+            variables: Query variables
+
+        Returns:
+            The response's "data" object
+
+        Raises:
+            GraphQLError: On HTTP errors or errors other than NOT_FOUND
+            requests.exceptions.RequestException: On network errors
+        """
+        response = self.client._request(
+            "POST",
+            graphql_url(self.client.base_url),
+            write=False,  # Queries are reads for rate-limit pacing
+            resource=RESOURCE_GRAPHQL,  # GraphQL has its own primary budget
+            json={"query": query, "variables": variables or {}}
+        )
+        if response.status_code != 200:
+            raise GraphQLError(f"GraphQL request failed: {response.status_code}")
+
+        body = response.json()
+        # Missing users come back as null fields with NOT_FOUND errors
+        errors = [error for error in body.get("errors") or [] if error.get("type") != "NOT_FOUND"]
+        if errors or body.get("data") is None:
+            message = errors[0].get("message", "unknown error") if errors else "no data returned"
+            raise GraphQLError(f"GraphQL query failed: {message}")
+        return body["data"]
+
+    def iter_repository_pages(self, page_size: int = GRAPHQL_PAGE_SIZE) -> Iterator[List[Dict]]:
+        """
+        Yield the viewer's owned repositories in cursor pages, most recently updated first
+
+        Yields:
+            List of repository dictionaries shaped like the REST client's output
+        """
+        cursor = None
+        while True:
+            data = self.execute(REPOSITORIES_QUERY, {"pageSize": page_size, "cursor": cursor})
+            connection = data["viewer"]["repositories"]
+            yield [
+                {
+                    "name": node["name"],
+                    "full_name": node["nameWithOwner"],
+                    "description": node.get("description"),
+                    "private": node["isPrivate"],
+                    "url": node["url"],
+                    "permissions": permissions_from_viewer(node.get("viewerPermission")),
+                    "updated_at": node.get("updatedAt"),
+                }
+                for node in connection["nodes"]
+            ]
+            page_info = connection["pageInfo"]
+            if not page_info["hasNextPage"]:
+                return
+            cursor = page_info["endCursor"]
+
+    def lookup_users(self, logins: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Look up many users with aliased queries of up to USERS_PER_QUERY logins each
+
+        Args:
+            logins: Usernames to look up
+
+        Returns:
+            Dictionary mapping each login to {"login", "name"} or None if it does not exist
+        """
+        results = {}
+        for start in range(0, len(logins), USERS_PER_QUERY):
+            chunk = logins[start:start + USERS_PER_QUERY]
+            data = self.execute(users_query(len(chunk)), {f"l{i}": login for i, login in enumerate(chunk)})
+            for i, login in enumerate(chunk):
+                results[login] = data.get(f"u{i}")
+        return results
@@ -0,0 +1,202 @@
+"""
+Checkpoint journal for bulk collaborator jobs
+Each finished repository/user pair is appended to a JSONL file; a background
+thread commits the appended lines in groups, and a rerun of the same job
+can skip every pair the journal records as done.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Iterable, Optional, Set, Tuple
+
+from app_paths import user_config_dir
+
+
+JOURNAL_DIRNAME = "journals"
+DEFAULT_COMMIT_INTERVAL = 0.5  # Seconds between group commits
+DEFAULT_COMMIT_BATCH = 100  # Pending entries that trigger an early commit
+
+
+def job_id(account: Optional[str], usernames: Iterable[str], repositories: Iterable[str]) -> str:
+    """Stable identifier of a job: the same account, users and repositories give the same id"""
+    key = json.dumps([account, sorted(set(usernames)), sorted(set(repositories))])
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
+def default_journal_path(job: str) -> str:
+    """Location of a job's journal in the user's config directory"""
+    return os.path.join(user_config_dir(), JOURNAL_DIRNAME, f"{job}.jsonl")
+
+
+class JobJournal:
+    """
+    Append-only JSONL journal of one bulk job
+
+    record() only queues a line; a commit thread writes queued lines with a
+    single write, flush and fsync every commit_interval seconds, or sooner
+    once commit_batch lines are waiting. A crash loses at most the last
+    uncommitted group, and a torn final line is ignored when the journal
+    is read back.
+
+    A failed write (disk full, file removed) does not stop the job: the
+    error is kept in `error`, later entries are dropped and the caller
+    decides what to tell the user. A journal that finished without
+    failures is deleted on close, since there is nothing left to resume.
+    """
+
+    def __init__(self, path: str, commit_interval: float = DEFAULT_COMMIT_INTERVAL,
+                 commit_batch: int = DEFAULT_COMMIT_BATCH, fsync: bool = True):
+        """
+        Args:
+            path: Journal file; existing entries are loaded
+            commit_interval: Longest time a recorded entry waits before it is committed
+            commit_batch: Number of waiting entries that triggers an early commit
+            fsync: Force each commit to disk (disable only in tests)
+        """
+        self.path = path
+        self.commit_interval = commit_interval
+        self.commit_batch = commit_batch
+        self.fsync = fsync
+
+        self._completed: Set[Tuple[str, str]] = set()
+        self._failed: Set[Tuple[str, str]] = set()  # Pairs whose latest result was a failure
+        self.entries = 0  # Results recorded, including failures
+        self.finished = False
+        self.error: Optional[OSError] = None  # First failed commit; nothing is written after it
+        self._load()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+        self._pending = []
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._closed = False
+        self._committer = threading.Thread(target=self._commit_loop, daemon=True)
+        self._committer.start()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding="utf-8") as journal:
+            for line in journal:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Torn write from a crash
+                if not isinstance(entry, dict):
+                    continue
+                if entry.get("finished"):
+                    self.finished = True
+                elif "repo" in entry and "user" in entry:
+                    self._count((entry["repo"], entry["user"]), bool(entry.get("ok")))
+
+    def _count(self, pair: Tuple[str, str], success: bool):
+        self.entries += 1
+        if success:
+            self._completed.add(pair)
+            self._failed.discard(pair)
+        elif pair not in self._completed:
+            self._failed.add(pair)
+
+    @property
+    def resumable(self) -> bool:
+        """True if earlier runs completed some pairs but stopped early or left failures"""
+        return bool(self._completed) and (not self.finished or bool(self._failed))
+
+    def completed_count(self) -> int:
+        """Number of repository/user pairs recorded as done"""
+        return len(self._completed)
+
+    def is_completed(self, repository: str, username: str) -> bool:
+        return (repository, username) in self._completed
+
+    def reset(self):
+        """Forget every entry and start the journal over"""
+        with self._write_lock:
+            with self._condition:
+                self._pending = []
+            self._file.truncate(0)
+            self._file.seek(0)
+        self._completed = set()
+        self._failed = set()
+        self.entries = 0
+        self.finished = False
+
+    def record(self, repository: str, username: str, success: bool, message: str):
+        """
+        Queue one result for the next group commit; safe to call from any thread
+
+        Args:
+            repository: Repository full name
+            username: User that was added
+            success: Whether the user is now a collaborator
+            message: Result message
+        """
+        line = json.dumps({"repo": repository, "user": username, "ok": success,
+                           "message": message, "at": time.time()})
+        with self._condition:
+            self._count((repository, username), success)
+            if self.error is not None:
+                return
+            self._pending.append(line + "\n")
+            if len(self._pending) >= self.commit_batch:
+                self._condition.notify()
+
+    def finish(self):
+        """Mark the job as run to the end and commit"""
+        with self._condition:
+            self._pending.append(json.dumps({"finished": True, "at": time.time()}) + "\n")
+        self.finished = True
+        self.commit()
+
+    def commit(self):
+        """Write, flush and (optionally) fsync every queued entry"""
+        with self._write_lock:
+            with self._condition:
+                batch, self._pending = self._pending, []
+            if not batch or self._file.closed or self.error is not None:
+                return
+            try:
+                self._file.write("".join(batch))
+                self._file.flush()
+                if self.fsync:
+                    os.fsync(self._file.fileno())
+            except OSError as e:
+                self.error = e
+
+    def _commit_loop(self):
+        while True:
+            with self._condition:
+                if self._closed:
+                    return
+                if len(self._pending) < self.commit_batch:
+                    self._condition.wait(self.commit_interval)
+            self.commit()
+
+    def close(self):
+        """Commit what is queued, stop the commit thread and close the file (deleting it if the job is done)"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._committer.join()
+        self.commit()
+        try:
+            self._file.close()
+        except OSError as e:
+            self.error = self.error or e
+        if self.finished and not self._failed and self.error is None:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
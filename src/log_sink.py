@@ -0,0 +1,112 @@
+"""
+Batched status log
+LogSink queues messages from any thread and writes them to a Tk Text widget
+in one insert per timer tick, keeping at most a fixed number of lines.
+"""
+
+from collections import deque
+from typing import Dict
+
+
+DEFAULT_MAX_LINES = 5000
+DEFAULT_FLUSH_INTERVAL_MS = 100
+
+LEVEL_COLOURS: Dict[str, str] = {
+    "info": "black",
+    "success": "green",
+    "warning": "orange",
+    "error": "red",
+}
+
+
+class LogSink:
+    """
+    Thread-safe, bounded log for a Text or ScrolledText widget
+
+    write() only appends to a deque, so worker threads can log without
+    root.after(). A timer on the Tk thread drains the deque and inserts
+    every pending message with a single insert call, then trims the oldest
+    lines beyond max_lines.
+    """
+
+    def __init__(self, widget, max_lines: int = DEFAULT_MAX_LINES,
+                 flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS):
+        """
+        Args:
+            widget: Text widget to write to (kept disabled between flushes)
+            max_lines: Lines kept in the widget; older lines are removed
+            flush_interval_ms: Delay between flushes while the timer runs
+        """
+        self.widget = widget
+        self.max_lines = max_lines
+        self.flush_interval_ms = flush_interval_ms
+        # Messages older than max_lines would be trimmed on flush anyway
+        self._pending = deque(maxlen=max_lines)
+        self._lines = 0  # Lines currently in the widget
+        self._timer = None
+        for level, colour in LEVEL_COLOURS.items():
+            widget.tag_configure(level, foreground=colour)
+
+    def write(self, message: str, level: str = "info"):
+        """
+        Queue a message; safe to call from any thread
+
+        Args:
+            message: Text of the message (may span several lines)
+            level: "info", "success", "warning" or "error"
+        """
+        self._pending.append((message, level if level in LEVEL_COLOURS else "info"))
+
+    def start(self):
+        """Start flushing on a timer; call from the Tk thread"""
+        if self._timer is None:
+            self._timer = self.widget.after(self.flush_interval_ms, self._tick)
+
+    def stop(self):
+        """Stop the timer and write out whatever is pending"""
+        if self._timer is not None:
+            self.widget.after_cancel(self._timer)
+            self._timer = None
+        self.flush()
+
+    def _tick(self):
+        self.flush()
+        self._timer = self.widget.after(self.flush_interval_ms, self._tick)
+
+    def flush(self) -> int:
+        """
+        Write pending messages to the widget; call from the Tk thread
+
+        Returns:
+            Number of messages written
+        """
+        batch = []
+        pending = self._pending
+        while pending:
+            batch.append(pending.popleft())
+        if not batch:
+            return 0
+
+        chunks = []
+        for message, level in batch:
+            chunks.extend((f"{message}\n", level))
+            self._lines += message.count("\n") + 1
+
+        widget = self.widget
+        widget.configure(state="normal")
+        widget.insert("end", *chunks)
+        excess = self._lines - self.max_lines
+        if excess > 0:
+            widget.delete("1.0", f"{excess + 1}.0")
+            self._lines -= excess
+        widget.see("end")
+        widget.configure(state="disabled")
+        return len(batch)
+
+    def clear(self):
+        """Remove every message, pending or shown"""
+        self._pending.clear()
+        self.widget.configure(state="normal")
+        self.widget.delete("1.0", "end")
+        self.widget.configure(state="disabled")
+        self._lines = 0
@@ -6,12 +6,26 @@ A sleek and responsive desktop application for managing GitHub repository collab
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import threading
+import re
 import sys
-import os
 
-# Add src directory to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
-from github_client import GitHubAPIClient
+# github_client (requests, ssl), repo_index (sqlite3) and job_journal (json)
+# are imported where first needed so the window opens without waiting for them
+from repo_records import RepositoryList
+from repo_list_view import VirtualRepositoryList
+from repo_search import RepositorySearchIndex
+from log_sink import LogSink
+from bulk_progress import BulkProgress, format_duration
+from matrix_scheduler import unique_usernames
+
+
+PROGRESS_INTERVAL_MS = 250  # Refresh interval of the bulk-add progress display
+METRICS_INTERVAL_MS = 1000  # Refresh interval of the API request summary
+
+
+def parse_usernames(text):
+    """Split a pasted list of usernames on commas, semicolons and whitespace, dropping repeats"""
+    return unique_usernames(name for name in re.split(r"[\s,;]+", text) if name)
 
 
 class GitHubCollaboratorManager:
@@ -19,13 +33,38 @@ class GitHubCollaboratorManager:
     
     def __init__(self, root):
         self.root = root
-        self.github_client = GitHubAPIClient()
-        self.repositories = []
-        self.repo_vars = {}  # Dictionary to store checkbox variables
+        self._github_client = None  # Created by client_loader
+        self.request_metrics = None  # Collects the client's request metrics, created with it
+        self.client_loader = threading.Thread(target=self.load_client, daemon=True)
+        self.load_generation = 0  # Identifies the latest repository load
+        self.repo_index = None  # Local repository index, opened on first load
+        self.repo_index_failed = False
+        self.bulk_progress = None  # Progress of the running bulk add
+        self.progress_timer = None
         
         self.setup_window()
         self.create_widgets()
         self.setup_layout()
+        self.log.start()
+        self.client_loader.start()
+        self.update_metrics_label()
+    
+    def load_client(self):
+        """Import the API client and its HTTP stack off the GUI thread"""
+        from github_client import GitHubAPIClient
+        from request_metrics import RequestMetrics
+        from adaptive_concurrency import AdaptiveConcurrency
+        client = GitHubAPIClient()
+        self.request_metrics = RequestMetrics().attach(client)
+        AdaptiveConcurrency().attach(client)
+        self._github_client = client
+    
+    @property
+    def github_client(self):
+        """The API client, waiting for the background import if it has not finished"""
+        if self._github_client is None:
+            self.client_loader.join()
+        return self._github_client
     
     def setup_window(self):
         """Configure the main window"""
@@ -67,18 +106,34 @@ class GitHubCollaboratorManager:
         # Repository Section
         self.repo_frame = ttk.LabelFrame(self.main_frame, text="Your Repositories", padding="10")
         
-        # Repository list with scrollbar
-        self.repo_list_frame = ttk.Frame(self.repo_frame)
-        self.repo_canvas = tk.Canvas(self.repo_list_frame, height=200, bg='white')
-        self.repo_scrollbar = ttk.Scrollbar(
-            self.repo_list_frame, 
-            orient="vertical", 
-            command=self.repo_canvas.yview
+        # Filter controls above the repository list
+        self.filter_frame = ttk.Frame(self.repo_frame)
+        self.filter_label = ttk.Label(self.filter_frame, text="Filter:")
+        self.filter_var = tk.StringVar()
+        self.filter_var.trace_add("write", lambda *args: self.apply_repo_filter())
+        self.filter_entry = ttk.Entry(self.filter_frame, textvariable=self.filter_var, width=30)
+        self.visibility_var = tk.StringVar(value="All")
+        self.visibility_combo = ttk.Combobox(
+            self.filter_frame,
+            textvariable=self.visibility_var,
+            values=("All", "Private", "Public"),
+            state="readonly",
+            width=8
+        )
+        self.visibility_combo.bind("<<ComboboxSelected>>", lambda event: self.apply_repo_filter())
+        self.admin_only_var = tk.BooleanVar()
+        self.admin_only_check = ttk.Checkbutton(
+            self.filter_frame,
+            text="Admin only",
+            variable=self.admin_only_var,
+            command=self.apply_repo_filter
         )
-        self.repo_canvas.configure(yscrollcommand=self.repo_scrollbar.set)
+        self.repo_count_label = ttk.Label(self.filter_frame, text="", foreground="gray")
         
-        self.repo_inner_frame = ttk.Frame(self.repo_canvas)
-        self.repo_canvas.create_window((0, 0), window=self.repo_inner_frame, anchor="nw")
+        # Repository list; only the visible rows have widgets
+        self.repo_list = VirtualRepositoryList(self.repo_frame, height=200)
+        self.repo_model = self.repo_list.model
+        self.repo_model.add_listener(self.update_repo_count)
         
         # Select all/none buttons
         self.repo_buttons_frame = ttk.Frame(self.repo_frame)
@@ -92,11 +147,31 @@ class GitHubCollaboratorManager:
             text="Select None", 
             command=self.select_none_repos
         )
+        self.invert_selection_button = ttk.Button(
+            self.repo_buttons_frame,
+            text="Invert",
+            command=self.invert_repo_selection
+        )
+        self.select_shown_button = ttk.Button(
+            self.repo_buttons_frame,
+            text="Select Shown",
+            command=self.select_shown_repos
+        )
+        self.select_private_button = ttk.Button(
+            self.repo_buttons_frame,
+            text="Select Private",
+            command=lambda: self.select_repos_by_visibility(True)
+        )
+        self.select_public_button = ttk.Button(
+            self.repo_buttons_frame,
+            text="Select Public",
+            command=lambda: self.select_repos_by_visibility(False)
+        )
         
         # Username Verification Section
         self.user_frame = ttk.LabelFrame(self.main_frame, text="Add Collaborator", padding="10")
         
-        self.username_label = ttk.Label(self.user_frame, text="GitHub Username:")
+        self.username_label = ttk.Label(self.user_frame, text="GitHub Username(s):")
         self.username_entry = ttk.Entry(self.user_frame, width=30)
         self.verify_button = ttk.Button(
             self.user_frame, 
@@ -127,12 +202,15 @@ class GitHubCollaboratorManager:
             width=70,
             state="disabled"
         )
+        self.log = LogSink(self.status_text)
         
         # Progress bar
         self.progress = ttk.Progressbar(
             self.status_frame, 
             mode='indeterminate'
         )
+        self.progress_label = ttk.Label(self.status_frame, text="", foreground="gray")
+        self.metrics_label = ttk.Label(self.status_frame, text="", foreground="gray")
     
     def setup_layout(self):
         """Arrange widgets in the window"""
@@ -159,19 +237,26 @@ class GitHubCollaboratorManager:
         
         # Repository section
         self.repo_frame.grid(row=2, column=0, sticky="nsew", pady=(0, 10))
-        self.repo_frame.grid_rowconfigure(0, weight=1)
+        self.repo_frame.grid_rowconfigure(1, weight=1)
         self.repo_frame.grid_columnconfigure(0, weight=1)
         
-        self.repo_list_frame.grid(row=0, column=0, sticky="nsew")
-        self.repo_list_frame.grid_rowconfigure(0, weight=1)
-        self.repo_list_frame.grid_columnconfigure(0, weight=1)
+        self.filter_frame.grid(row=0, column=0, sticky="ew", pady=(0, 10))
+        self.filter_frame.grid_columnconfigure(1, weight=1)
+        self.filter_label.grid(row=0, column=0, sticky="w", padx=(0, 10))
+        self.filter_entry.grid(row=0, column=1, sticky="ew", padx=(0, 10))
+        self.visibility_combo.grid(row=0, column=2, padx=(0, 10))
+        self.admin_only_check.grid(row=0, column=3, padx=(0, 10))
+        self.repo_count_label.grid(row=0, column=4, sticky="e")
         
-        self.repo_canvas.grid(row=0, column=0, sticky="nsew")
-        self.repo_scrollbar.grid(row=0, column=1, sticky="ns")
+        self.repo_list.grid(row=1, column=0, sticky="nsew")
         
-        self.repo_buttons_frame.grid(row=1, column=0, pady=(10, 0))
+        self.repo_buttons_frame.grid(row=2, column=0, pady=(10, 0))
         self.select_all_button.grid(row=0, column=0, padx=(0, 10))
-        self.select_none_button.grid(row=0, column=1)
+        self.select_none_button.grid(row=0, column=1, padx=(0, 10))
+        self.invert_selection_button.grid(row=0, column=2, padx=(0, 10))
+        self.select_shown_button.grid(row=0, column=3, padx=(0, 10))
+        self.select_private_button.grid(row=0, column=4, padx=(0, 10))
+        self.select_public_button.grid(row=0, column=5)
         
         # Username section
         self.user_frame.grid(row=3, column=0, sticky="ew", pady=(0, 10))
@@ -190,27 +275,12 @@ class GitHubCollaboratorManager:
         
         self.status_text.grid(row=0, column=0, sticky="ew")
         self.progress.grid(row=1, column=0, sticky="ew", pady=(10, 0))
+        self.progress_label.grid(row=2, column=0, sticky="w")
+        self.metrics_label.grid(row=3, column=0, sticky="w")
     
     def log_message(self, message, level="info"):
-        """Add a message to the status log"""
-        self.status_text.config(state="normal")
-        
-        # Color coding for different message types
-        if level == "error":
-            color = "red"
-        elif level == "success":
-            color = "green"
-        elif level == "warning":
-            color = "orange"
-        else:
-            color = "black"
-        
-        self.status_text.insert(tk.END, f"{message}\n")
-        self.status_text.see(tk.END)
-        self.status_text.config(state="disabled")
-        
-        # Update the window
-        self.root.update_idletasks()
+        """Add a message to the status log; safe to call from any thread"""
+        self.log.write(message, level)
     
     def authenticate(self):
         """Authenticate with GitHub using the provided token"""
@@ -225,7 +295,8 @@ class GitHubCollaboratorManager:
         self.token_button.config(state="disabled")
         
         def auth_thread():
-            success, message = self.github_client.authenticate(token)
+            # Several tokens (separated by commas or spaces) are pooled for more rate limit
+            success, message = self.github_client.authenticate_tokens(re.split(r"[\s,;]+", token))
             
             # Update UI in main thread
             self.root.after(0, self.auth_complete, success, message)
@@ -245,100 +316,187 @@ class GitHubCollaboratorManager:
             messagebox.showerror("Authentication Failed", message)
     
     def load_repositories(self):
-        """Load user's repositories"""
+        """Show indexed repositories at once, then sync with GitHub, rendering pages as they arrive"""
         self.log_message("Loading repositories...")
         self.progress.start()
+        self.clear_repositories()
+        
+        # Pages from an earlier load (e.g. before re-authenticating) are ignored
+        self.load_generation += 1
+        generation = self.load_generation
+        
+        def on_page(page):
+            self.root.after(0, self.repos_page_loaded, generation, page)
         
         def load_thread():
-            success, repos, message = self.github_client.get_user_repositories()
+            import sqlite3
+            
+            index = self.get_repo_index()
+            if index is None:
+                success, repos, message = self.github_client.get_user_repositories(on_page=on_page)
+                from_cache = False
+            else:
+                try:
+                    cached = index.load(self.github_client.account_key())
+                except sqlite3.Error:
+                    cached = RepositoryList()
+                from_cache = bool(cached)
+                if from_cache:
+                    # Index the whole saved list here rather than on the GUI thread
+                    self.root.after(0, self.repos_replaced, generation, cached, RepositorySearchIndex(cached))
+                # Only the first sync streams pages; later ones usually need a single request
+                success, repos, message = self.github_client.sync_repositories(
+                    index, on_page=None if from_cache else on_page)
+            
+            # Streamed pages were indexed as they arrived; a changed saved list needs a new index
+            search_index = None
+            if success and from_cache and repos != cached:
+                search_index = RepositorySearchIndex(repos)
             
             # Update UI in main thread
-            self.root.after(0, self.repos_loaded, success, repos, message)
+            self.root.after(0, self.repos_loaded, generation, success, repos, message, from_cache, search_index)
         
         threading.Thread(target=load_thread, daemon=True).start()
     
-    def repos_loaded(self, success, repos, message):
+    def get_repo_index(self):
+        """Open the local repository index, or return None if it is unavailable"""
+        if self.repo_index is None and not self.repo_index_failed:
+            import sqlite3
+            from repo_index import RepositoryIndex
+            
+            try:
+                self.repo_index = RepositoryIndex()
+            except (sqlite3.Error, OSError) as e:
+                self.repo_index_failed = True
+                self.log_message(f"Local repository index unavailable: {e}", "warning")
+        return self.repo_index
+    
+    def repos_page_loaded(self, generation, page):
+        """Append a page of repositories as soon as it is fetched"""
+        if generation == self.load_generation:
+            self.append_repositories(page)
+    
+    def repos_replaced(self, generation, repos, search_index):
+        """Show a complete repository list, such as the saved one, in place of the current rows"""
+        if generation == self.load_generation:
+            self.display_repositories(repos, search_index)
+    
+    def repos_loaded(self, generation, success, repos, message, from_cache=False, search_index=None):
         """Handle repositories loading completion"""
+        if generation != self.load_generation:
+            return
         self.progress.stop()
         
         if success:
-            self.repositories = repos
-            self.display_repositories()
+            if repos != self.repo_model.repositories:
+                self.display_repositories(repos, search_index)
             self.log_message(message, "success")
+        elif from_cache:
+            self.log_message(f"Could not refresh repositories, showing saved list: {message}", "warning")
         else:
+            self.clear_repositories()
             self.log_message(f"Failed to load repositories: {message}", "error")
             messagebox.showerror("Error", f"Failed to load repositories: {message}")
     
-    def display_repositories(self):
-        """Display repositories with checkboxes"""
-        # Clear existing widgets
-        for widget in self.repo_inner_frame.winfo_children():
-            widget.destroy()
-        
-        self.repo_vars = {}
-        
-        for i, repo in enumerate(self.repositories):
-            var = tk.BooleanVar()
-            self.repo_vars[repo['full_name']] = var
-            
-            # Create checkbox with repository info
-            checkbox = ttk.Checkbutton(
-                self.repo_inner_frame,
-                variable=var,
-                text=f"{repo['name']} {'(Private)' if repo['private'] else '(Public)'}"
-            )
-            checkbox.grid(row=i, column=0, sticky="w", pady=2)
-            
-            # Add description if available
-            if repo['description']:
-                desc_label = ttk.Label(
-                    self.repo_inner_frame,
-                    text=f"  {repo['description'][:80]}{'...' if len(repo['description']) > 80 else ''}",
-                    foreground="gray",
-                    font=('Helvetica', 9)
-                )
-                desc_label.grid(row=i, column=1, sticky="w", padx=(10, 0))
-        
-        # Update scroll region
-        self.repo_inner_frame.update_idletasks()
-        self.repo_canvas.configure(scrollregion=self.repo_canvas.bbox("all"))
-        
-        # Bind mousewheel to canvas
-        def on_mousewheel(event):
-            self.repo_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        self.repo_canvas.bind("<MouseWheel>", on_mousewheel)
+    def clear_repositories(self):
+        """Remove all repositories from the list"""
+        self.repo_model.clear()
+    
+    def display_repositories(self, repos, search_index=None):
+        """Show a new repository list, keeping checked repositories checked"""
+        self.repo_model.set_repositories(repos, search_index=search_index)
+    
+    def append_repositories(self, repos):
+        """Add repositories below the existing ones"""
+        self.repo_model.extend(repos)
+    
+    def apply_repo_filter(self):
+        """Filter the repository list on the search text, visibility and admin rights"""
+        self.repo_list.top = 0
+        self.repo_model.set_filter(
+            self.filter_var.get(),
+            private={"Private": True, "Public": False}.get(self.visibility_var.get()),
+            permission="admin" if self.admin_only_var.get() else None
+        )
+    
+    def update_repo_count(self):
+        """Show how many repositories are listed, shown and selected"""
+        model = self.repo_model
+        if model.is_filtered:
+            text = f"{len(model)} of {model.total} shown, {model.selected_count()} selected"
+        else:
+            text = f"{model.total} repositories, {model.selected_count()} selected"
+        self.repo_count_label.config(text=text)
     
     def select_all_repos(self):
         """Select all repositories"""
-        for var in self.repo_vars.values():
-            var.set(True)
+        self.repo_model.select_all()
     
     def select_none_repos(self):
         """Deselect all repositories"""
-        for var in self.repo_vars.values():
-            var.set(False)
+        self.repo_model.select_none()
+    
+    def invert_repo_selection(self):
+        """Swap selected and unselected repositories"""
+        self.repo_model.invert_selection()
+    
+    def select_shown_repos(self):
+        """Add the repositories passing the filter to the selection"""
+        self.repo_model.select_matches()
+    
+    def select_repos_by_visibility(self, private):
+        """Add all private or all public repositories to the selection"""
+        self.repo_model.select_visibility(private)
     
     def verify_username(self):
-        """Verify the entered username"""
-        username = self.username_entry.get().strip()
+        """Verify the entered username, or every name in a pasted list"""
+        usernames = parse_usernames(self.username_entry.get())
         
-        if not username:
+        if not usernames:
             messagebox.showerror("Error", "Please enter a username to verify")
             return
         
-        self.log_message(f"Verifying username: {username}")
+        if len(usernames) == 1:
+            self.log_message(f"Verifying username: {usernames[0]}")
+        else:
+            self.log_message(f"Verifying {len(usernames)} usernames...")
         self.verify_button.config(state="disabled")
         self.username_status.config(text="Verifying...", foreground="orange")
         
         def verify_thread():
-            exists, message = self.github_client.verify_username(username)
+            results = self.github_client.verify_usernames(usernames)
             
             # Update UI in main thread
-            self.root.after(0, self.username_verified, exists, message)
+            self.root.after(0, self.usernames_verified, results)
         
         threading.Thread(target=verify_thread, daemon=True).start()
     
+    def usernames_verified(self, results):
+        """Handle verification of one or more usernames"""
+        if len(results) == 1:
+            _, exists, message = results[0]
+            self.username_verified(exists, message)
+            return
+        
+        self.verify_button.config(state="normal")
+        missing = [username for username, exists, _ in results if not exists]
+        for username, exists, message in results:
+            if not exists:
+                self.log_message(message, "error")
+        
+        if missing:
+            shown = ", ".join(missing[:5]) + ("..." if len(missing) > 5 else "")
+            self.username_status.config(
+                text=f"✗ {len(missing)} of {len(results)} users not found: {shown}",
+                foreground="red"
+            )
+            self.add_button.config(state="disabled")
+        else:
+            message = f"All {len(results)} users found"
+            self.username_status.config(text=f"✓ {message}", foreground="green")
+            self.add_button.config(state="normal")
+            self.log_message(message, "success")
+    
     def username_verified(self, exists, message):
         """Handle username verification completion"""
         self.verify_button.config(state="normal")
@@ -353,70 +511,170 @@ class GitHubCollaboratorManager:
             self.log_message(message, "error")
     
     def add_collaborator(self):
-        """Add the verified user as collaborator to selected repositories"""
-        username = self.username_entry.get().strip()
+        """Add the verified users as collaborators to selected repositories"""
+        usernames = parse_usernames(self.username_entry.get())
         
         # Get selected repositories
-        selected_repos = [
-            repo_name for repo_name, var in self.repo_vars.items() 
-            if var.get()
-        ]
+        selected_repos = self.repo_model.selected_full_names()
         
         if not selected_repos:
             messagebox.showerror("Error", "Please select at least one repository")
             return
         
-        if not username:
+        if not usernames:
             messagebox.showerror("Error", "Please enter and verify a username")
             return
         
+        who = f"'{usernames[0]}'" if len(usernames) == 1 else f"{len(usernames)} users"
+        
         # Confirm action
         result = messagebox.askyesno(
             "Confirm Action",
-            f"Add '{username}' as collaborator to {len(selected_repos)} selected repositories?"
+            f"Add {who} as collaborator to {len(selected_repos)} selected repositories?"
         )
         
         if not result:
             return
         
-        self.log_message(f"Adding {username} as collaborator to {len(selected_repos)} repositories...")
+        total = len(selected_repos) * len(usernames)
+        journal = self.open_job_journal(usernames, selected_repos, total)
+        
+        self.log_message(f"Adding {who} as collaborator to {len(selected_repos)} repositories...")
         self.add_button.config(state="disabled")
-        self.progress.start()
+        
+        progress = BulkProgress(total)
+        self.bulk_progress = progress
+        self.progress.config(mode="determinate", maximum=total, value=0)
+        
+        def on_result(result):
+            # Runs on the worker thread as each request completes
+            repo_name, username, success, message = result
+            progress.record(success)
+            if success:
+                self.log_message(f"✓ {repo_name}: {message}", "success")
+            else:
+                self.log_message(f"✗ {repo_name} ({username}): {message}", "error")
         
         def add_thread():
-            results = self.github_client.add_collaborators_bulk(selected_repos, username)
+            results, error = None, None
+            try:
+                # Pre-flight: skip users who already have access or a pending invitation
+                access = self.github_client.get_repository_access(selected_repos)
+                avoided = sum(1 for repo in selected_repos for username in usernames
+                              if username.lower() in (access[repo] or ())
+                              and not (journal is not None and journal.is_completed(repo, username)))
+                if avoided:
+                    self.log_message(f"Pre-flight: {avoided} of {total} additions already in place, "
+                                     f"{avoided} writes avoided")
+                
+                results = self.github_client.add_collaborators_matrix(
+                    selected_repos, usernames, on_result=on_result, journal=journal,
+                    existing_access=access)
+                if journal is not None:
+                    journal.finish()
+            except Exception as e:
+                error = e
+            finally:
+                if journal is not None:
+                    journal.close()
             
-            # Update UI in main thread
-            self.root.after(0, self.collaborator_added, results)
+            # Update UI in main thread, also after a failure so the Add button comes back
+            self.root.after(0, self.collaborator_added, results, error,
+                            journal.error if journal is not None else None)
         
         threading.Thread(target=add_thread, daemon=True).start()
+        self.update_bulk_progress()
     
-    def collaborator_added(self, results):
-        """Handle collaborator addition completion"""
-        self.progress.stop()
+    def open_job_journal(self, usernames, repositories, total):
+        """Open this job's checkpoint journal, offering to skip what an earlier run completed"""
+        from job_journal import JobJournal, default_journal_path, job_id
+        
+        job = job_id(self.github_client.account_key(), usernames, repositories)
+        try:
+            journal = JobJournal(default_journal_path(job))
+        except OSError as e:
+            self.log_message(f"Could not open job journal, progress will not be saved: {e}", "warning")
+            return None
+        
+        if journal.resumable and messagebox.askyesno(
+            "Resume Job",
+            f"An earlier run of this job completed {journal.completed_count()} of {total} additions. "
+            "Skip those and add only the rest?"
+        ):
+            self.log_message(f"Resuming: skipping {journal.completed_count()} completed additions")
+        elif journal.entries:
+            journal.reset()
+        return journal
+    
+    def update_bulk_progress(self):
+        """Show progress, throughput, ETA and rate-limit waits of the running bulk add"""
+        progress = self.bulk_progress
+        if progress is None:
+            return
+        
+        snapshot = progress.snapshot()
+        self.progress.config(value=snapshot["done"])
+        text = f"{snapshot['done']}/{snapshot['total']} done · {snapshot['rate']:.1f} repos/s"
+        wait = self.github_client.current_wait()
+        if wait:
+            reason, seconds = wait
+            text += f" · waiting {format_duration(seconds)} for {reason.replace('_', ' ')} rate limit"
+        elif snapshot["eta"] is not None:
+            text += f" · ETA {format_duration(snapshot['eta'])}"
+        self.progress_label.config(text=text)
+        
+        self.progress_timer = self.root.after(PROGRESS_INTERVAL_MS, self.update_bulk_progress)
+    
+    def update_metrics_label(self):
+        """Show request counts, latency and rate-limit headroom from the client's metrics"""
+        if self.request_metrics is not None:
+            text = self.request_metrics.status_line()
+            client = self._github_client
+            concurrency = client.concurrency if client is not None else None
+            if text and concurrency is not None and concurrency.in_flight:
+                text += f" · {concurrency.in_flight}/{concurrency.limit} writes in flight"
+            self.metrics_label.config(text=text)
+        self.root.after(METRICS_INTERVAL_MS, self.update_metrics_label)
+    
+    def collaborator_added(self, results, error=None, journal_error=None):
+        """Handle collaborator addition completion (each result was logged as it arrived)"""
+        if self.progress_timer is not None:
+            self.root.after_cancel(self.progress_timer)
+            self.progress_timer = None
+        elapsed = self.bulk_progress.snapshot()["elapsed"]
+        self.bulk_progress = None
+        self.progress.config(mode="indeterminate", value=0)
+        self.progress_label.config(text="")
         self.add_button.config(state="normal")
         
-        success_count = 0
-        failure_count = 0
+        if journal_error is not None:
+            self.log_message(f"Job journal stopped saving progress: {journal_error}", "warning")
+        if error is not None:
+            self.log_message(f"Adding collaborators stopped after {format_duration(elapsed)}: {error}", "error")
+            self.log.flush()
+            messagebox.showerror("Error", f"Adding collaborators failed: {error}")
+            return
         
-        for repo_name, success, message in results:
-            if success:
-                success_count += 1
-                self.log_message(f"✓ {repo_name}: {message}", "success")
-            else:
-                failure_count += 1
-                self.log_message(f"✗ {repo_name}: {message}", "error")
+        counts = results.summary()
+        success_count = counts["succeeded"]
+        failure_count = counts["failed"]
         
         # Show summary
-        summary = f"Completed: {success_count} successful, {failure_count} failed"
+        summary = (f"Completed: {success_count} successful, {failure_count} failed "
+                   f"in {format_duration(elapsed)}")
         self.log_message(f"\n{summary}", "info")
+        if len(results.usernames) > 1:
+            for username, user_counts in counts["by_user"].items():
+                self.log_message(f"  {username}: {user_counts['succeeded']} successful, "
+                                 f"{user_counts['failed']} failed")
+        self.log.flush()  # Show every result before the dialog opens
         
         if failure_count == 0:
-            messagebox.showinfo("Success", f"Successfully added collaborator to all {success_count} repositories!")
+            messagebox.showinfo("Success", f"Successfully completed all {success_count} collaborator additions!")
         else:
             messagebox.showwarning(
                 "Partial Success", 
-                f"Added collaborator to {success_count} repositories. {failure_count} failed. Check the log for details."
+                f"{success_count} collaborator additions succeeded. {failure_count} failed. Check the log for details."
             )
 
 
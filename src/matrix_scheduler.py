@@ -0,0 +1,140 @@
+"""
+Scheduling for users × repositories collaborator jobs
+Cells are interleaved so consecutive writes go to different repositories and
+users, at most one write per repository is in flight, and once a repository
+refuses writes its remaining cells fail without a request.
+"""
+
+import threading
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+def unique_usernames(usernames: Iterable[str]) -> List[str]:
+    """Drop repeated usernames, compared case-insensitively as GitHub does, keeping first occurrences"""
+    seen = set()
+    unique = []
+    for name in usernames:
+        if name.lower() not in seen:
+            seen.add(name.lower())
+            unique.append(name)
+    return unique
+
+
+def interleave(repositories: List[str], usernames: List[str]) -> Iterator[Tuple[str, str]]:
+    """
+    Yield every (repository, username) cell in diagonal order
+
+    Round k pairs repository i with user (i + k) mod len(usernames), so
+    neighbouring cells never share a repository and rarely share a user.
+    """
+    for k in range(len(usernames)):
+        for i, repo in enumerate(repositories):
+            yield repo, usernames[(i + k) % len(usernames)]
+
+
+class MatrixScheduler:
+    """
+    Thread-safe dispatcher of matrix cells to worker threads
+
+    Workers loop on next_cell() and report each outcome with done(). A cell
+    whose repository already has a write in flight is held back until that
+    write finishes, so one repository never sees concurrent writes.
+    """
+
+    def __init__(self, cells: List[Tuple[str, str]]):
+        """
+        Args:
+            cells: (repository, username) pairs in dispatch order
+        """
+        self._queue = deque(cells)
+        self._busy = set()  # Repositories with a write in flight
+        self._blocked = {}  # Repository -> message of the failure that blocked it
+        self._condition = threading.Condition()
+        self._cancelled = False
+
+    def next_cell(self) -> Optional[Tuple[str, str, Optional[str]]]:
+        """
+        Take the next cell to work on, waiting while every remaining cell's repository is busy
+
+        Returns:
+            (repository, username, blocked message) where the message is set if the
+            cell must fail without a request, or None when no cells are left
+        """
+        with self._condition:
+            while True:
+                if self._cancelled or not self._queue:
+                    return None
+                for _ in range(len(self._queue)):
+                    repo, username = self._queue[0]
+                    if repo in self._blocked:
+                        self._queue.popleft()
+                        return repo, username, self._blocked[repo]
+                    if repo not in self._busy:
+                        self._queue.popleft()
+                        self._busy.add(repo)
+                        return repo, username, None
+                    self._queue.rotate(-1)
+                self._condition.wait()
+
+    def done(self, repo: str, blocked_message: Optional[str] = None):
+        """
+        Release a repository after its write finished
+
+        Args:
+            repo: Repository the write went to
+            blocked_message: Failure message to give every remaining cell of the
+                repository, if the repository refuses writes altogether
+        """
+        with self._condition:
+            self._busy.discard(repo)
+            if blocked_message is not None:
+                self._blocked[repo] = blocked_message
+            self._condition.notify_all()
+
+    def cancel(self):
+        """Stop handing out cells"""
+        with self._condition:
+            self._cancelled = True
+            self._condition.notify_all()
+
+
+class MatrixResults:
+    """Per-cell results of a matrix job with aggregate counts"""
+
+    def __init__(self, repositories: List[str], usernames: List[str]):
+        self.repositories = list(repositories)
+        self.usernames = list(usernames)
+        self.cells: Dict[Tuple[str, str], Tuple[bool, str]] = {}
+
+    def record(self, repo: str, username: str, success: bool, message: str):
+        self.cells[(repo, username)] = (success, message)
+
+    def rows(self) -> List[Tuple[str, str, bool, str]]:
+        """Tuples (repo_name, username, success, message) in repository-then-user input order"""
+        return [(repo, username, *self.cells[(repo, username)])
+                for repo in self.repositories for username in self.usernames
+                if (repo, username) in self.cells]
+
+    def summary(self) -> Dict:
+        """
+        Aggregate counts
+
+        Returns:
+            Dictionary with total, succeeded and failed cell counts, and the same
+            succeeded/failed counts per user and per repository
+        """
+        by_user = {username: {"succeeded": 0, "failed": 0} for username in self.usernames}
+        by_repo = {repo: {"succeeded": 0, "failed": 0} for repo in self.repositories}
+        for (repo, username), (success, _) in self.cells.items():
+            key = "succeeded" if success else "failed"
+            by_user[username][key] += 1
+            by_repo[repo][key] += 1
+        succeeded = sum(counts["succeeded"] for counts in by_user.values())
+        return {
+            "total": len(self.cells),
+            "succeeded": succeeded,
+            "failed": len(self.cells) - succeeded,
+            "by_user": by_user,
+            "by_repo": by_repo,
+        }
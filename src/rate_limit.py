@@ -0,0 +1,351 @@
+"""
+Rate-limit governor for the GitHub API client
+Tracks the primary request budget, paces writes under the secondary limits,
+and pauses every caller while GitHub asks us to back off.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Optional, Tuple
+
+import requests
+
+
+# GitHub documents at most 80 content-creating requests per minute and 500 per hour
+DEFAULT_WRITES_PER_MINUTE = 80
+DEFAULT_WRITES_PER_HOUR = 500
+# GitHub asks clients to wait at least a minute after a secondary limit without Retry-After
+DEFAULT_SECONDARY_BACKOFF = 60.0
+DEFAULT_MAX_WAIT = 600.0
+
+WAIT_PRIMARY = "primary"
+WAIT_SECONDARY = "secondary"
+WAIT_RETRY_AFTER = "retry_after"
+WAIT_WRITE_PACING = "write_pacing"
+
+# GitHub keeps a separate primary budget per resource, named in X-RateLimit-Resource
+RESOURCE_CORE = "core"
+RESOURCE_GRAPHQL = "graphql"
+
+
+class RateLimitExceeded(requests.exceptions.RequestException):
+    """Raised when a request would have to wait longer than the governor allows"""
+
+    def __init__(self, reason: str, wait: float):
+        self.reason = reason
+        self.wait = wait
+        super().__init__(f"GitHub {reason.replace('_', '-')} rate limit reached, retry in {wait:.0f} seconds")
+
+
+class _Budget:
+    """Primary budget of one rate-limit resource, as last reported by GitHub"""
+
+    __slots__ = ("limit", "remaining", "reset_at")
+
+    def __init__(self):
+        self.limit = None
+        self.remaining = None
+        self.reset_at = None  # Epoch seconds, as sent by GitHub
+
+
+class RateLimitGovernor:
+    """
+    Shared gate that every GitHub request passes through
+
+    Call before_request() before sending and observe() with each response.
+    observe() returns a (delay, reason) pair when the response was throttled
+    and the request should be retried after the pause. Primary budgets are
+    tracked per resource (REST "core", "graphql", ...), so an exhausted
+    GraphQL budget does not hold back REST requests.
+    """
+
+    def __init__(self, writes_per_minute: int = DEFAULT_WRITES_PER_MINUTE,
+                 writes_per_hour: int = DEFAULT_WRITES_PER_HOUR, min_write_interval: float = 0.0,
+                 secondary_backoff: float = DEFAULT_SECONDARY_BACKOFF, max_wait: float = DEFAULT_MAX_WAIT,
+                 clock: Callable[[], float] = time.monotonic, wall_clock: Callable[[], float] = time.time,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            writes_per_minute: Maximum writes in any 60 second window (0 disables the window)
+            writes_per_hour: Maximum writes in any 3600 second window (0 disables the window)
+            min_write_interval: Minimum spacing between consecutive writes in seconds
+            secondary_backoff: Pause after a secondary-limit 403 that has no Retry-After header
+            max_wait: Longest single wait before giving up with RateLimitExceeded
+            clock, wall_clock, sleep: Time sources, replaceable in tests
+        """
+        self.writes_per_minute = writes_per_minute
+        self.writes_per_hour = writes_per_hour
+        self.min_write_interval = min_write_interval
+        self.secondary_backoff = secondary_backoff
+        self.max_wait = max_wait
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+        self._budgets = {}  # Resource name -> _Budget
+        self._paused_until = 0.0
+        self._pause_reason = None
+        self._recent_writes = deque()  # Send times of the writes in the last minute
+        self._hourly_writes = deque()  # ... and in the last hour
+        self._last_write = None
+        self._waiting = {}  # Thread id (or coroutine token) -> (reason, clock deadline) while that caller sleeps
+
+        self.requests = 0
+        self.throttled_responses = 0
+        self.waits = {}  # reason -> {"count": int, "seconds": float}
+
+    @property
+    def limit(self) -> Optional[int]:
+        """Primary limit of the core (REST) resource"""
+        return self._budget(RESOURCE_CORE).limit
+
+    @property
+    def remaining(self) -> Optional[int]:
+        """Remaining primary budget of the core (REST) resource"""
+        return self._budget(RESOURCE_CORE).remaining
+
+    @property
+    def reset_at(self) -> Optional[int]:
+        """Reset time (epoch seconds) of the core (REST) resource"""
+        return self._budget(RESOURCE_CORE).reset_at
+
+    def remaining_for(self, resource: str = RESOURCE_CORE) -> Optional[int]:
+        """Remaining primary budget of a resource, None until GitHub reported it"""
+        with self._lock:
+            return self._budget(resource).remaining
+
+    def required_wait(self, write: bool = False, resource: str = RESOURCE_CORE) -> float:
+        """Seconds a request would have to wait if it were sent now (0 if it can go)"""
+        with self._lock:
+            return self._required_wait(self._clock(), write, resource)[0]
+
+    def clone(self) -> "RateLimitGovernor":
+        """A governor with the same settings and no recorded state, e.g. for another token"""
+        return RateLimitGovernor(
+            writes_per_minute=self.writes_per_minute, writes_per_hour=self.writes_per_hour,
+            min_write_interval=self.min_write_interval,
+            secondary_backoff=self.secondary_backoff, max_wait=self.max_wait,
+            clock=self._clock, wall_clock=self._wall_clock, sleep=self._sleep
+        )
+
+    def _budget(self, resource: str) -> _Budget:
+        budget = self._budgets.get(resource)
+        if budget is None:
+            budget = self._budgets.setdefault(resource, _Budget())
+        return budget
+
+    def before_request(self, write: bool = False, resource: str = RESOURCE_CORE):
+        """
+        Block until a request may be sent
+
+        Args:
+            write: True for POST/PUT/PATCH/DELETE requests, which are paced separately
+            resource: Rate-limit resource whose primary budget the request spends
+
+        Raises:
+            RateLimitExceeded: If the required wait is longer than max_wait
+        """
+        while True:
+            wait, reason = self._admit(write, resource)
+            if wait <= 0:
+                return
+            caller = threading.get_ident()
+            self._start_wait(caller, reason, wait)
+            try:
+                self._sleep(wait)
+            finally:
+                self._end_wait(caller)
+            self._record_wait(reason, wait)
+
+    async def before_request_async(self, write: bool = False, resource: str = RESOURCE_CORE):
+        """
+        before_request for coroutines: waits with asyncio.sleep instead of blocking the thread
+
+        Raises:
+            RateLimitExceeded: If the required wait is longer than max_wait
+        """
+        import asyncio  # Only the async client needs it; the GUI and CLI start without it
+
+        while True:
+            wait, reason = self._admit(write, resource)
+            if wait <= 0:
+                return
+            caller = object()  # Many coroutines share one thread
+            self._start_wait(caller, reason, wait)
+            try:
+                await asyncio.sleep(wait)
+            finally:
+                self._end_wait(caller)
+            self._record_wait(reason, wait)
+
+    def _admit(self, write: bool, resource: str) -> Tuple[float, Optional[str]]:
+        """Count the request as sent if nothing holds it back, otherwise return (seconds, reason) to wait"""
+        with self._lock:
+            now = self._clock()
+            wait, reason = self._required_wait(now, write, resource)
+            if wait <= 0:
+                self.requests += 1
+                if write:
+                    self._last_write = now
+                    if self.writes_per_minute:
+                        self._recent_writes.append(now)
+                    if self.writes_per_hour:
+                        self._hourly_writes.append(now)
+                return 0.0, None
+        if wait > self.max_wait:
+            raise RateLimitExceeded(reason, wait)
+        return wait, reason
+
+    def _start_wait(self, caller, reason: str, wait: float):
+        with self._lock:
+            self._waiting[caller] = (reason, self._clock() + wait)
+
+    def _end_wait(self, caller):
+        with self._lock:
+            del self._waiting[caller]
+
+    def _required_wait(self, now: float, write: bool, resource: str) -> Tuple[float, Optional[str]]:
+        """Return (seconds, reason) the caller must still wait; called with the lock held"""
+        if now < self._paused_until:
+            return self._paused_until - now, self._pause_reason
+
+        budget = self._budget(resource)
+        if budget.remaining is not None and budget.remaining <= 0 and budget.reset_at is not None:
+            wait = budget.reset_at - self._wall_clock()
+            if wait > 0:
+                return wait, WAIT_PRIMARY
+            # The window has reset; the next response will report the new budget
+            budget.remaining = None
+
+        if write:
+            if self.min_write_interval and self._last_write is not None:
+                wait = self._last_write + self.min_write_interval - now
+                if wait > 0:
+                    return wait, WAIT_WRITE_PACING
+            if self.writes_per_minute:
+                while self._recent_writes and self._recent_writes[0] <= now - 60:
+                    self._recent_writes.popleft()
+                if len(self._recent_writes) >= self.writes_per_minute:
+                    return self._recent_writes[0] + 60 - now, WAIT_WRITE_PACING
+            if self.writes_per_hour:
+                while self._hourly_writes and self._hourly_writes[0] <= now - 3600:
+                    self._hourly_writes.popleft()
+                if len(self._hourly_writes) >= self.writes_per_hour:
+                    return self._hourly_writes[0] + 3600 - now, WAIT_WRITE_PACING
+
+        return 0.0, None
+
+    def observe(self, response, resource: str = RESOURCE_CORE) -> Optional[Tuple[float, str]]:
+        """
+        Update the budget from a response's rate-limit headers
+
+        Args:
+            response: requests.Response (or any object with status_code, headers and text)
+            resource: Resource the request was sent against; X-RateLimit-Resource overrides it
+
+        Returns:
+            (delay, reason) if the response was throttled and should be retried, otherwise None
+        """
+        headers = response.headers
+        remaining = _int_header(headers, "X-RateLimit-Remaining")
+        reset_at = _int_header(headers, "X-RateLimit-Reset")
+        resource = headers.get("X-RateLimit-Resource") or resource
+
+        with self._lock:
+            if remaining is not None:
+                budget = self._budget(resource)
+                if reset_at is not None and (budget.reset_at is None or reset_at > budget.reset_at):
+                    # A new window: trust its numbers outright
+                    budget.reset_at = reset_at
+                    budget.remaining = remaining
+                elif budget.remaining is None or reset_at == budget.reset_at:
+                    # Responses can arrive out of order; the lowest count is the latest
+                    budget.remaining = remaining if budget.remaining is None else min(budget.remaining, remaining)
+                limit = _int_header(headers, "X-RateLimit-Limit")
+                if limit is not None:
+                    budget.limit = limit
+
+        if response.status_code not in (403, 429):
+            return None
+
+        retry_after = _float_header(headers, "Retry-After")
+        if retry_after is not None:
+            throttle = (max(retry_after, 0.0), WAIT_RETRY_AFTER)
+        elif remaining == 0 and reset_at is not None:
+            throttle = (max(reset_at - self._wall_clock(), 0.0) + 1, WAIT_PRIMARY)
+        elif response.status_code == 429 or "secondary rate limit" in (response.text or "").lower():
+            throttle = (self.secondary_backoff, WAIT_SECONDARY)
+        else:
+            # An ordinary permission error
+            return None
+
+        with self._lock:
+            self.throttled_responses += 1
+        return throttle
+
+    def pause(self, seconds: float, reason: str):
+        """Hold back every request for the given number of seconds"""
+        with self._lock:
+            until = self._clock() + seconds
+            if until > self._paused_until:
+                self._paused_until = until
+                self._pause_reason = reason
+
+    def current_wait(self) -> Optional[Tuple[str, float]]:
+        """
+        The longest wait any caller is sleeping through right now
+
+        Returns:
+            (reason, seconds left), or None if no request is being held back
+        """
+        with self._lock:
+            if not self._waiting:
+                return None
+            reason, deadline = max(self._waiting.values(), key=lambda entry: entry[1])
+            return reason, max(0.0, deadline - self._clock())
+
+    def _record_wait(self, reason: str, seconds: float):
+        with self._lock:
+            entry = self.waits.setdefault(reason, {"count": 0, "seconds": 0.0})
+            entry["count"] += 1
+            entry["seconds"] += seconds
+
+    def stats(self) -> Dict:
+        """
+        Snapshot of the governor's counters
+
+        Returns:
+            Dictionary with the known core budget, every resource's budget,
+            request and throttle counts, and time spent waiting per reason
+        """
+        with self._lock:
+            core = self._budget(RESOURCE_CORE)
+            return {
+                "limit": core.limit,
+                "remaining": core.remaining,
+                "reset_at": core.reset_at,
+                "resources": {name: {"limit": budget.limit, "remaining": budget.remaining,
+                                     "reset_at": budget.reset_at}
+                              for name, budget in self._budgets.items()},
+                "requests": self.requests,
+                "throttled_responses": self.throttled_responses,
+                "waits": {reason: dict(entry) for reason, entry in self.waits.items()},
+                "total_wait_seconds": sum(entry["seconds"] for entry in self.waits.values()),
+            }
+
+
+def _int_header(headers, name: str) -> Optional[int]:
+    value = _float_header(headers, name)
+    return None if value is None else int(value)
+
+
+def _float_header(headers, name: str) -> Optional[float]:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
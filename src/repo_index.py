@@ -0,0 +1,138 @@
+"""
+Persistent local index of repository metadata
+An SQLite database in the user's config directory keeps each account's
+repositories between launches, so a sync only needs the pages that changed.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from app_paths import user_config_dir
+from repo_records import RepositoryList
+
+
+INDEX_FILENAME = "repositories.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS repositories (
+    account TEXT NOT NULL,
+    full_name TEXT NOT NULL,
+    name_offset INTEGER NOT NULL,
+    description TEXT,
+    flags INTEGER NOT NULL,
+    url TEXT,
+    updated_at INTEGER NOT NULL,
+    PRIMARY KEY (account, full_name)
+);
+CREATE INDEX IF NOT EXISTS repositories_by_update ON repositories (account, updated_at DESC);
+CREATE TABLE IF NOT EXISTS sync_state (
+    account TEXT PRIMARY KEY,
+    full_synced_at REAL NOT NULL,
+    synced_at REAL NOT NULL
+);
+"""
+
+
+def default_index_path() -> str:
+    """Location of the index in the user's config directory"""
+    return os.path.join(user_config_dir(), INDEX_FILENAME)
+
+
+class RepositoryIndex:
+    """
+    SQLite-backed store of repositories per authenticated account
+
+    Safe to share between the GUI thread and worker threads.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: Database file (defaults to the user's config directory); ":memory:" for tests
+        """
+        self.path = path or default_index_path()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def load(self, account: str) -> RepositoryList:
+        """
+        Get an account's stored repositories, most recently updated first
+
+        Args:
+            account: Account key (see GitHubAPIClient.account_key)
+
+        Returns:
+            RepositoryList, empty if the account was never synced
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT full_name, name_offset, description, flags, url, updated_at FROM repositories "
+                "WHERE account = ? ORDER BY updated_at DESC, full_name",
+                (account,)
+            ).fetchall()
+        return RepositoryList.from_rows(rows)
+
+    def newest_updated_at(self, account: str) -> Optional[int]:
+        """Most recent update time stored for an account, or None if it has never been synced"""
+        with self._lock:
+            synced = self._connection.execute(
+                "SELECT 1 FROM sync_state WHERE account = ?", (account,)).fetchone()
+            if not synced:
+                return None
+            row = self._connection.execute(
+                "SELECT MAX(updated_at) FROM repositories WHERE account = ?", (account,)).fetchone()
+        return row[0] or 0
+
+    def full_synced_at(self, account: str) -> Optional[float]:
+        """Epoch seconds of the account's last full sync, or None"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT full_synced_at FROM sync_state WHERE account = ?", (account,)).fetchone()
+        return row[0] if row else None
+
+    def replace(self, account: str, repositories: RepositoryList):
+        """
+        Store the complete repository list of an account, dropping anything not in it
+
+        Args:
+            account: Account key
+            repositories: Every repository the account has
+        """
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM repositories WHERE account = ?", (account,))
+            self._insert(account, repositories)
+            self._connection.execute(
+                "INSERT OR REPLACE INTO sync_state (account, full_synced_at, synced_at) VALUES (?, ?, ?)",
+                (account, now, now)
+            )
+
+    def update(self, account: str, repositories: RepositoryList):
+        """
+        Insert or refresh repositories changed since the last sync
+
+        Args:
+            account: Account key
+            repositories: Repositories updated since the last sync
+        """
+        with self._lock, self._connection:
+            self._insert(account, repositories)
+            self._connection.execute(
+                "UPDATE sync_state SET synced_at = ? WHERE account = ?", (time.time(), account))
+
+    def _insert(self, account: str, repositories: RepositoryList):
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO repositories "
+            "(account, full_name, name_offset, description, flags, url, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            ((account,) + row for row in repositories.rows())
+        )
+
+    def close(self):
+        """Close the database"""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,303 @@
+"""
+Virtualized repository list
+RepositoryListModel holds the rows and their checked state in plain Python;
+VirtualRepositoryList draws only the rows that fit in its viewport and reuses
+the same few widgets while scrolling, so cost does not grow with the list.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+import tkinter.font as tkfont
+from typing import Callable, Iterable, List, Mapping, Optional
+
+from repo_records import Repository, RepositoryList
+from repo_search import RepositorySearchIndex
+from selection_model import Selection
+
+
+DESCRIPTION_WIDTH = 80  # Characters of description shown per row
+ROW_PADDING = 6  # Vertical pixels around each row's text
+
+
+def row_label(repo: Repository) -> str:
+    """Checkbox text for a repository"""
+    return f"{repo.name} {'(Private)' if repo.private else '(Public)'}"
+
+
+def row_description(repo: Repository) -> str:
+    """Description text for a repository, truncated to DESCRIPTION_WIDTH characters"""
+    description = repo.description
+    if not description:
+        return ""
+    return f"  {description[:DESCRIPTION_WIDTH]}{'...' if len(description) > DESCRIPTION_WIDTH else ''}"
+
+
+class RepositoryListModel:
+    """
+    Repositories shown in the list and which of them are checked, independent of Tk
+
+    Rows are addressed by position in the filtered view; checked state is a
+    Selection of repository indices, so it survives changes of filter and
+    bulk changes cost nothing per row until the rows are drawn.
+    """
+
+    def __init__(self):
+        self.repositories = RepositoryList()
+        self.search_index = RepositorySearchIndex(self.repositories)
+        self.selection = Selection()  # Indices (into repositories) of checked repositories
+        self._visible: Optional[List[int]] = None  # Indices passing the filter, None when unfiltered
+        self._filter = ("", None, None)  # (query, private, permission)
+        self._listeners: List[Callable[[], None]] = []
+
+    def add_listener(self, listener: Callable[[], None]):
+        """Call `listener` with no arguments whenever rows or checked state change"""
+        self._listeners.append(listener)
+
+    def _changed(self):
+        for listener in self._listeners:
+            listener()
+
+    def __len__(self) -> int:
+        """Number of rows passing the filter"""
+        return len(self.repositories) if self._visible is None else len(self._visible)
+
+    @property
+    def total(self) -> int:
+        """Number of repositories, filtered or not"""
+        return len(self.repositories)
+
+    @property
+    def is_filtered(self) -> bool:
+        return self._visible is not None
+
+    def index_at(self, position: int) -> int:
+        """Index into `repositories` of the row at a position in the filtered view"""
+        return position if self._visible is None else self._visible[position]
+
+    def row(self, position: int) -> Repository:
+        """Repository at a position in the filtered view"""
+        return self.repositories[self.index_at(position)]
+
+    def set_filter(self, query: str = "", private: Optional[bool] = None, permission: Optional[str] = None):
+        """
+        Show only matching repositories
+
+        Args:
+            query: Case-insensitive substring of the name, full name or description
+            private: True for private only, False for public only, None for both
+            permission: Permission the user must hold (e.g. "admin"), or None
+        """
+        self._filter = (query, private, permission)
+        self._apply_filter()
+        self._changed()
+
+    def _apply_filter(self):
+        query, private, permission = self._filter
+        if not query.strip() and private is None and permission is None:
+            self._visible = None
+        else:
+            self._visible = self.search_index.search(query, private=private, permission=permission)
+
+    def clear(self):
+        """Remove every repository"""
+        self.set_repositories(RepositoryList(), keep_selection=False)
+
+    def extend(self, repos: Iterable[Mapping]):
+        """Append repositories below the existing rows"""
+        self.repositories.extend(repos)
+        self.selection.resize(len(self.repositories))
+        self.search_index.update()
+        if self._visible is not None:
+            self._apply_filter()
+        self._changed()
+
+    def set_repositories(self, repos: RepositoryList, keep_selection: bool = True,
+                         search_index: Optional[RepositorySearchIndex] = None):
+        """
+        Replace every row
+
+        Args:
+            repos: New list of repositories
+            keep_selection: Keep repositories that are still present checked
+            search_index: Index already built over `repos` (built here if not given)
+        """
+        selection = Selection(len(repos))
+        if keep_selection and self.selection.bits:
+            checked = set(self.selected_full_names())
+            selection.add_positions(i for i, name in enumerate(repos.full_names()) if name in checked)
+        self.repositories = repos
+        self.search_index = search_index if search_index is not None else RepositorySearchIndex(repos)
+        self.selection = selection
+        self._apply_filter()
+        self._changed()
+
+    def is_selected(self, position: int) -> bool:
+        return self.index_at(position) in self.selection
+
+    def set_selected(self, position: int, selected: bool):
+        """Check or uncheck the repository at a position in the filtered view"""
+        self.selection.set(self.index_at(position), selected)
+        self._changed()
+
+    def select_all(self):
+        """Check every repository, shown or not"""
+        self.selection.select_all()
+        self._changed()
+
+    def select_none(self):
+        """Uncheck every repository"""
+        self.selection.clear()
+        self._changed()
+
+    def invert_selection(self):
+        """Check every unchecked repository and uncheck the rest"""
+        self.selection.invert()
+        self._changed()
+
+    def select_matches(self):
+        """Also check every repository passing the current filter"""
+        if self._visible is None:
+            self.selection.select_all()
+        else:
+            self.selection.add_positions(self._visible)
+        self._changed()
+
+    def select_visibility(self, private: bool):
+        """Also check every private (True) or public (False) repository"""
+        self.selection.add_mask(self.repositories.flag_mask(private=private))
+        self._changed()
+
+    def selected_count(self) -> int:
+        return len(self.selection)
+
+    def selected_full_names(self) -> List[str]:
+        """Full names of checked repositories, in list order, whether or not they pass the filter"""
+        full_names = self.repositories.full_names()
+        return [full_names[i] for i in self.selection.positions()]
+
+
+class VirtualRepositoryList(ttk.Frame):
+    """
+    Scrollable checkbox list that only creates widgets for visible rows
+
+    Scrolling moves a window of `top`..`top + page` over the model and
+    rewrites the text and checked state of a fixed pool of row widgets.
+    """
+
+    def __init__(self, parent, model: RepositoryListModel = None, height: int = 200, **kwargs):
+        """
+        Args:
+            parent: Parent widget
+            model: Rows to show (a new empty model by default)
+            height: Initial height of the list in pixels
+        """
+        super().__init__(parent, **kwargs)
+        self.model = model if model is not None else RepositoryListModel()
+        self.top = 0  # Position of the first visible row
+
+        font = tkfont.nametofont("TkDefaultFont")
+        self.row_height = font.metrics("linespace") + ROW_PADDING
+
+        self.rows_frame = tk.Frame(self, height=height, bg="white")
+        self.rows_frame.grid_propagate(False)
+        self.rows_frame.grid_columnconfigure(1, weight=1)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+
+        self.rows_frame.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self._slots = []  # (checkbutton, description label, variable) per visible row
+        self.rows_frame.bind("<Configure>", self._on_resize)
+        self._bind_mousewheel(self.rows_frame)
+        self.model.add_listener(self.refresh)
+
+    @property
+    def page_size(self) -> int:
+        """Number of rows the viewport holds"""
+        return max(1, len(self._slots))
+
+    def _bind_mousewheel(self, widget):
+        widget.bind("<MouseWheel>", self._on_mousewheel)
+        widget.bind("<Button-4>", lambda event: self.scroll_rows(-1))  # X11
+        widget.bind("<Button-5>", lambda event: self.scroll_rows(1))
+
+    def _on_mousewheel(self, event):
+        # Windows reports multiples of 120 per notch, macOS small integers
+        steps = int(-event.delta / 120) or (-1 if event.delta > 0 else 1)
+        self.scroll_rows(steps)
+
+    def _on_resize(self, event):
+        """Grow or shrink the widget pool to fill the new height"""
+        count = max(1, event.height // self.row_height)
+        while len(self._slots) < count:
+            self._slots.append(self._create_slot(len(self._slots)))
+        while len(self._slots) > count:
+            checkbutton, label, _ = self._slots.pop()
+            checkbutton.destroy()
+            label.destroy()
+        self.refresh()
+
+    def _create_slot(self, slot: int):
+        variable = tk.BooleanVar()
+        checkbutton = ttk.Checkbutton(
+            self.rows_frame,
+            variable=variable,
+            command=lambda: self._on_toggle(slot)
+        )
+        label = ttk.Label(
+            self.rows_frame,
+            foreground="gray",
+            font=('Helvetica', 9)
+        )
+        checkbutton.grid(row=slot, column=0, sticky="w", pady=2)
+        label.grid(row=slot, column=1, sticky="w", padx=(10, 0))
+        self._bind_mousewheel(checkbutton)
+        self._bind_mousewheel(label)
+        return checkbutton, label, variable
+
+    def _on_toggle(self, slot: int):
+        position = self.top + slot
+        if position < len(self.model):
+            self.model.set_selected(position, self._slots[slot][2].get())
+
+    def scroll_rows(self, rows: int):
+        """Scroll by a number of rows (negative scrolls up)"""
+        self.top += rows
+        self.refresh()
+
+    def yview(self, *args):
+        """Scrollbar command: ("moveto", fraction) or ("scroll", amount, "units"|"pages")"""
+        if not args:
+            return
+        if args[0] == "moveto":
+            self.top = int(float(args[1]) * len(self.model))
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            self.top += amount * (self.page_size if args[2] == "pages" else 1)
+        self.refresh()
+
+    def refresh(self):
+        """Redraw the visible rows from the model"""
+        total = len(self.model)
+        page = self.page_size
+        self.top = max(0, min(self.top, total - page))
+
+        for slot, (checkbutton, label, variable) in enumerate(self._slots):
+            position = self.top + slot
+            if position < total:
+                repo = self.model.row(position)
+                checkbutton.configure(text=row_label(repo))
+                variable.set(self.model.is_selected(position))
+                label.configure(text=row_description(repo))
+                checkbutton.grid()
+                label.grid()
+            else:
+                checkbutton.grid_remove()
+                label.grid_remove()
+
+        if total:
+            self.scrollbar.set(self.top / total, min(1.0, (self.top + page) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
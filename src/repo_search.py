@@ -0,0 +1,127 @@
+"""
+Repository search index
+A trigram index over each repository's name, full name and description that
+answers case-insensitive substring queries without scanning every row.
+Typing one more character narrows the previous result instead of starting over.
+"""
+
+from array import array
+from itertools import compress, repeat
+from operator import contains
+from typing import Dict, List, Optional
+
+from repo_records import RepositoryList
+
+
+NGRAM = 3
+
+
+def _ngrams(text: str):
+    return {text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+
+class RepositorySearchIndex:
+    """
+    Substring search over a RepositoryList
+
+    Queries of NGRAM characters or more take the rows holding their rarest
+    trigram and confirm each with a substring check; shorter queries scan
+    the lowercased text column. Rows appended to the list are picked up by
+    update().
+    """
+
+    def __init__(self, repositories: Optional[RepositoryList] = None):
+        """
+        Args:
+            repositories: List to index; rows can be appended later and indexed with update()
+        """
+        self.repositories = repositories if repositories is not None else RepositoryList()
+        self._texts: List[str] = []  # Lowercased searchable text per row
+        self._postings: Dict[str, array] = {}  # Trigram -> ascending row positions
+        self._last_query = None
+        self._last_matches: List[int] = []
+        self.update()
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def update(self):
+        """Index rows appended to the repository list since the last call"""
+        start = len(self._texts)
+        if start == len(self.repositories):
+            return
+        postings = self._postings
+        for position in range(start, len(self.repositories)):
+            repo = self.repositories[position]
+            # The name is a suffix of the full name, so indexing the full name covers both
+            text = f"{repo.full_name}\n{repo.description or ''}".lower()
+            self._texts.append(text)
+            for gram in _ngrams(text):
+                column = postings.get(gram)
+                if column is None:
+                    postings[gram] = column = array("I")
+                column.append(position)
+        self._last_query = None
+
+    def matches(self, query: str) -> List[int]:
+        """
+        Positions of repositories whose name, full name or description contains `query`
+
+        Args:
+            query: Text to look for, case-insensitive; empty matches everything
+
+        Returns:
+            Matching positions in list order
+        """
+        query = query.strip().lower()
+        if not query:
+            return list(range(len(self._texts)))
+
+        texts = self._texts
+        last = self._last_query
+        if last and last in query:
+            # Every match of the longer query also matched the shorter one
+            candidates = self._last_matches
+        elif len(query) >= NGRAM:
+            candidates = self._candidates(query)
+        else:
+            candidates = None
+
+        # Scanning the whole text column in order beats gathering most of it by position
+        if candidates is None or len(candidates) > len(texts) // 2:
+            found = list(compress(range(len(texts)), map(contains, texts, repeat(query))))
+        else:
+            found = list(compress(candidates, map(contains, map(texts.__getitem__, candidates), repeat(query))))
+        self._last_query = query
+        self._last_matches = found
+        return found
+
+    def _candidates(self, query: str):
+        """Positions in the shortest posting list among the query's trigrams"""
+        shortest = None
+        for gram in _ngrams(query):
+            column = self._postings.get(gram)
+            if column is None:
+                return []
+            if shortest is None or len(column) < len(shortest):
+                shortest = column
+        return shortest
+
+    def search(self, query: str = "", private: Optional[bool] = None,
+               permission: Optional[str] = None) -> List[int]:
+        """
+        Positions matching a text query and visibility/permission filters
+
+        Args:
+            query: Substring to look for (see matches)
+            private: True for private only, False for public only, None for both
+            permission: Permission the user must hold (e.g. "admin"), or None
+
+        Returns:
+            Matching positions in list order
+        """
+        if private is None and permission is None:
+            return self.matches(query)
+        if not query.strip():
+            return self.repositories.select(private=private, permission=permission)
+        return self.repositories.select(private=private, permission=permission, positions=self.matches(query))
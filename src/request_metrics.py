@@ -0,0 +1,319 @@
+"""
+Per-request instrumentation for the GitHub API client
+GitHubAPIClient hands a RequestEvent to its before/after request hooks for
+every HTTP attempt; RequestMetrics is a collector built on those hooks that
+keeps latency histograms per endpoint, status counts, bytes transferred,
+retries, cache hits and the last reported rate-limit headroom, and exports
+them as OpenMetrics text or JSON.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+# Upper bounds (seconds) of the latency histogram buckets; +Inf is implied
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRIC_PREFIX = "github_client"
+STATUS_ERROR = "error"  # Status label of attempts that got no response
+
+# API paths that carry names or ids, collapsed so each endpoint is one series.
+# Matched at the end of the path, so a GitHub Enterprise prefix (/api/v3) is ignored.
+_ENDPOINTS = (
+    (re.compile(r"/repos/[^/]+/[^/]+/collaborators/[^/]+$"), "/repos/{owner}/{repo}/collaborators/{username}"),
+    (re.compile(r"/repos/[^/]+/[^/]+/collaborators$"), "/repos/{owner}/{repo}/collaborators"),
+    (re.compile(r"/repos/[^/]+/[^/]+/invitations/[^/]+$"), "/repos/{owner}/{repo}/invitations/{id}"),
+    (re.compile(r"/repos/[^/]+/[^/]+/invitations$"), "/repos/{owner}/{repo}/invitations"),
+    (re.compile(r"/repos/[^/]+/[^/]+$"), "/repos/{owner}/{repo}"),
+    (re.compile(r"/users/[^/]+$"), "/users/{username}"),
+    (re.compile(r"/user/repos$"), "/user/repos"),
+    (re.compile(r"/user$"), "/user"),
+    (re.compile(r"/rate_limit$"), "/rate_limit"),
+    (re.compile(r"/graphql$"), "/graphql"),
+)
+
+
+def endpoint_template(url: str) -> str:
+    """Collapse a request URL to its endpoint, e.g. /users/octocat -> /users/{username}"""
+    path = urlsplit(url).path.rstrip("/") or "/"
+    for pattern, template in _ENDPOINTS:
+        if pattern.search(path):
+            return template
+    return re.sub(r"/\d+(?=/|$)", "/{id}", path)
+
+
+class RequestEvent:
+    """
+    One HTTP attempt, as seen by the request hooks
+
+    Before-request hooks get the event with only the request fields set;
+    after-request hooks get the same event with the outcome filled in.
+    """
+
+    __slots__ = ("method", "url", "endpoint", "resource", "write", "attempt", "started",
+                 "elapsed", "status", "bytes_sent", "bytes_received", "throttled",
+                 "rate_limit_remaining", "error")
+
+    def __init__(self, method: str, url: str, resource: str, write: bool, attempt: int):
+        self.method = method.upper()
+        self.url = url
+        self.endpoint = endpoint_template(url)
+        self.resource = resource  # Rate-limit resource; replaced by the one GitHub reports
+        self.write = write
+        self.attempt = attempt  # 0 for the first try, then 1, 2, ... for throttled retries
+        self.started = time.perf_counter()
+        self.elapsed = None  # Seconds until the response (or error) arrived
+        self.status = None  # HTTP status, None if the request failed without a response
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.throttled = None  # Throttle reason when the attempt will be retried
+        self.rate_limit_remaining = None
+        self.error = None  # Exception raised by the transport
+
+    def complete(self, response=None, throttle: Optional[Tuple[float, str]] = None,
+                 error: Optional[BaseException] = None):
+        """Record the outcome of the attempt"""
+        self.elapsed = time.perf_counter() - self.started
+        self.error = error
+        if throttle is not None:
+            self.throttled = throttle[1]
+        if response is None:
+            return
+        self.status = response.status_code
+        body = getattr(response.request, "body", None)
+        self.bytes_sent = len(body) if isinstance(body, (bytes, str)) else 0
+        self.bytes_received = len(response.content or b"")
+        headers = response.headers
+        self.resource = headers.get("X-RateLimit-Resource") or self.resource
+        try:
+            self.rate_limit_remaining = int(headers["X-RateLimit-Remaining"])
+        except (KeyError, ValueError):
+            pass
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, buckets: int):
+        self.counts = [0] * buckets  # Per bucket, not cumulative
+        self.sum = 0.0
+        self.count = 0
+
+
+class RequestMetrics:
+    """
+    Thread-safe collector of request metrics
+
+    Attach it to a client (metrics.attach(client)) or pass observe() as an
+    after-request hook. A 304 answered from the response cache counts as a
+    cache hit; a throttled attempt that is retried counts as a retry.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        Args:
+            buckets: Ascending upper bounds of the latency histogram buckets in seconds
+        """
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._started = time.time()
+        self._latency: Dict[Tuple[str, str], _Histogram] = {}  # (method, endpoint) -> histogram
+        self._responses: Dict[Tuple[str, str, str], int] = {}  # (method, endpoint, status) -> count
+        self._bytes_sent: Dict[str, int] = {}  # endpoint -> bytes
+        self._bytes_received: Dict[str, int] = {}
+        self._retries: Dict[str, int] = {}  # throttle reason -> count
+        self._remaining: Dict[str, int] = {}  # rate-limit resource -> last reported remaining
+        self.cache_hits = 0
+
+    def attach(self, client) -> "RequestMetrics":
+        """Register this collector as an after-request hook of a GitHubAPIClient"""
+        client.add_request_hooks(after=self.observe)
+        return self
+
+    def observe(self, event: RequestEvent):
+        """Count one completed attempt"""
+        key = (event.method, event.endpoint)
+        status = STATUS_ERROR if event.status is None else str(event.status)
+        bucket = next((i for i, bound in enumerate(self.buckets) if event.elapsed <= bound), len(self.buckets))
+        with self._lock:
+            histogram = self._latency.get(key)
+            if histogram is None:
+                histogram = self._latency[key] = _Histogram(len(self.buckets) + 1)
+            histogram.counts[bucket] += 1
+            histogram.sum += event.elapsed
+            histogram.count += 1
+            self._responses[key + (status,)] = self._responses.get(key + (status,), 0) + 1
+            self._bytes_sent[event.endpoint] = self._bytes_sent.get(event.endpoint, 0) + event.bytes_sent
+            self._bytes_received[event.endpoint] = (self._bytes_received.get(event.endpoint, 0)
+                                                    + event.bytes_received)
+            if event.throttled:
+                self._retries[event.throttled] = self._retries.get(event.throttled, 0) + 1
+            if event.status == 304:
+                self.cache_hits += 1
+            if event.rate_limit_remaining is not None:
+                self._remaining[event.resource] = event.rate_limit_remaining
+
+    def reset(self):
+        """Forget everything counted so far"""
+        with self._lock:
+            self._started = time.time()
+            for series in (self._latency, self._responses, self._bytes_sent, self._bytes_received,
+                           self._retries, self._remaining):
+                series.clear()
+            self.cache_hits = 0
+
+    def _quantile(self, counts, total: int, fraction: float) -> float:
+        """Upper bound of the bucket holding the given quantile (the last bound for +Inf)"""
+        rank = total * fraction
+        seen = 0
+        for bound, count in zip(self.buckets + (self.buckets[-1],), counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.buckets[-1]
+
+    def summary(self) -> Dict:
+        """
+        Totals across all endpoints, for a status line
+
+        Returns:
+            Dictionary with requests, errors (4xx/5xx and failed attempts), retries,
+            cache_hits, bytes_sent, bytes_received, p50 and p95 latency (seconds,
+            histogram bucket bounds) and rate_limit_remaining per resource
+        """
+        with self._lock:
+            counts = [0] * (len(self.buckets) + 1)
+            for histogram in self._latency.values():
+                counts = [a + b for a, b in zip(counts, histogram.counts)]
+            requests_sent = sum(counts)
+            return {
+                "requests": requests_sent,
+                "errors": sum(count for (_, _, status), count in self._responses.items()
+                              if status == STATUS_ERROR or int(status) >= 400),
+                "retries": sum(self._retries.values()),
+                "cache_hits": self.cache_hits,
+                "bytes_sent": sum(self._bytes_sent.values()),
+                "bytes_received": sum(self._bytes_received.values()),
+                "p50": self._quantile(counts, requests_sent, 0.50) if requests_sent else None,
+                "p95": self._quantile(counts, requests_sent, 0.95) if requests_sent else None,
+                "rate_limit_remaining": dict(self._remaining),
+            }
+
+    def status_line(self) -> str:
+        """One-line summary for a status bar, e.g. "API: 120 requests · p95 ≤250 ms · 4,870 core left" """
+        summary = self.summary()
+        if not summary["requests"]:
+            return ""
+        parts = [f"API: {summary['requests']} requests", f"p95 ≤{summary['p95'] * 1000:.0f} ms"]
+        for label in ("errors", "retries", "cache_hits"):
+            if summary[label]:
+                parts.append(f"{summary[label]} {label.replace('_', ' ')}")
+        for resource, remaining in sorted(summary["rate_limit_remaining"].items()):
+            parts.append(f"{remaining:,} {resource} left")
+        return " · ".join(parts)
+
+    def snapshot(self) -> Dict:
+        """
+        Every series, in a JSON-friendly form
+
+        Returns:
+            Dictionary with the summary totals, bucket bounds and one entry per
+            (method, endpoint) with its latency histogram, statuses and bytes
+        """
+        summary = self.summary()
+        with self._lock:
+            endpoints = []
+            for (method, endpoint), histogram in sorted(self._latency.items()):
+                endpoints.append({
+                    "method": method,
+                    "endpoint": endpoint,
+                    "count": histogram.count,
+                    "seconds": round(histogram.sum, 6),
+                    "buckets": list(histogram.counts),
+                    "statuses": {status: count for (m, e, status), count in sorted(self._responses.items())
+                                 if (m, e) == (method, endpoint)},
+                })
+            return {
+                "started_at": self._started,
+                "buckets": list(self.buckets),
+                "summary": summary,
+                "endpoints": endpoints,
+                "bytes_sent": dict(self._bytes_sent),
+                "bytes_received": dict(self._bytes_received),
+                "retries": dict(self._retries),
+            }
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=2, sort_keys=True)
+
+    def to_openmetrics(self) -> str:
+        """Render every series in the OpenMetrics text format (readable by Prometheus)"""
+        name = METRIC_PREFIX
+        lines = []
+        with self._lock:
+            lines.append(f"# TYPE {name}_request_duration_seconds histogram")
+            lines.append(f"# UNIT {name}_request_duration_seconds seconds")
+            lines.append(f"# HELP {name}_request_duration_seconds Time until the response headers and body arrived.")
+            for (method, endpoint), histogram in sorted(self._latency.items()):
+                labels = _labels(method=method, endpoint=endpoint)
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float("inf"),), histogram.counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f"{name}_request_duration_seconds_bucket{{{labels},le=\"{le}\"}} {cumulative}")
+                lines.append(f"{name}_request_duration_seconds_sum{{{labels}}} {histogram.sum:.6f}")
+                lines.append(f"{name}_request_duration_seconds_count{{{labels}}} {histogram.count}")
+
+            lines.append(f"# TYPE {name}_responses counter")
+            lines.append(f"# HELP {name}_responses HTTP attempts by status ({STATUS_ERROR}: no response).")
+            for (method, endpoint, status), count in sorted(self._responses.items()):
+                lines.append(f"{name}_responses_total{{{_labels(method=method, endpoint=endpoint, status=status)}}} "
+                             f"{count}")
+
+            for direction, totals in (("sent", self._bytes_sent), ("received", self._bytes_received)):
+                lines.append(f"# TYPE {name}_{direction}_bytes counter")
+                lines.append(f"# UNIT {name}_{direction}_bytes bytes")
+                lines.append(f"# HELP {name}_{direction}_bytes Body bytes {direction}.")
+                for endpoint, count in sorted(totals.items()):
+                    lines.append(f"{name}_{direction}_bytes_total{{{_labels(endpoint=endpoint)}}} {count}")
+
+            lines.append(f"# TYPE {name}_retries counter")
+            lines.append(f"# HELP {name}_retries Throttled attempts that were retried, by reason.")
+            for reason, count in sorted(self._retries.items()):
+                lines.append(f"{name}_retries_total{{{_labels(reason=reason)}}} {count}")
+
+            lines.append(f"# TYPE {name}_cache_hits counter")
+            lines.append(f"# HELP {name}_cache_hits Conditional requests answered with 304 Not Modified.")
+            lines.append(f"{name}_cache_hits_total {self.cache_hits}")
+
+            lines.append(f"# TYPE {name}_rate_limit_remaining gauge")
+            lines.append(f"# HELP {name}_rate_limit_remaining Primary budget left, as last reported by GitHub.")
+            for resource, remaining in sorted(self._remaining.items()):
+                lines.append(f"{name}_rate_limit_remaining{{{_labels(resource=resource)}}} {remaining}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str):
+        """
+        Write the metrics to a file, replacing it atomically
+
+        Args:
+            path: Target file; JSON if it ends in .json, OpenMetrics text otherwise
+        """
+        text = self.to_json() + "\n" if path.lower().endswith(".json") else self.to_openmetrics()
+        temporary = f"{path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as handle:
+            handle.write(text)
+        os.replace(temporary, path)
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
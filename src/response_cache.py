@@ -0,0 +1,233 @@
+"""
+Caches for GitHub API responses
+ResponseCache stores ETag / Last-Modified validators with response bodies so
+repeated GETs can be revalidated with a 304, which does not count against the
+rate limit. TTLCache keeps small lookup results (e.g. username checks) for a
+fixed time.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Headers worth replaying on a cache hit (pagination and validators)
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Link")
+
+
+class CachedResponse:
+    """Validators and body of a cached 200 response"""
+
+    __slots__ = ("etag", "last_modified", "content", "headers")
+
+    def __init__(self, etag: Optional[str], last_modified: Optional[str], content: bytes, headers: Dict[str, str]):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content = content
+        self.headers = headers
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers that turn a GET into a conditional request"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, url: str) -> requests.Response:
+        """Rebuild a 200 response from the cached body"""
+        response = requests.Response()
+        response.status_code = 200
+        response._content = self.content
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.url = url
+        response.encoding = "utf-8"
+        response.from_cache = True
+        return response
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of GET responses keyed by token identity and URL
+
+    Capped both by entry count and by total body size; the least recently
+    used entries are evicted first.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of cached bodies
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(token: Optional[str], url: str, params: Optional[Dict] = None) -> Tuple[str, str]:
+        """
+        Build a cache key without keeping the raw token in memory
+
+        Args:
+            token: Token the request is sent with (responses differ per identity)
+            url: Request URL
+            params: Query parameters
+
+        Returns:
+            Hashable cache key
+        """
+        identity = hashlib.sha256((token or "").encode("utf-8")).hexdigest()[:16]
+        query = "&".join(f"{name}={value}" for name, value in sorted((params or {}).items()))
+        return identity, f"{url}?{query}" if query else url
+
+    def get(self, key) -> Optional[CachedResponse]:
+        """Return the cached entry for a key and mark it recently used"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def store(self, key, response: requests.Response):
+        """
+        Cache a 200 response if it carries a validator
+
+        Args:
+            key: Key from make_key()
+            response: Response to cache
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not (etag or last_modified) or len(response.content) > self.max_bytes:
+            return
+
+        headers = {name: response.headers[name] for name in _KEPT_HEADERS if name in response.headers}
+        entry = CachedResponse(etag, last_modified, response.content, headers)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old.content)
+            self._entries[key] = entry
+            self._size += len(entry.content)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.content)
+                self.evictions += 1
+
+    def record(self, hit: bool):
+        """Count a conditional request as a 304 hit or a full download"""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def clear(self):
+        """Drop every cached response"""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> Dict:
+        """
+        Snapshot of cache counters
+
+        Returns:
+            Dictionary with hits, misses, hit_rate, evictions, entries and bytes
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._size,
+            }
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a per-entry time to live
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            max_entries: Maximum number of entries before the least recently used is evicted
+            clock: Time source, replaceable in tests
+        """
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the live value for a key, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key: Hashable, value: Any, ttl: float):
+        """
+        Store a value
+
+        Args:
+            key: Cache key
+            value: Value to store (None cannot be told apart from a miss)
+            ttl: Seconds until the entry expires
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (self._clock() + ttl, value)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        """
+        Snapshot of cache counters
+
+        Returns:
+            Dictionary with hits, misses, hit_rate, evictions and entries
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+            }
@@ -0,0 +1,92 @@
+"""
+Selection model
+A set of checked row indices kept as the bits of one Python integer, so
+selecting, clearing or inverting every row is a single integer operation
+and no Tk variable is touched until a row is drawn.
+"""
+
+from itertools import compress
+from typing import Iterable, List
+
+
+_ASCII_BITS = bytes.maketrans(b"\x00\x01", b"01")
+_BYTE_BITS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def bits_from_mask(mask: bytes) -> int:
+    """Bitset with bit i set where mask[i] is 1 (mask holds only 0 and 1 bytes)"""
+    if not mask:
+        return 0
+    return int(mask[::-1].translate(_ASCII_BITS), 2)
+
+
+def mask_from_bits(bits: int, size: int) -> bytes:
+    """Inverse of bits_from_mask: one 0/1 byte per index below `size`"""
+    digits = bin(bits)[:1:-1].encode().translate(_BYTE_BITS)
+    return digits[:size] + bytes(max(0, size - len(digits)))
+
+
+class Selection:
+    """
+    Set of indices in range(size) stored as a bitset
+
+    Bulk operations (select_all, clear, invert, and union with a mask or a
+    list of positions) run in C over the integer's bits rather than in a
+    Python loop per index.
+    """
+
+    __slots__ = ("size", "bits")
+
+    def __init__(self, size: int = 0):
+        """
+        Args:
+            size: Number of selectable indices
+        """
+        self.size = size
+        self.bits = 0
+
+    def __len__(self) -> int:
+        return bin(self.bits).count("1")
+
+    def __contains__(self, index: int) -> bool:
+        return bool(self.bits >> index & 1)
+
+    def __iter__(self):
+        return iter(self.positions())
+
+    def resize(self, size: int):
+        """Change the number of indices; indices at or beyond the new size are deselected"""
+        if size < self.size:
+            self.bits &= (1 << size) - 1
+        self.size = size
+
+    def set(self, index: int, selected: bool):
+        """Select or deselect one index"""
+        if selected:
+            self.bits |= 1 << index
+        else:
+            self.bits &= ~(1 << index)
+
+    def select_all(self):
+        self.bits = (1 << self.size) - 1
+
+    def clear(self):
+        self.bits = 0
+
+    def invert(self):
+        self.bits ^= (1 << self.size) - 1
+
+    def add_mask(self, mask: bytes):
+        """Select every index whose byte in `mask` is 1"""
+        self.bits |= bits_from_mask(mask)
+
+    def add_positions(self, positions: Iterable[int]):
+        """Select every index in `positions`"""
+        mask = bytearray(self.size)
+        for index in positions:
+            mask[index] = 1
+        self.add_mask(mask)
+
+    def positions(self) -> List[int]:
+        """Selected indices in ascending order"""
+        return list(compress(range(self.size), mask_from_bits(self.bits, self.size)))
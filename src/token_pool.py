@@ -0,0 +1,138 @@
+"""
+Pool of Personal Access Tokens for aggregate rate-limit capacity
+Each token keeps its own RateLimitGovernor, so every token's primary budget,
+write pacing and secondary-limit pauses are tracked separately. Reads go to
+the token that can send soonest with the most budget left; writes go to the
+best-placed of the tokens that have admin on the target repository; a revoked
+token is dropped.
+"""
+
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from rate_limit import RESOURCE_CORE, RateLimitGovernor
+
+
+def auth_headers(token: str) -> Dict[str, str]:
+    """Request headers that authenticate as the given token"""
+    return {
+        "Authorization": f"token {token}",
+        "Accept": "application/vnd.github.v3+json",
+        "User-Agent": "GitHub-Collaborator-Manager"
+    }
+
+
+class PooledToken:
+    """One token of a pool with its own governor"""
+
+    __slots__ = ("token", "headers", "governor", "user", "revoked")
+
+    def __init__(self, token: str, governor: RateLimitGovernor):
+        self.token = token
+        self.headers = auth_headers(token)
+        self.governor = governor
+        self.user = None  # GET /user answer, set once the token authenticated
+        self.revoked = False
+
+    @property
+    def login(self) -> Optional[str]:
+        return self.user["login"] if self.user else None
+
+
+class TokenPool:
+    """
+    Thread-safe set of authenticated tokens
+
+    The first token that has not been revoked is the primary one: it
+    identifies the account, and requests about "the authenticated user"
+    (/user, GraphQL viewer queries) always use it.
+    """
+
+    def __init__(self, entries: List[PooledToken]):
+        """
+        Args:
+            entries: Authenticated tokens, primary first
+        """
+        self.entries = list(entries)
+        self._admins: Dict[str, List[PooledToken]] = {}  # Repository full name -> tokens with admin on it
+        self._lock = threading.Lock()
+
+    @property
+    def primary(self) -> PooledToken:
+        """First active token (the first token if every one was revoked)"""
+        return next((entry for entry in self.entries if not entry.revoked), self.entries[0])
+
+    def active(self) -> List[PooledToken]:
+        """Tokens that have not been revoked"""
+        return [entry for entry in self.entries if not entry.revoked]
+
+    def rank(self, write: bool = False, resource: str = RESOURCE_CORE,
+             candidates: Optional[Iterable[PooledToken]] = None) -> List[PooledToken]:
+        """
+        Order usable tokens by preference: shortest wait first, then most budget left
+
+        A token whose budget is unknown (nothing sent yet) counts as having the most left.
+
+        Args:
+            write: Rank for a write, which also considers each token's write pacing
+            resource: Rate-limit resource of the request
+            candidates: Tokens to consider (defaults to every active token)
+        """
+        entries = [entry for entry in (self.entries if candidates is None else candidates) if not entry.revoked]
+
+        def preference(entry):
+            remaining = entry.governor.remaining_for(resource)
+            return (entry.governor.required_wait(write, resource),
+                    -(float("inf") if remaining is None else remaining))
+
+        return sorted(entries, key=preference)
+
+    def select(self, write: bool = False, resource: str = RESOURCE_CORE) -> Optional[PooledToken]:
+        """The preferred active token, or None if every token was revoked"""
+        ranked = self.rank(write, resource)
+        return ranked[0] if ranked else None
+
+    def revoke(self, entry: PooledToken):
+        """Stop using a token that GitHub rejected"""
+        with self._lock:
+            entry.revoked = True
+            for admins in self._admins.values():
+                if entry in admins:
+                    admins.remove(entry)
+
+    def admins_for(self, repository: str) -> Optional[List[PooledToken]]:
+        """Active tokens with admin on a repository, or None if the repository was not checked yet"""
+        with self._lock:
+            admins = self._admins.get(repository)
+            return None if admins is None else [entry for entry in admins if not entry.revoked]
+
+    def set_admins(self, repository: str, entries: List[PooledToken]):
+        """Remember which tokens have admin on a repository (an empty list: none has)"""
+        with self._lock:
+            self._admins[repository] = list(entries)
+
+    def stats(self) -> List[Dict]:
+        """
+        Per-token counters
+
+        Returns:
+            List of dictionaries with login, revoked, core remaining and limit, requests sent
+            and repositories the token is known to have admin on
+        """
+        with self._lock:
+            sticky = {}
+            for admins in self._admins.values():
+                for entry in admins:
+                    sticky[id(entry)] = sticky.get(id(entry), 0) + 1
+        result = []
+        for entry in self.entries:
+            governor = entry.governor.stats()
+            result.append({
+                "login": entry.login,
+                "revoked": entry.revoked,
+                "remaining": governor["remaining"],
+                "limit": governor["limit"],
+                "requests": governor["requests"],
+                "admin_repositories": sticky.get(id(entry), 0),
+            })
+        return result
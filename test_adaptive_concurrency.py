@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Tests for the adaptive (AIMD) concurrency limit
+Unit tests use a fake clock; integration tests run against a local mock server
+"""
+
+import sys
+import os
+import io
+import tempfile
+import threading
+import unittest
+from contextlib import ExitStack
+from unittest.mock import patch
+
+# Add src and benchmarks directories to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, 'src'))
+sys.path.insert(0, os.path.join(current_dir, 'benchmarks'))
+
+import cli
+from adaptive_concurrency import AdaptiveConcurrency
+from github_client import GitHubAPIClient
+from rate_limit import RateLimitGovernor
+from request_metrics import RequestEvent
+from mock_github_server import MockGitHubServer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestAdaptiveConcurrency(unittest.TestCase):
+    """Test limit changes from synthetic write events"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def make_controller(self, **kwargs):
+        return AdaptiveConcurrency(clock=self.clock, **kwargs)
+
+    def event(self, status=201, elapsed=0.1, throttled=None, write=True, started=None):
+        event = RequestEvent("PUT" if write else "GET", "https://api.github.com/repos/o/r/collaborators/u",
+                             "core", write, 0)
+        event.started = self.clock.now if started is None else started
+        event.elapsed = elapsed
+        event.status = status
+        event.throttled = throttled
+        self.clock.now += 1
+        return event
+
+    def busy(self, controller, stack):
+        """Hold every slot, as a saturated bulk job does"""
+        for _ in range(controller.limit):
+            stack.enter_context(controller.slot())
+
+    def test_additive_increase_while_saturated(self):
+        controller = self.make_controller(initial=2, maximum=4)
+        with ExitStack() as stack:
+            self.busy(controller, stack)
+            for _ in range(2):
+                controller.observe(self.event())
+        self.assertEqual(controller.limit, 3)
+        with ExitStack() as stack:
+            self.busy(controller, stack)
+            for _ in range(20):
+                controller.observe(self.event())
+        self.assertEqual(controller.limit, 4)
+
+    def test_idle_limit_does_not_grow(self):
+        controller = self.make_controller(initial=4)
+        for _ in range(20):
+            controller.observe(self.event())
+        self.assertEqual(controller.limit, 4)
+
+    def test_multiplicative_decrease_once_per_round_trip(self):
+        controller = self.make_controller(initial=8)
+        before = self.clock.now
+        controller.observe(self.event(status=403, throttled="secondary"))
+        self.assertEqual(controller.limit, 4)
+        # Sent before the decrease: the same congestion, already handled
+        controller.observe(self.event(status=429, throttled="retry_after", started=before))
+        self.assertEqual(controller.limit, 4)
+        controller.observe(self.event(status=429, throttled="retry_after"))
+        controller.observe(self.event(status=502))
+        controller.observe(self.event(status=502))
+        self.assertEqual(controller.limit, 1)
+        self.assertEqual(controller.stats()["changes"], {"throttled": 2, "server_error": 2})
+
+    def test_primary_exhaustion_and_reads_are_ignored(self):
+        controller = self.make_controller(initial=8)
+        controller.observe(self.event(status=403, throttled="primary"))
+        controller.observe(self.event(status=500, write=False))
+        controller.observe(self.event(status=403))  # No admin rights
+        self.assertEqual(controller.limit, 8)
+
+    def test_latency_spike_backs_off(self):
+        controller = self.make_controller(initial=8, latency_floor=0.5)
+        for _ in range(5):
+            controller.observe(self.event(elapsed=0.2))
+        controller.observe(self.event(elapsed=0.55))
+        self.assertEqual(controller.limit, 8)
+        controller.observe(self.event(elapsed=0.9))
+        self.assertEqual(controller.limit, 4)
+        self.assertAlmostEqual(controller.usual_latency, 0.2 + 0.1 * (0.55 - 0.2))
+
+    def test_history(self):
+        controller = self.make_controller(initial=8)
+        self.clock.now += 1.5  # Plus the second the event takes
+        controller.observe(self.event(status=403, throttled="secondary"))
+        self.assertEqual(controller.history(), [(0.0, 8, "start"), (2.5, 4, "throttled")])
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "limit.csv")
+            controller.write_history(path)
+            with open(path, encoding="utf-8") as file:
+                self.assertEqual(file.read(), "seconds,limit,reason\n0.000,8,start\n2.500,4,throttled\n")
+
+    def test_slot_waits_for_limit(self):
+        controller = self.make_controller(initial=1)
+        entered = threading.Event()
+
+        def worker():
+            with controller.slot():
+                entered.set()
+
+        with controller.slot():
+            thread = threading.Thread(target=worker)
+            thread.start()
+            self.assertFalse(entered.wait(0.1))
+        thread.join(5)
+        self.assertTrue(entered.is_set())
+        self.assertEqual(controller.in_flight, 0)
+
+
+class TestAdaptiveBulkAdd(unittest.TestCase):
+    """Test bulk adds under an adaptive limit against the mock server"""
+
+    def make_client(self, server):
+        return GitHubAPIClient(server.base_url, prewarm_connections=0, pool_size=16,
+                               governor=RateLimitGovernor(writes_per_minute=0, writes_per_hour=0))
+
+    def test_in_flight_writes_stay_under_limit(self):
+        """Secondary limits cut the limit and in-flight writes never pass the ceiling"""
+        with MockGitHubServer(latency=0.01, secondary_every=25, retry_after="0") as server:
+            with self.make_client(server) as client:
+                controller = AdaptiveConcurrency(initial=8, maximum=64).attach(client)
+                in_flight = []
+                client.add_request_hooks(before=lambda event: in_flight.append(controller.in_flight))
+                client.authenticate("mock-token")
+                results = client.add_collaborators_matrix([f"mock-user/repo-{i}" for i in range(100)], ["octocat"])
+
+        self.assertEqual(results.summary()["succeeded"], 100)
+        self.assertEqual(controller.maximum, 16)
+        self.assertLessEqual(max(in_flight), 16)
+        self.assertGreaterEqual(controller.stats()["changes"].get("throttled", 0), 1)
+        self.assertIn("throttled", [reason for _, _, reason in controller.history()])
+
+    def test_limit_grows_when_healthy(self):
+        with MockGitHubServer(latency=0.005) as server:
+            with self.make_client(server) as client:
+                controller = AdaptiveConcurrency(initial=2, maximum=8).attach(client)
+                client.authenticate("mock-token")
+                results = client.add_collaborators_bulk([f"mock-user/repo-{i}" for i in range(200)], "octocat")
+                pairs = list(client.iter_add_pairs((f"mock-user/x-{i}", "octocat") for i in range(20)))
+
+        self.assertTrue(all(success for _, success, _ in results))
+        self.assertEqual(len(pairs), 20)
+        self.assertGreater(controller.limit, 2)
+        self.assertEqual(controller.in_flight, 0)
+
+    def test_cli_writes_concurrency_log(self):
+        with MockGitHubServer() as server, tempfile.TemporaryDirectory() as directory:
+            log = os.path.join(directory, "limit.csv")
+            with patch.dict(os.environ, {"GITHUB_TOKEN": "mock-token"}), \
+                    patch("sys.stdin", io.StringIO("octocat,mock-user/a\noctocat,mock-user/b\n")):
+                code = cli.main(["--base-url", server.base_url, "--adaptive", "--concurrency-log", log,
+                                 "add", "-"], out=io.StringIO(), err=io.StringIO())
+            with open(log, encoding="utf-8") as file:
+                lines = file.read().splitlines()
+
+        self.assertEqual(code, cli.EXIT_OK)
+        self.assertEqual(lines[:2], ["seconds,limit,reason", "0.000,4,start"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for the asyncio client and its synchronous facade
+Runs against a local mock server; skipped when aiohttp is not installed
+"""
+
+import sys
+import os
+import time
+import unittest
+from importlib.util import find_spec
+
+# Add src and benchmarks directories to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, 'src'))
+sys.path.insert(0, os.path.join(current_dir, 'benchmarks'))
+
+from mock_github_server import MockGitHubServer
+from rate_limit import RateLimitGovernor
+from request_metrics import RequestMetrics
+
+HAVE_AIOHTTP = find_spec("aiohttp") is not None
+if HAVE_AIOHTTP:
+    from async_client import AsyncGitHubAPIClient, BlockingGitHubClient
+
+
+@unittest.skipUnless(HAVE_AIOHTTP, "aiohttp is not installed")
+class TestAsyncClient(unittest.IsolatedAsyncioTestCase):
+    """Test the coroutine API against the mock server"""
+
+    def setUp(self):
+        self.server = MockGitHubServer(repo_count=450, known_users=["octocat", "hubot"])
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def make_client(self, **kwargs):
+        governor = RateLimitGovernor(writes_per_minute=0, writes_per_hour=0)
+        return AsyncGitHubAPIClient(self.server.base_url, governor=governor, **kwargs)
+
+    async def test_authenticate_and_list(self):
+        async with self.make_client() as client:
+            self.assertEqual(await client.authenticate("mock-token"), (True, "Successfully authenticated as mock-user"))
+            success, repos, message = await client.get_user_repositories()
+            self.assertTrue(success, message)
+            self.assertEqual(len(repos), 450)
+            self.assertEqual(repos[0]["full_name"], "mock-user/repo-000000")
+
+            # The second listing revalidates every page through the ETag cache
+            await client.get_user_repositories()
+            self.assertEqual(self.server.not_modified_count, 5)
+
+    async def test_verify_usernames(self):
+        async with self.make_client() as client:
+            await client.authenticate("mock-token")
+            results = await client.verify_usernames(["octocat", "ghost", "Octocat", "hubot"])
+            self.assertEqual([(name, exists) for name, exists, _ in results],
+                             [("octocat", True), ("ghost", False), ("hubot", True)])
+            self.assertEqual(await client.verify_username(" "), (False, "Username cannot be empty"))
+
+    async def test_bulk_add_runs_concurrently(self):
+        self.server.latency = 0.05
+        repos = [f"mock-user/repo-{i}" for i in range(200)] + ["mock-user/missing-repo"]
+        streamed = []
+        async with self.make_client() as client:
+            metrics = RequestMetrics().attach(client)
+            await client.authenticate("mock-token")
+            start = time.perf_counter()
+            results = await client.add_collaborators_bulk(repos, "octocat", on_result=streamed.append)
+            elapsed = time.perf_counter() - start
+
+        self.assertEqual([repo for repo, _, _ in results], repos)
+        self.assertEqual(sum(1 for _, success, _ in results if success), 200)
+        self.assertIn("not found", results[-1][2])
+        self.assertEqual(len(streamed), len(repos))
+        # 201 writes one after another would take 10 s
+        self.assertLess(elapsed, 3.0)
+        self.assertEqual(metrics.summary()["requests"], 202)
+
+    async def test_concurrency_is_bounded(self):
+        """No more than max_concurrency requests are sent or admitted by the governor at once"""
+        self.server.latency = 0.02
+        in_flight, peak = [0], [0]
+
+        def before(event):
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+
+        def after(event):
+            in_flight[0] -= 1
+
+        async with self.make_client(max_concurrency=5) as client:
+            client.add_request_hooks(before=before, after=after)
+            await client.authenticate("mock-token")
+            results = await client.add_collaborators_bulk([f"mock-user/repo-{i}" for i in range(40)], "octocat")
+
+        self.assertEqual(len(results), 40)
+        self.assertEqual(peak[0], 5)
+        self.assertEqual(self.server.write_count, 40)
+
+    async def test_throttled_write_is_retried(self):
+        self.server.secondary_every = 3
+        self.server.retry_after = "0"
+        async with self.make_client() as client:
+            await client.authenticate("mock-token")
+            results = await client.add_collaborators_bulk([f"mock-user/repo-{i}" for i in range(6)], "octocat")
+        self.assertTrue(all(success for _, success, _ in results), results)
+        self.assertGreater(self.server.throttled_count, 0)
+
+    async def test_network_error(self):
+        async with AsyncGitHubAPIClient("http://127.0.0.1:9") as client:
+            success, message = await client.authenticate("mock-token")
+        self.assertFalse(success)
+        self.assertIn("Network error", message)
+
+
+@unittest.skipUnless(HAVE_AIOHTTP, "aiohttp is not installed")
+class TestBlockingFacade(unittest.TestCase):
+    """Test the synchronous facade used from threads"""
+
+    def test_facade_matches_threaded_client(self):
+        with MockGitHubServer(repo_count=3) as server:
+            governor = RateLimitGovernor(writes_per_minute=0, writes_per_hour=0)
+            with BlockingGitHubClient(server.base_url, governor=governor) as client:
+                self.assertTrue(client.authenticate("mock-token")[0])
+                self.assertEqual(len(client.get_user_repositories()[1]), 3)
+                self.assertEqual(client.verify_username("octocat"), (True, "User 'octocat' found: Octocat"))
+                self.assertEqual(client.add_collaborator("mock-user/repo-0", "octocat"),
+                                 (True, "Successfully added octocat as collaborator to mock-user/repo-0"))
+                self.assertEqual(len(client.add_collaborators_bulk(["mock-user/a", "mock-user/b"], "octocat")), 2)
+            self.assertEqual(server.write_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
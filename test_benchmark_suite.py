@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for the offline benchmark suite and the mock server's simulation knobs
+"""
+
+import sys
+import os
+import io
+import json
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+# Add src and benchmarks directories to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, 'src'))
+sys.path.insert(0, os.path.join(current_dir, 'benchmarks'))
+
+import run_benchmarks
+from github_client import GitHubAPIClient
+from mock_github_server import MockGitHubServer
+from rate_limit import RateLimitGovernor
+
+
+class TestRegressionCheck(unittest.TestCase):
+    """Test percentiles and the baseline comparison"""
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(run_benchmarks.percentile(values, 0.50), 50)
+        self.assertEqual(run_benchmarks.percentile(values, 0.99), 99)
+        self.assertEqual(run_benchmarks.percentile([], 0.95), 0.0)
+
+    def test_compare(self):
+        baseline = {"throughput": 100.0, "p95_ms": 10.0, "requests": 50, "ok": 40}
+        within = {"throughput": 80.0, "p95_ms": 12.0, "requests": 50, "ok": 40}
+        self.assertEqual(run_benchmarks.compare({"bulk_add": within}, {"bulk_add": baseline}, 0.25), [])
+
+        worse = {"throughput": 70.0, "p95_ms": 20.0, "requests": 60, "ok": 39}
+        self.assertEqual(len(run_benchmarks.compare({"bulk_add": worse}, {"bulk_add": baseline}, 0.25)), 2)
+        self.assertEqual(len(run_benchmarks.compare({"bulk_add": worse}, {"bulk_add": baseline}, 0.25,
+                                                    timing=True)), 4)
+        self.assertEqual(run_benchmarks.compare({"listing": worse}, {"bulk_add": baseline}, 0.25), [])
+
+    def test_small_run_saves_and_checks_baseline(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, "baselines.json")
+            argv = ["--repos", "250", "--users", "10", "--adds", "20", "--latency", "0", "--jitter", "0",
+                    "--per-page", "50", "--baseline", path]
+            with redirect_stdout(io.StringIO()):
+                self.assertEqual(run_benchmarks.main(argv + ["--save-baseline"]), 0)
+            with open(path) as handle:
+                stored = json.load(handle)
+            (results,) = stored.values()
+            self.assertEqual(results["listing"]["requests"], 5)
+            self.assertEqual(results["verification"]["ok"], 5)
+            self.assertEqual(results["throttled_add"]["ok"], 5)
+
+            # A baseline that needed fewer requests turns the run into a failure
+            results["listing"]["requests"] = 4
+            with open(path, "w") as handle:
+                json.dump(stored, handle)
+            with redirect_stdout(io.StringIO()) as output:
+                self.assertEqual(run_benchmarks.main(argv + ["--only", "listing"]), 1)
+            self.assertIn("REGRESSION listing: 5 requests", output.getvalue())
+        finally:
+            shutil.rmtree(directory)
+
+
+class TestMockErrorMix(unittest.TestCase):
+    """Test the mock server's 403/422 mix"""
+
+    def test_error_mix_is_stable_per_repository(self):
+        with MockGitHubServer(forbidden_rate=0.2, unprocessable_rate=0.1) as server:
+            with GitHubAPIClient(server.base_url, prewarm_connections=0,
+                                 governor=RateLimitGovernor(writes_per_minute=0, writes_per_hour=0)) as client:
+                client.authenticate("mock-token")
+                repos = [f"mock-user/repo-{i}" for i in range(200)]
+                first = client.add_collaborators_bulk(repos, "octocat")
+                second = client.add_collaborators_bulk(repos, "octocat")
+
+        failures = [repo for repo, success, _ in first if not success]
+        self.assertEqual(failures, [repo for repo, success, _ in second if not success])
+        self.assertTrue(30 <= len(failures) <= 90, len(failures))
+        self.assertTrue(any("Permission denied" in message for _, _, message in first))
+        self.assertTrue(any("Cannot add" in message for _, _, message in first))
+
+
+if __name__ == "__main__":
+    unittest.main()
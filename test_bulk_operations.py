@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tests for bulk collaborator operations in the GitHub API client
+Runs against a local mock server, no token or network access required
+"""
+
+import sys
+import os
+import time
+import unittest
+
+# Add src and benchmarks directories to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, 'src'))
+sys.path.insert(0, os.path.join(current_dir, 'benchmarks'))
+
+from github_client import GitHubAPIClient
+from mock_github_server import MockGitHubServer
+
+
+class TestConcurrentBulkAdd(unittest.TestCase):
+    """Test bounded-concurrency add_collaborators_bulk"""
+
+    def setUp(self):
+        self.server = MockGitHubServer(latency=0.05)
+        self.server.start()
+        self.client = GitHubAPIClient(self.server.base_url, prewarm_connections=0)
+        self.client.authenticate("mock-token")
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_results_keep_input_order(self):
+        """Results come back in repository order with per-repo outcomes"""
+        repos = [f"mock-user/{'missing-' if i % 5 == 0 else ''}repo-{i}" for i in range(20)]
+        results = self.client.add_collaborators_bulk(repos, "octocat", max_workers=8)
+
+        self.assertEqual([repo for repo, _, _ in results], repos)
+        for repo, success, message in results:
+            self.assertEqual(success, "missing-" not in repo, message)
+
+    def test_concurrency_reduces_wall_clock_time(self):
+        """Eight workers finish 24 requests in a fraction of the serial time"""
+        repos = [f"mock-user/repo-{i}" for i in range(24)]
+        start = time.perf_counter()
+        results = self.client.add_collaborators_bulk(repos, "octocat", max_workers=8)
+        elapsed = time.perf_counter() - start
+
+        self.assertTrue(all(success for _, success, _ in results))
+        # Serial would take at least 24 * 50 ms = 1.2 s
+        self.assertLess(elapsed, 0.8)
+
+    def test_single_worker_is_sequential(self):
+        """max_workers=1 keeps the original one-at-a-time behaviour"""
+        results = self.client.add_collaborators_bulk(["mock-user/a", "mock-user/b"], "octocat", max_workers=1)
+        self.assertEqual([(repo, success) for repo, success, _ in results],
+                         [("mock-user/a", True), ("mock-user/b", True)])
+        self.assertEqual(self.client.add_collaborators_bulk([], "octocat"), [])
+
+    def test_results_stream_as_they_complete(self):
+        """on_result sees every result before the call returns"""
+        repos = [f"mock-user/repo-{i}" for i in range(12)]
+        streamed = []
+        results = self.client.add_collaborators_bulk(repos, "octocat", max_workers=4, on_result=streamed.append)
+        self.assertEqual(sorted(streamed), sorted(results))
+        self.assertEqual(len(streamed), 12)
+
+    def test_closing_iterator_cancels_remaining(self):
+        """Stopping iter_add_collaborators early skips requests that have not started"""
+        repos = [f"mock-user/repo-{i}" for i in range(40)]
+        results = self.client.iter_add_collaborators(repos, "octocat", max_workers=2)
+        first = next(results)
+        results.close()
+        self.assertTrue(first[1])
+        self.assertLess(self.server.write_count, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
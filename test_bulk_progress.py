@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Tests for bulk-run progress, throughput and ETA estimates
+"""
+
+import sys
+import os
+import unittest
+
+# Add src directory to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, 'src'))
+
+from bulk_progress import BulkProgress, format_duration
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestBulkProgress(unittest.TestCase):
+    """Test counts and estimates with a fake clock"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.progress = BulkProgress(100, rate_window=10, clock=self.clock)
+
+    def test_rate_and_eta(self):
+        """Throughput comes from recent completions; ETA divides the remainder by it"""
+        for _ in range(20):
+            self.clock.now += 0.25
+            self.progress.record(True)
+        snapshot = self.progress.snapshot()
+        self.assertEqual((snapshot["done"], snapshot["succeeded"]), (20, 20))
+        self.assertAlmostEqual(snapshot["rate"], 4.0)
+        self.assertAlmostEqual(snapshot["eta"], 20.0)
+
+    def test_stall_drops_rate(self):
+        """With no completions in the window the rate falls to zero and the ETA is unknown"""
+        self.progress.record(False)
+        self.clock.now += 30
+        snapshot = self.progress.snapshot()
+        self.assertEqual(snapshot["failed"], 1)
+        self.assertEqual(snapshot["rate"], 0.0)
+        self.assertIsNone(snapshot["eta"])
+
+    def test_finished(self):
+        """A finished run has nothing left to estimate"""
+        progress = BulkProgress(0, clock=self.clock)
+        self.assertEqual(progress.snapshot()["eta"], 0.0)
+
+    def test_format_duration(self):
+        self.assertEqual(format_duration(45.4), "45s")
+        self.assertEqual(format_duration(303), "5m 03s")
+        self.assertEqual(format_duration(7800), "2h 10m")
+
+
+if __name__ == "__main__":
+    unittest.main()
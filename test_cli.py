@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Tests for the headless command-line interface
+Runs against a local mock server, no token, network or display required
+"""
+
+import sys
+import os
+import io
+import json
+import subprocess
+import unittest
+from unittest.mock import patch
+
+# Add src and benchmarks directories to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, 'src'))
+sys.path.insert(0, os.path.join(current_dir, 'benchmarks'))
+
+import cli
+from mock_github_server import MockGitHubServer
+
+
+class TestReadPairs(unittest.TestCase):
+    """Test lazy CSV/JSONL parsing"""
+
+    def test_csv_with_header_and_bad_row(self):
+        stream = io.StringIO("user,repo\noctocat,owner/a\n\nbroken\nhubot, owner/b\n")
+        self.assertEqual(list(cli.read_pairs(stream, cli.FORMAT_CSV)), [
+            (2, ("owner/a", "octocat"), None),
+            (4, None, "expected user,repo"),
+            (5, ("owner/b", "hubot"), None),
+        ])
+
+    def test_jsonl(self):
+        stream = io.StringIO('{"user": "octocat", "repo": "owner/a"}\nnot json\n')
+        pairs = list(cli.read_pairs(stream, cli.FORMAT_JSONL))
+        self.assertEqual(pairs[0], (1, ("owner/a", "octocat"), None))
+        self.assertIsNone(pairs[1][1])
+
+    def test_reads_lazily(self):
+        """Only as many lines are consumed as pairs are taken"""
+        lines = iter(["octocat,owner/a\n", "octocat,owner/b\n"])
+        pairs = cli.read_pairs(lines, cli.FORMAT_CSV)
+        next(pairs)
+        self.assertEqual(next(lines), "octocat,owner/b\n")
+
+
+class TestCommands(unittest.TestCase):
+    """Test the CLI commands against the mock server"""
+
+    def setUp(self):
+        self.server = MockGitHubServer(repo_count=3)
+        self.server.start()
+        self.env = patch.dict(os.environ, {"GITHUB_TOKEN": "mock-token"})
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        self.server.stop()
+
+    def run_cli(self, *argv, stdin=""):
+        out, err = io.StringIO(), io.StringIO()
+        with patch("sys.stdin", io.StringIO(stdin)):
+            code = cli.main(["--base-url", self.server.base_url, *argv], out=out, err=err)
+        return code, [json.loads(line) for line in out.getvalue().splitlines()], err.getvalue()
+
+    def test_repos(self):
+        code, records, _ = self.run_cli("repos")
+        self.assertEqual(code, cli.EXIT_OK)
+        self.assertEqual([record["full_name"] for record in records],
+                         [f"mock-user/repo-{i:06d}" for i in range(3)])
+
+    def test_verify(self):
+        code, records, _ = self.run_cli("verify", "octocat", "ghost")
+        self.assertEqual(code, cli.EXIT_FAILURES)
+        self.assertEqual([(record["user"], record["exists"]) for record in records],
+                         [("octocat", True), ("ghost", False)])
+
+    def test_add_from_stdin(self):
+        stdin = "octocat,mock-user/a\noctocat,mock-user/missing-b\nbroken\n"
+        code, records, _ = self.run_cli("add", "-", stdin=stdin)
+        self.assertEqual(code, cli.EXIT_FAILURES)
+        by_repo = {record.get("repo"): record["success"] for record in records}
+        self.assertEqual(by_repo, {"mock-user/a": True, "mock-user/missing-b": False, None: False})
+        self.assertEqual(self.server.write_count, 2)
+
+    def test_workers_must_be_positive(self):
+        with patch("sys.stderr", io.StringIO()) as err, self.assertRaises(SystemExit) as raised:
+            cli.main(["--workers", "0", "repos"])
+        self.assertEqual(raised.exception.code, 2)
+        self.assertIn("must be a positive integer", err.getvalue())
+
+    def test_several_tokens(self):
+        """GITHUB_TOKENS pools every token it lists"""
+        with patch.dict(os.environ, {"GITHUB_TOKENS": "token-a, token-b"}):
+            code, records, _ = self.run_cli("verify", "octocat")
+        self.assertEqual(code, cli.EXIT_OK)
+        self.assertEqual(set(self.server.requests_by_token), {"token-a", "token-b"})
+
+    def test_write_pacing_options(self):
+        args = cli.build_parser().parse_args(["--writes-per-minute", "0", "--writes-per-hour", "100", "repos"])
+        self.assertEqual((args.writes_per_minute, args.writes_per_hour), (0, 100))
+        with patch("sys.stderr", io.StringIO()), self.assertRaises(SystemExit):
+            cli.build_parser().parse_args(["--writes-per-hour", "-1", "repos"])
+
+    def test_missing_token(self):
+        with patch.dict(os.environ, {"GITHUB_TOKEN": "", "GH_TOKEN": "", "GITHUB_TOKENS": ""}):
+            code, records, err = self.run_cli("repos")
+        self.assertEqual((code, records), (cli.EXIT_ERROR, []))
+        self.assertIn("GITHUB_TOKEN", err)
+
+    def test_main_py_does_not_import_tkinter(self):
+        """main.py with a command runs headless"""
+        script = ("import sys, main; sys.argv = ['main.py', '--base-url', sys.argv[1], 'repos'];"
+                  "code = main.main(); print('tkinter' in sys.modules, code)")
+        env = dict(os.environ, GITHUB_TOKEN="mock-token", DISPLAY="")
+        output = subprocess.run([sys.executable, "-c", script, self.server.base_url], cwd=current_dir,
+                                env=env, capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.splitlines()[-1], "False 0")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tests for connection pooling in the GitHub API client
+Runs against a local mock server, no token or network access required
+"""
+
+import sys
+import os
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+# Add src and benchmarks directories to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, 'src'))
+sys.path.insert(0, os.path.join(current_dir, 'benchmarks'))
+
+from github_client import GitHubAPIClient
+from mock_github_server import MockGitHubServer
+
+
+class TestConnectionPool(unittest.TestCase):
+    """Test connection reuse through the shared session"""
+
+    def setUp(self):
+        self.server = MockGitHubServer()
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_sequential_calls_reuse_one_connection(self):
+        """Sequential calls share a single keep-alive connection"""
+        with GitHubAPIClient(self.server.base_url, prewarm_connections=0) as client:
+            success, _ = client.authenticate("mock-token")
+            self.assertTrue(success)
+            for i in range(20):
+                success, _ = client.add_collaborator(f"mock-user/repo-{i}", "octocat")
+                self.assertTrue(success)
+
+        self.assertEqual(self.server.request_count, 21)
+        self.assertEqual(self.server.connection_count, 1)
+
+    def test_without_keep_alive_every_call_connects(self):
+        """keep_alive=False opens a new connection per request"""
+        with GitHubAPIClient(self.server.base_url, keep_alive=False) as client:
+            client.authenticate("mock-token")
+            for i in range(5):
+                client.add_collaborator(f"mock-user/repo-{i}", "octocat")
+
+        self.assertEqual(self.server.connection_count, 6)
+
+    def test_concurrent_calls_bounded_by_pool_size(self):
+        """Concurrent callers never open many more connections than the pool holds"""
+        with GitHubAPIClient(self.server.base_url, pool_size=4, prewarm_connections=0) as client:
+            client.authenticate("mock-token")
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(
+                    lambda i: client.add_collaborator(f"mock-user/repo-{i}", "octocat"), range(40)))
+
+        self.assertTrue(all(success for success, _ in results))
+        self.assertLessEqual(self.server.connection_count, 4)
+
+    def test_warm_up_opens_connections(self):
+        """warm_up fills the pool with concurrent connections"""
+        with GitHubAPIClient(self.server.base_url, pool_size=4, prewarm_connections=0) as client:
+            client.authenticate("mock-token")
+            self.assertEqual(client.warm_up(3), 3)
+
+        self.assertGreaterEqual(self.server.connection_count, 2)
+        self.assertLessEqual(self.server.connection_count, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
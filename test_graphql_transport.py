@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for the GraphQL backend of the GitHub API client
+Runs against a local mock server, no token or network access required
+"""
+
+import sys
+import os
+import unittest
+
+# Add src and benchmarks directories to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, 'src'))
+sys.path.insert(0, os.path.join(current_dir, 'benchmarks'))
+
+from github_client import GitHubAPIClient
+from graphql_transport import graphql_url, permissions_from_viewer, users_query
+from mock_github_server import MockGitHubServer
+
+
+class TestGraphQLHelpers(unittest.TestCase):
+    """Test query building and result mapping"""
+
+    def test_graphql_url(self):
+        """The endpoint is derived for github.com and Enterprise"""
+        self.assertEqual(graphql_url("https://api.github.com"), "https://api.github.com/graphql")
+        self.assertEqual(graphql_url("https://ghe.example.com/api/v3"), "https://ghe.example.com/api/graphql")
+
+    def test_permissions_from_viewer(self):
+        """viewerPermission expands to the REST permission flags"""
+        self.assertEqual(permissions_from_viewer("WRITE"),
+                         {"admin": False, "maintain": False, "push": True, "triage": True, "pull": True})
+        self.assertTrue(all(permissions_from_viewer("ADMIN").values()))
+        self.assertFalse(any(permissions_from_viewer(None).values()))
+
+    def test_users_query_aliases(self):
+        """Each login gets its own alias and variable"""
+        query = users_query(2)
+        self.assertIn("u0: user(login: $l0)", query)
+        self.assertIn("u1: user(login: $l1)", query)
+
+
+class TestGraphQLBackend(unittest.TestCase):
+    """Test that the GraphQL backend matches REST results with fewer requests"""
+
+    def setUp(self):
+        self.server = MockGitHubServer(repo_count=230)
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def make_client(self, backend):
+        client = GitHubAPIClient(self.server.base_url, prewarm_connections=0, backend=backend)
+        client.authenticate("mock-token")
+        return client
+
+    def test_repositories_match_rest(self):
+        """Both backends return the same repositories in the same order"""
+        with self.make_client("rest") as client:
+            _, rest_repos, _ = client.get_user_repositories()
+        with self.make_client("graphql") as client:
+            success, graphql_repos, message = client.get_user_repositories()
+
+        self.assertTrue(success, message)
+        self.assertEqual(graphql_repos, rest_repos)
+        self.assertEqual(self.server.requests_by_route["POST /graphql"], 3)
+
+    def test_verify_username(self):
+        """verify_username keeps its messages on the GraphQL backend"""
+        with self.make_client("graphql") as client:
+            self.assertEqual(client.verify_username("octocat"), (True, "User 'octocat' found: Octocat"))
+            self.assertEqual(client.verify_username("nobody"), (False, "User 'nobody' not found"))
+
+    def test_lookup_users_batches_logins(self):
+        """Dozens of logins are resolved in a couple of queries"""
+        logins = ["octocat"] + [f"ghost-{i}" for i in range(59)]
+        with self.make_client("graphql") as client:
+            self.server.reset_counters()
+            results = client.graphql.lookup_users(logins)
+
+        self.assertEqual(self.server.request_count, 2)
+        self.assertEqual(results["octocat"]["login"], "octocat")
+        self.assertIsNone(results["ghost-3"])
+
+    def test_unknown_backend_rejected(self):
+        """Only rest and graphql backends are accepted"""
+        with self.assertRaises(ValueError):
+            GitHubAPIClient(backend="soap")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Tests for the bulk job checkpoint journal and resumed bulk adds
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+# Add src and benchmarks directories to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, 'src'))
+sys.path.insert(0, os.path.join(current_dir, 'benchmarks'))
+
+from github_client import GitHubAPIClient
+from job_journal import JobJournal, job_id
+from mock_github_server import MockGitHubServer
+
+
+class TestJobJournal(unittest.TestCase):
+    """Test journal persistence and group commits"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "journals", "job.jsonl")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def open(self, **kwargs):
+        return JobJournal(self.path, fsync=False, **kwargs)
+
+    def test_entries_survive_reopen(self):
+        """Recorded pairs are read back; only successes count as completed"""
+        with self.open() as journal:
+            journal.record("owner/a", "octocat", True, "added")
+            journal.record("owner/b", "octocat", False, "403")
+        journal = self.open()
+        self.assertTrue(journal.is_completed("owner/a", "octocat"))
+        self.assertFalse(journal.is_completed("owner/b", "octocat"))
+        self.assertFalse(journal.is_completed("owner/a", "hubot"))
+        self.assertEqual((journal.entries, journal.completed_count()), (2, 1))
+        self.assertTrue(journal.resumable)
+        journal.close()
+
+    def test_group_commit_without_explicit_commit(self):
+        """The commit thread writes queued entries within the commit interval"""
+        journal = self.open(commit_interval=0.05)
+        journal.record("owner/a", "octocat", True, "added")
+        deadline = time.time() + 2
+        while os.path.getsize(self.path) == 0 and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertGreater(os.path.getsize(self.path), 0)
+        journal.close()
+
+    def test_torn_last_line_is_ignored(self):
+        """A partially written final line from a crash does not break loading"""
+        with self.open() as journal:
+            journal.record("owner/a", "octocat", True, "added")
+        with open(self.path, "a") as handle:
+            handle.write('{"repo": "owner/b", "us')
+        journal = self.open()
+        self.assertEqual(journal.completed_count(), 1)
+        journal.close()
+
+    def test_incomplete_entries_are_ignored(self):
+        """Lines that parse but lack a repository or user are skipped"""
+        with self.open() as journal:
+            journal.record("owner/a", "octocat", True, "added")
+        with open(self.path, "a") as handle:
+            handle.write('{"repo": "owner/b", "ok": true}\n{"user": "hubot", "ok": true}\n[1, 2]\n')
+        journal = self.open()
+        self.assertEqual((journal.entries, journal.completed_count()), (1, 1))
+        journal.close()
+
+    def test_finished_job_is_not_resumable(self):
+        """A run that finished without failures starts over; failures keep it resumable"""
+        with self.open() as journal:
+            journal.record("owner/a", "octocat", True, "added")
+            journal.finish()
+        self.assertFalse(os.path.exists(self.path))  # Nothing left to resume
+        journal = self.open()
+        self.assertEqual((journal.resumable, journal.entries), (False, 0))
+        journal.record("owner/a", "octocat", True, "added")
+        journal.record("owner/b", "octocat", False, "403")
+        self.assertTrue(journal.resumable)
+        journal.reset()
+        self.assertEqual((journal.entries, journal.completed_count(), journal.finished), (0, 0, False))
+        journal.close()
+        self.assertEqual(os.path.getsize(self.path), 0)
+
+    def test_finished_job_with_failures_is_kept(self):
+        with self.open() as journal:
+            journal.record("owner/a", "octocat", True, "added")
+            journal.record("owner/b", "octocat", False, "403")
+            journal.finish()
+        journal = self.open()
+        self.assertTrue(journal.resumable)
+        journal.close()
+
+    def test_write_error_is_kept_not_raised(self):
+        """A failing commit stops the journal but not the job or the commit thread"""
+        journal = self.open(commit_interval=0.05)
+        journal._file.close()
+        journal._file = open(os.devnull, "r")  # Every write fails
+        journal.record("owner/a", "octocat", True, "added")
+        journal.commit()
+        self.assertIsInstance(journal.error, OSError)
+        journal.record("owner/b", "octocat", True, "added")  # Counted, no longer queued
+        self.assertEqual((journal.completed_count(), journal._pending), (2, []))
+        self.assertTrue(journal._committer.is_alive())
+        journal.close()
+
+    def test_job_id_ignores_order(self):
+        self.assertEqual(job_id("acct", ["b", "a"], ["r2", "r1"]), job_id("acct", ["a", "b"], ["r1", "r2"]))
+        self.assertNotEqual(job_id("acct", ["a"], ["r1"]), job_id("other", ["a"], ["r1"]))
+
+
+class TestResumedBulkAdd(unittest.TestCase):
+    """Test that a resumed bulk add sends only the remaining writes"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.server = MockGitHubServer()
+        self.server.start()
+        self.client = GitHubAPIClient(self.server.base_url, prewarm_connections=0)
+        self.client.authenticate("mock-token")
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+        shutil.rmtree(self.directory)
+
+    def test_resume_skips_completed_pairs(self):
+        repos = [f"mock-user/repo-{i}" for i in range(30)]
+        path = os.path.join(self.directory, "job.jsonl")
+
+        # An interrupted first run got through the first ten repositories
+        with JobJournal(path, fsync=False) as journal:
+            self.client.add_collaborators_bulk(repos[:10], "octocat", journal=journal)
+        self.assertEqual(self.server.write_count, 10)
+
+        streamed = []
+        with JobJournal(path, fsync=False) as journal:
+            results = self.client.add_collaborators_bulk(repos, "octocat", journal=journal,
+                                                         on_result=streamed.append)
+            self.assertEqual(journal.completed_count(), 30)
+
+        self.assertEqual(self.server.write_count, 30)  # Only the remaining 20 were sent
+        self.assertEqual([repo for repo, _, _ in results], repos)
+        self.assertTrue(all(success for _, success, _ in results))
+        self.assertIn("resumed from journal", results[0][2])
+        self.assertEqual(len(streamed), 30)
+
+
+if __name__ == "__main__":
+    unittest.main()
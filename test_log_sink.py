@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Tests for the batched status log
+"""
+
+import sys
+import os
+import threading
+import unittest
+
+# Add src directory to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, 'src'))
+
+from log_sink import LogSink
+
+
+class FakeText:
+    """Records the Text widget calls LogSink makes and keeps the text as lines"""
+
+    def __init__(self):
+        self.lines = []
+        self.tags = {}
+        self.insert_calls = 0
+        self.state = "disabled"
+
+    def tag_configure(self, tag, **options):
+        self.tags[tag] = options
+
+    def configure(self, state):
+        self.state = state
+
+    def insert(self, index, *chunks):
+        assert self.state == "normal"
+        self.insert_calls += 1
+        for text, tag in zip(chunks[::2], chunks[1::2]):
+            self.lines.extend((line, tag) for line in text[:-1].split("\n"))
+
+    def delete(self, start, end):
+        if end == "end":
+            self.lines = []
+        else:
+            del self.lines[:int(end.split(".")[0]) - 1]
+
+    def see(self, index):
+        pass
+
+
+class TestLogSink(unittest.TestCase):
+    """Test batching, colour tags and the line cap"""
+
+    def setUp(self):
+        self.widget = FakeText()
+        self.sink = LogSink(self.widget, max_lines=100)
+
+    def test_batch_is_one_insert(self):
+        """A thousand messages reach the widget in one insert call"""
+        for i in range(1000):
+            self.sink.write(f"result {i}", "success")
+        self.assertEqual(self.widget.insert_calls, 0)
+        self.assertEqual(self.sink.flush(), 100)  # Older messages were already past the cap
+        self.assertEqual(self.widget.insert_calls, 1)
+        self.assertEqual(self.widget.lines[-1], ("result 999", "success"))
+        self.assertEqual(self.widget.state, "disabled")
+
+    def test_level_tags(self):
+        """Each level has a colour tag; unknown levels fall back to info"""
+        self.assertEqual(self.widget.tags["error"], {"foreground": "red"})
+        self.sink.write("oops", "error")
+        self.sink.write("odd", "verbose")
+        self.sink.flush()
+        self.assertEqual(self.widget.lines, [("oops", "error"), ("odd", "info")])
+
+    def test_trims_oldest_lines(self):
+        """The widget never holds more than max_lines lines"""
+        for batch in range(3):
+            for i in range(60):
+                self.sink.write(f"{batch}-{i}")
+            self.sink.flush()
+        self.assertEqual(len(self.widget.lines), 100)
+        self.assertEqual(self.widget.lines[0][0], "1-20")
+        self.sink.write("two\nlines")
+        self.sink.flush()
+        self.assertEqual(len(self.widget.lines), 100)
+
+    def test_concurrent_writers(self):
+        """Messages written from several threads are all delivered"""
+        sink = LogSink(self.widget, max_lines=10000)
+
+        def writer(n):
+            for i in range(500):
+                sink.write(f"{n}:{i}")
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sink.flush(), 2000)
+        self.assertEqual(sink.flush(), 0)
+
+    def test_clear(self):
+        """clear() drops pending and shown messages"""
+        self.sink.write("shown")
+        self.sink.flush()
+        self.sink.write("pending")
+        self.sink.clear()
+        self.assertEqual(self.sink.flush(), 0)
+        self.assertEqual(self.widget.lines, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
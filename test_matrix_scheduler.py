@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tests for users × repositories matrix jobs and their scheduler
+"""
+
+import sys
+import os
+import threading
+import unittest
+
+# Add src and benchmarks directories to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, 'src'))
+sys.path.insert(0, os.path.join(current_dir, 'benchmarks'))
+
+from github_client import GitHubAPIClient
+from matrix_scheduler import MatrixScheduler, interleave, unique_usernames
+from mock_github_server import MockGitHubServer
+
+
+class TestMatrixScheduler(unittest.TestCase):
+    """Test cell ordering and per-repository exclusivity"""
+
+    def test_interleave_covers_every_cell(self):
+        """Every pair appears once and neighbouring cells use different repositories"""
+        repos = ["r0", "r1", "r2"]
+        users = ["a", "b", "c", "d", "e"]
+        cells = list(interleave(repos, users))
+        self.assertEqual(sorted(cells), sorted((repo, user) for repo in repos for user in users))
+        for first, second in zip(cells, cells[1:]):
+            self.assertNotEqual(first[0], second[0])
+            self.assertNotEqual(first[1], second[1])
+
+    def test_unique_usernames_ignores_case(self):
+        self.assertEqual(unique_usernames(["octocat", "hubot", "Octocat", "OCTOCAT", "hubot"]), ["octocat", "hubot"])
+
+    def test_busy_repository_is_held_back(self):
+        """A second cell on a busy repository waits; other repositories go first"""
+        scheduler = MatrixScheduler([("r0", "a"), ("r0", "b"), ("r1", "a")])
+        self.assertEqual(scheduler.next_cell(), ("r0", "a", None))
+        self.assertEqual(scheduler.next_cell(), ("r1", "a", None))
+
+        taken = []
+        waiter = threading.Thread(target=lambda: taken.append(scheduler.next_cell()))
+        waiter.start()
+        waiter.join(0.1)
+        self.assertTrue(waiter.is_alive())
+        scheduler.done("r0")
+        waiter.join(1)
+        self.assertEqual(taken, [("r0", "b", None)])
+        self.assertIsNone(scheduler.next_cell())
+
+    def test_blocked_repository_fails_remaining_cells(self):
+        scheduler = MatrixScheduler([("r0", "a"), ("r0", "b")])
+        scheduler.next_cell()
+        scheduler.done("r0", "Permission denied")
+        self.assertEqual(scheduler.next_cell(), ("r0", "b", "Permission denied"))
+
+
+class TestMatrixJob(unittest.TestCase):
+    """Test add_collaborators_matrix against the mock server"""
+
+    def setUp(self):
+        self.server = MockGitHubServer(known_users=("octocat", "hubot", "monalisa"))
+        self.server.start()
+        self.client = GitHubAPIClient(self.server.base_url, prewarm_connections=0)
+        self.client.authenticate("mock-token")
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_per_cell_and_aggregate_results(self):
+        repos = [f"mock-user/repo-{i}" for i in range(6)] + ["mock-user/readonly-6"]
+        users = ["octocat", "hubot", "monalisa"]
+        streamed = []
+        results = self.client.add_collaborators_matrix(repos, users, max_workers=4, on_result=streamed.append)
+
+        self.assertEqual(len(streamed), 21)
+        rows = results.rows()
+        self.assertEqual([(repo, user) for repo, user, _, _ in rows],
+                         [(repo, user) for repo in repos for user in users])
+        summary = results.summary()
+        self.assertEqual((summary["total"], summary["succeeded"], summary["failed"]), (21, 18, 3))
+        self.assertEqual(summary["by_user"]["hubot"], {"succeeded": 6, "failed": 1})
+        self.assertEqual(summary["by_repo"]["mock-user/readonly-6"], {"succeeded": 0, "failed": 3})
+        # The read-only repository refused the first write; its other cells sent nothing
+        self.assertEqual(self.server.write_count, 19)
+
+    def test_skips_existing_access(self):
+        self.server.collaborators["mock-user/repo-0"] = {"octocat"}
+        repos = ["mock-user/repo-0", "mock-user/repo-1"]
+        access = self.client.get_repository_access(repos)
+        results = self.client.add_collaborators_matrix(repos, ["octocat", "hubot"], existing_access=access)
+        self.assertEqual(results.summary()["succeeded"], 4)
+        self.assertEqual(self.server.write_count, 3)
+
+    def test_repeated_usernames_are_added_once(self):
+        """The same user pasted twice, in any case, is one cell per repository"""
+        repos = ["mock-user/repo-0", "mock-user/repo-1"]
+        results = self.client.add_collaborators_matrix(repos, ["octocat", "Octocat", "octocat"])
+        self.assertEqual(results.summary()["total"], 2)
+        self.assertEqual(self.server.write_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
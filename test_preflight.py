@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for the pre-flight collaborator check that skips no-op writes
+Runs against a local mock server, no token or network access required
+"""
+
+import sys
+import os
+import unittest
+
+# Add src and benchmarks directories to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, 'src'))
+sys.path.insert(0, os.path.join(current_dir, 'benchmarks'))
+
+from github_client import GitHubAPIClient
+from mock_github_server import MockGitHubServer
+
+
+class TestPreflight(unittest.TestCase):
+    """Test get_repository_access and existing_access in add_collaborators_bulk"""
+
+    def setUp(self):
+        self.server = MockGitHubServer(known_users=("octocat", "hubot"))
+        self.server.start()
+        self.server.collaborators["mock-user/repo-0"] = {"octocat"}
+        self.server.invitations["mock-user/repo-1"] = {"octocat"}
+        self.client = GitHubAPIClient(self.server.base_url, prewarm_connections=0)
+        self.client.authenticate("mock-token")
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_access_includes_collaborators_and_invitations(self):
+        """Collaborators and pending invitees are listed; failed lookups are None"""
+        access = self.client.get_repository_access(
+            ["mock-user/repo-0", "mock-user/repo-1", "mock-user/repo-2", "mock-user/missing-3"])
+        self.assertEqual(access, {
+            "mock-user/repo-0": {"octocat"},
+            "mock-user/repo-1": {"octocat"},
+            "mock-user/repo-2": set(),
+            "mock-user/missing-3": None,
+        })
+
+    def test_existing_access_skips_writes(self):
+        """Only repositories where the user has no access get a PUT"""
+        repos = [f"mock-user/repo-{i}" for i in range(5)] + ["mock-user/missing-5"]
+        access = self.client.get_repository_access(repos)
+        streamed = []
+        results = self.client.add_collaborators_bulk(repos, "OctoCat", existing_access=access,
+                                                     on_result=streamed.append)
+
+        self.assertEqual(self.server.requests_by_route["PUT /repos/{repo}/collaborators/{user}"], 4)
+        self.assertEqual([repo for repo, _, _ in results], repos)
+        self.assertIn("no request sent", results[0][2])
+        self.assertIn("no request sent", results[1][2])
+        self.assertFalse(results[5][1])  # Failed lookup falls back to the write
+        self.assertEqual(len(streamed), 6)
+
+        # Another user still gets every write
+        self.client.add_collaborators_bulk(repos[:2], "hubot", existing_access=access)
+        self.assertEqual(self.server.requests_by_route["PUT /repos/{repo}/collaborators/{user}"], 6)
+
+    def test_repeated_preflight_is_revalidated(self):
+        """A second pre-flight is answered with 304s from the response cache"""
+        repos = [f"mock-user/repo-{i}" for i in range(3)]
+        first = self.client.get_repository_access(repos)
+        second = self.client.get_repository_access(repos)
+        self.assertEqual(first, second)
+        self.assertEqual(self.server.not_modified_count, 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Tests for the rate-limit governor
+Unit tests use a fake clock; integration tests run against a local mock server
+"""
+
+import sys
+import os
+import asyncio
+import unittest
+from unittest.mock import Mock
+
+# Add src and benchmarks directories to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, 'src'))
+sys.path.insert(0, os.path.join(current_dir, 'benchmarks'))
+
+from github_client import GitHubAPIClient
+from rate_limit import RateLimitGovernor, RateLimitExceeded
+from mock_github_server import MockGitHubServer
+
+
+class FakeClock:
+    """Monotonic and wall clock that only advance when sleep() is called"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def make_response(status, headers=None, text=""):
+    return Mock(status_code=status, headers=headers or {}, text=text)
+
+
+class TestRateLimitGovernor(unittest.TestCase):
+    """Test governor decisions with a fake clock"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def make_governor(self, **kwargs):
+        return RateLimitGovernor(clock=self.clock, wall_clock=self.clock, sleep=self.clock.sleep, **kwargs)
+
+    def test_write_window_paces_writes(self):
+        """Writes beyond the per-minute budget wait for the window to slide"""
+        governor = self.make_governor(writes_per_minute=3)
+        for _ in range(4):
+            governor.before_request(write=True)
+
+        self.assertAlmostEqual(self.clock.now, 1060.0)
+        self.assertEqual(governor.stats()["waits"]["write_pacing"]["count"], 1)
+
+    def test_hourly_write_window(self):
+        """Writes beyond the per-hour budget wait for the hour window to slide"""
+        governor = self.make_governor(writes_per_minute=0, writes_per_hour=5, max_wait=3600)
+        for _ in range(6):
+            governor.before_request(write=True)
+
+        self.assertAlmostEqual(self.clock.now, 4600.0)
+        self.assertEqual(governor.clone().writes_per_hour, 5)
+
+    def test_full_hour_window_beyond_max_wait_raises(self):
+        governor = self.make_governor(writes_per_hour=2)
+        governor.before_request(write=True)
+        governor.before_request(write=True)
+        with self.assertRaises(RateLimitExceeded):
+            governor.before_request(write=True)
+
+    def test_reads_are_not_paced(self):
+        """Reads ignore the write budget"""
+        governor = self.make_governor(writes_per_minute=1)
+        for _ in range(10):
+            governor.before_request(write=False)
+        self.assertEqual(self.clock.now, 1000.0)
+
+    def test_async_wait_does_not_block_the_loop(self):
+        """Coroutines waiting for write pacing let other coroutines run"""
+        governor = RateLimitGovernor(writes_per_minute=0, min_write_interval=0.05)
+        reads = []
+
+        async def run():
+            async def read():
+                await governor.before_request_async()
+                reads.append(governor.current_wait())
+            await governor.before_request_async(write=True)
+            await asyncio.gather(governor.before_request_async(write=True), read())
+
+        asyncio.run(run())
+        self.assertEqual(reads[0][0], "write_pacing")
+        self.assertEqual(governor.stats()["waits"]["write_pacing"]["count"], 1)
+        self.assertIsNone(governor.current_wait())
+
+    def test_exhausted_primary_budget_waits_for_reset(self):
+        """A zero remaining budget blocks until the reset time"""
+        governor = self.make_governor()
+        governor.observe(make_response(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1030"}))
+        governor.before_request()
+
+        self.assertAlmostEqual(self.clock.now, 1030.0)
+        self.assertAlmostEqual(governor.stats()["waits"]["primary"]["seconds"], 30.0)
+
+    def test_wait_beyond_max_wait_raises(self):
+        """Waits longer than max_wait fail fast instead of blocking"""
+        governor = self.make_governor(max_wait=10)
+        governor.observe(make_response(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "4600"}))
+        with self.assertRaises(RateLimitExceeded):
+            governor.before_request()
+
+    def test_throttle_classification(self):
+        """Throttled responses are told apart from permission errors"""
+        governor = self.make_governor(secondary_backoff=60)
+        self.assertEqual(governor.observe(make_response(403, {"Retry-After": "5"})), (5.0, "retry_after"))
+        self.assertEqual(governor.observe(make_response(
+            403, text='{"message": "You have exceeded a secondary rate limit"}')), (60, "secondary"))
+        self.assertEqual(governor.observe(make_response(
+            403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1010"})), (11.0, "primary"))
+        self.assertIsNone(governor.observe(make_response(403, text='{"message": "Must have admin rights"}')))
+        self.assertEqual(governor.stats()["throttled_responses"], 3)
+
+    def test_out_of_order_headers_keep_lowest_remaining(self):
+        """Late responses from the same window do not raise the remaining count"""
+        governor = self.make_governor()
+        governor.observe(make_response(200, {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "2000"}))
+        governor.observe(make_response(200, {"X-RateLimit-Remaining": "12", "X-RateLimit-Reset": "2000"}))
+        self.assertEqual(governor.remaining, 10)
+        governor.observe(make_response(200, {"X-RateLimit-Remaining": "4999", "X-RateLimit-Reset": "5600"}))
+        self.assertEqual(governor.remaining, 4999)
+
+    def test_budgets_are_tracked_per_resource(self):
+        """An exhausted GraphQL budget does not hold back REST requests"""
+        governor = self.make_governor(max_wait=3600)
+        governor.observe(make_response(200, {"X-RateLimit-Remaining": "4000", "X-RateLimit-Reset": "2000",
+                                             "X-RateLimit-Resource": "core"}))
+        governor.observe(make_response(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "2100",
+                                             "X-RateLimit-Resource": "graphql"}))
+        governor.observe(make_response(200, {"X-RateLimit-Remaining": "3999", "X-RateLimit-Reset": "2000",
+                                             "X-RateLimit-Resource": "core"}))
+        self.assertEqual(governor.stats()["remaining"], 3999)
+        self.assertEqual(governor.stats()["resources"]["graphql"]["remaining"], 0)
+
+        governor.before_request(write=True)
+        self.assertEqual(self.clock.now, 1000.0)
+        governor.before_request(resource="graphql")
+        self.assertAlmostEqual(self.clock.now, 2100.0)
+
+    def test_pause_blocks_all_requests(self):
+        """pause() holds back reads and writes alike"""
+        governor = self.make_governor()
+        governor.pause(7, "secondary")
+        governor.before_request(write=False)
+        self.assertAlmostEqual(self.clock.now, 1007.0)
+
+    def test_current_wait_reported_while_sleeping(self):
+        """current_wait() shows the reason and time left of an ongoing wait"""
+        seen = []
+
+        def sleep(seconds):
+            seen.append(governor.current_wait())
+            self.clock.sleep(seconds)
+
+        governor = RateLimitGovernor(clock=self.clock, wall_clock=self.clock, sleep=sleep)
+        self.assertIsNone(governor.current_wait())
+        governor.pause(12, "secondary")
+        governor.before_request()
+        self.assertEqual(seen, [("secondary", 12.0)])
+        self.assertIsNone(governor.current_wait())
+
+
+class TestGovernedClient(unittest.TestCase):
+    """Test the client retrying throttled requests against a mock server"""
+
+    def test_secondary_limit_retried_after_pause(self):
+        """Secondary-limit 403s pause the client and the write is retried"""
+        with MockGitHubServer(secondary_every=3, retry_after="0.05") as server:
+            with GitHubAPIClient(server.base_url, prewarm_connections=0) as client:
+                client.authenticate("mock-token")
+                repos = [f"mock-user/repo-{i}" for i in range(6)]
+                results = client.add_collaborators_bulk(repos, "octocat", max_workers=1)
+                stats = client.rate_limit_stats()
+
+        self.assertTrue(all(success for _, success, _ in results), results)
+        self.assertEqual(stats["throttled_responses"], server.throttled_count)
+        self.assertGreaterEqual(stats["waits"]["retry_after"]["count"], 1)
+
+    def test_persistent_throttling_reports_failure(self):
+        """A write that stays throttled fails with a rate-limit message"""
+        with MockGitHubServer(secondary_every=1, retry_after="0") as server:
+            with GitHubAPIClient(server.base_url, prewarm_connections=0, max_retries=2) as client:
+                client.authenticate("mock-token")
+                success, message = client.add_collaborator("mock-user/repo-1", "octocat")
+
+        self.assertFalse(success)
+        self.assertIn("rate limit", message)
+        self.assertEqual(server.write_count, 3)
+
+    def test_primary_budget_tracked_from_headers(self):
+        """Remaining budget follows the X-RateLimit headers"""
+        with MockGitHubServer(rate_limit=100) as server:
+            with GitHubAPIClient(server.base_url, prewarm_connections=0) as client:
+                client.authenticate("mock-token")
+                client.verify_username("octocat")
+                self.assertEqual(client.rate_limit_stats()["remaining"], 98)
+                self.assertEqual(client.rate_limit_stats()["limit"], 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for the local SQLite repository index and incremental sync
+Runs against a local mock server, no token or network access required
+"""
+
+import sys
+import os
+import unittest
+
+# Add src and benchmarks directories to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, 'src'))
+sys.path.insert(0, os.path.join(current_dir, 'benchmarks'))
+
+from github_client import GitHubAPIClient
+from repo_index import RepositoryIndex
+from repo_records import RepositoryList
+from mock_github_server import MockGitHubServer
+
+
+class TestRepositoryIndex(unittest.TestCase):
+    """Test storage round trips"""
+
+    def test_round_trip(self):
+        """Stored repositories load back identical, newest first"""
+        index = RepositoryIndex(":memory:")
+        repos = RepositoryList([
+            {"name": "old", "full_name": "me/old", "description": None, "private": True,
+             "html_url": "https://github.com/me/old", "permissions": {"admin": True},
+             "updated_at": "2024-01-01T00:00:00Z"},
+            {"name": "new", "full_name": "me/new", "description": "Fresh", "private": False,
+             "html_url": "https://ghe.example.com/me/new", "permissions": {},
+             "updated_at": "2024-06-01T00:00:00Z"},
+        ])
+        index.replace("host/me", repos)
+
+        loaded = index.load("host/me")
+        self.assertEqual([repo.name for repo in loaded], ["new", "old"])
+        self.assertEqual(loaded[1], repos[0])
+        self.assertEqual(loaded[0].url, "https://ghe.example.com/me/new")
+        self.assertEqual(len(index.load("host/someone-else")), 0)
+        self.assertIsNone(index.newest_updated_at("host/someone-else"))
+
+
+class TestIncrementalSync(unittest.TestCase):
+    """Test that later syncs only fetch changed pages"""
+
+    def setUp(self):
+        self.server = MockGitHubServer(repo_count=1050)
+        self.server.start()
+        self.index = RepositoryIndex(":memory:")
+        self.client = GitHubAPIClient(self.server.base_url, prewarm_connections=0)
+        self.client.authenticate("mock-token")
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+        self.index.close()
+
+    def listing_requests(self):
+        return self.server.requests_by_route.get("GET /user/repos", 0)
+
+    def test_first_sync_lists_everything(self):
+        """An empty index triggers a complete listing"""
+        success, repos, _ = self.client.sync_repositories(self.index)
+        self.assertTrue(success)
+        self.assertEqual(len(repos), 1050)
+        self.assertEqual(len(self.index.load(self.client.account_key())), 1050)
+        self.assertEqual(self.listing_requests(), 11)
+
+    def test_unchanged_account_costs_one_request(self):
+        """With nothing updated, a sync stops after the first page"""
+        self.client.sync_repositories(self.index)
+        self.server.reset_counters()
+        success, repos, message = self.client.sync_repositories(self.index)
+
+        self.assertTrue(success, message)
+        self.assertEqual(len(repos), 1050)
+        self.assertEqual(self.listing_requests(), 1)
+
+    def test_updated_and_new_repositories_move_to_front(self):
+        """Changed and created repositories are merged in update order"""
+        self.client.sync_repositories(self.index)
+        self.server.touch(700, 1050)  # One update, one new repository
+        self.server.reset_counters()
+        success, repos, message = self.client.sync_repositories(self.index)
+
+        self.assertTrue(success, message)
+        self.assertEqual(len(repos), 1051)
+        self.assertEqual([repo.name for repo in repos[:3]], ["repo-001050", "repo-000700", "repo-000000"])
+        self.assertEqual(self.listing_requests(), 1)
+
+    def test_full_sync_drops_deleted_repositories(self):
+        """A forced full sync replaces the stored list"""
+        self.client.sync_repositories(self.index)
+        self.server.repo_count = 10
+        success, repos, _ = self.client.sync_repositories(self.index, full=True)
+
+        self.assertTrue(success)
+        self.assertEqual(len(repos), 10)
+        self.assertEqual(len(self.index.load(self.client.account_key())), 10)
+
+    def test_stale_index_gets_full_sync(self):
+        """A full listing runs once full_sync_interval has passed"""
+        self.client.sync_repositories(self.index)
+        self.server.reset_counters()
+        self.client.sync_repositories(self.index, full_sync_interval=-1)
+        self.assertEqual(self.listing_requests(), 11)
+
+    def test_requires_authentication(self):
+        """Syncing without a token fails cleanly"""
+        success, repos, message = GitHubAPIClient(self.server.base_url).sync_repositories(self.index)
+        self.assertFalse(success)
+        self.assertEqual(message, "Not authenticated")
+        self.assertIsInstance(repos, RepositoryList)
+
+    def test_failed_listing_returns_empty_repository_list(self):
+        """API errors give callers an empty RepositoryList, not a plain list"""
+        self.server.revoked.add("mock-token")
+        for success, repos, _ in (self.client.get_user_repositories(), self.client.sync_repositories(self.index)):
+            self.assertFalse(success)
+            self.assertIsInstance(repos, RepositoryList)
+            self.assertEqual(len(repos), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
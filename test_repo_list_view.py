@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for the repository list model behind the virtualized list widget
+"""
+
+import sys
+import os
+import unittest
+
+# Add src directory to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, 'src'))
+
+from repo_records import RepositoryList
+from repo_list_view import RepositoryListModel, row_label, row_description
+
+
+def make_repos(*names, private=False, description="A repository"):
+    return RepositoryList({
+        "name": name,
+        "full_name": f"owner/{name}",
+        "description": description,
+        "private": private,
+        "url": f"https://github.com/owner/{name}",
+        "permissions": {"admin": True},
+    } for name in names)
+
+
+class TestRepositoryListModel(unittest.TestCase):
+    """Test rows and checked state without Tk"""
+
+    def setUp(self):
+        self.model = RepositoryListModel()
+        self.changes = 0
+        self.model.add_listener(self.count_change)
+
+    def count_change(self):
+        self.changes += 1
+
+    def test_extend_notifies_once_per_page(self):
+        """Appending a page is a single change, however many rows it holds"""
+        self.model.extend(make_repos(*(f"repo{i}" for i in range(500))))
+        self.model.extend(make_repos("last"))
+        self.assertEqual(len(self.model), 501)
+        self.assertEqual(self.changes, 2)
+        self.assertEqual(self.model.row(500).name, "last")
+
+    def test_selection_in_list_order(self):
+        """Checked repositories are reported in list order"""
+        self.model.extend(make_repos("a", "b", "c"))
+        self.model.set_selected(2, True)
+        self.model.set_selected(0, True)
+        self.model.set_selected(2, False)
+        self.assertEqual(self.model.selected_full_names(), ["owner/a"])
+        self.model.select_all()
+        self.assertEqual(self.model.selected_count(), 3)
+        self.model.select_none()
+        self.assertEqual(self.model.selected_full_names(), [])
+
+    def test_set_repositories_keeps_checked_names(self):
+        """Replacing the rows keeps repositories that are still present checked"""
+        self.model.extend(make_repos("a", "b", "c"))
+        self.model.set_selected(1, True)
+        self.model.set_selected(2, True)
+        self.model.set_repositories(make_repos("c", "new", "b"))
+        self.assertEqual(self.model.selected_full_names(), ["owner/c", "owner/b"])
+
+    def test_clear(self):
+        """Clearing drops rows and checked state"""
+        self.model.extend(make_repos("a"))
+        self.model.select_all()
+        self.model.clear()
+        self.assertEqual(len(self.model), 0)
+        self.assertEqual(self.model.selected_count(), 0)
+
+    def test_row_text(self):
+        """Row text matches the original checkbox and description labels"""
+        repo = make_repos("a", private=True, description="x" * 100)[0]
+        self.assertEqual(row_label(repo), "a (Private)")
+        self.assertEqual(row_description(repo), "  " + "x" * 80 + "...")
+        self.assertEqual(row_description(make_repos("b", description=None)[0]), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests for compact repository records
+"""
+
+import sys
+import os
+import unittest
+
+# Add src directory to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, 'src'))
+
+from repo_records import RepositoryList, parse_timestamp
+
+
+def api_repo(name, private=False, admin=True, description="A repository", url=None):
+    """Repository JSON as returned by /user/repos"""
+    return {
+        "name": name,
+        "full_name": f"owner/{name}",
+        "description": description,
+        "private": private,
+        "html_url": url or f"https://github.com/owner/{name}",
+        "permissions": {"admin": admin, "maintain": admin, "push": True, "triage": True, "pull": True},
+    }
+
+
+class TestRepositoryList(unittest.TestCase):
+    """Test the columnar container and its row views"""
+
+    def setUp(self):
+        self.repos = RepositoryList([
+            api_repo("alpha", private=True),
+            api_repo("beta", admin=False, description=None),
+            api_repo("gamma", url="https://ghe.example.com/owner/gamma"),
+        ])
+
+    def test_dict_style_access(self):
+        """Rows answer the keys of the original repository dicts"""
+        repo = self.repos[0]
+        self.assertEqual(repo["name"], "alpha")
+        self.assertEqual(repo["full_name"], "owner/alpha")
+        self.assertEqual(repo["url"], "https://github.com/owner/alpha")
+        self.assertTrue(repo["private"])
+        self.assertEqual(repo["permissions"],
+                         {"admin": True, "maintain": True, "push": True, "triage": True, "pull": True})
+        self.assertIsNone(repo.get("missing"))
+        with self.assertRaises(KeyError):
+            repo["missing"]
+
+    def test_attribute_access(self):
+        """Rows expose the same fields as attributes"""
+        beta = self.repos[1]
+        self.assertEqual((beta.name, beta.private, beta.description), ("beta", False, None))
+        self.assertFalse(beta.has_permission("admin"))
+        self.assertTrue(beta.has_permission("push"))
+
+    def test_non_default_url_is_kept(self):
+        """URLs that are not https://github.com/<full_name> are stored as given"""
+        self.assertEqual(self.repos[2].url, "https://ghe.example.com/owner/gamma")
+        self.assertEqual(self.repos[-1].name, "gamma")
+
+    def test_equality_with_dicts(self):
+        """Rows compare equal to the dict they were built from"""
+        self.assertEqual(self.repos[0], {
+            "name": "alpha", "full_name": "owner/alpha", "description": "A repository", "private": True,
+            "url": "https://github.com/owner/alpha",
+            "permissions": {"admin": True, "maintain": True, "push": True, "triage": True, "pull": True},
+        })
+        self.assertEqual(RepositoryList(repo.to_dict() for repo in self.repos), self.repos)
+        self.assertEqual(self.repos, list(self.repos))
+
+    def test_extend_copies_columns(self):
+        """Extending with another list appends its rows in order"""
+        combined = RepositoryList()
+        combined.extend(self.repos)
+        combined.extend(RepositoryList([api_repo("delta")]))
+        self.assertEqual(len(combined), 4)
+        self.assertEqual([repo.name for repo in combined], ["alpha", "beta", "gamma", "delta"])
+
+    def test_select_by_flags(self):
+        """select() filters on visibility and permissions"""
+        self.assertEqual(self.repos.select(private=True), [0])
+        self.assertEqual(self.repos.select(private=False), [1, 2])
+        self.assertEqual(self.repos.select(permission="admin"), [0, 2])
+        self.assertEqual(self.repos.select(private=False, permission="admin"), [2])
+        self.assertEqual(self.repos.select(), [0, 1, 2])
+
+    def test_missing_permissions_stay_empty(self):
+        """Repositories without a permissions object keep an empty dict"""
+        repo = dict(api_repo("epsilon"), permissions=None)
+        self.assertEqual(RepositoryList([repo])[0].permissions, {})
+
+    def test_index_errors(self):
+        """Out of range positions raise IndexError"""
+        with self.assertRaises(IndexError):
+            self.repos[3]
+
+    def test_parse_timestamp(self):
+        """GitHub timestamps become UTC epoch seconds"""
+        self.assertEqual(parse_timestamp("2024-05-01T12:00:00Z"), 1714564800)
+        self.assertEqual(parse_timestamp(1714564800), 1714564800)
+        self.assertEqual(parse_timestamp(None), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
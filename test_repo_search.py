@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for the repository search index
+"""
+
+import sys
+import os
+import unittest
+
+# Add src directory to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, 'src'))
+
+from repo_records import RepositoryList
+from repo_search import RepositorySearchIndex
+from repo_list_view import RepositoryListModel
+
+
+def api_repo(name, description=None, private=False, admin=True, owner="owner"):
+    return {
+        "name": name,
+        "full_name": f"{owner}/{name}",
+        "description": description,
+        "private": private,
+        "html_url": f"https://github.com/{owner}/{name}",
+        "permissions": {"admin": admin, "push": True, "pull": True},
+    }
+
+
+class TestRepositorySearchIndex(unittest.TestCase):
+    """Test substring matching over names, full names and descriptions"""
+
+    def setUp(self):
+        self.repos = RepositoryList([
+            api_repo("Collab-Adder", "Add collaborators in bulk"),
+            api_repo("website", "Company homepage", private=True),
+            api_repo("dotfiles", admin=False),
+            api_repo("tools", "Build scripts", private=True, admin=False, owner="acme"),
+        ])
+        self.index = RepositorySearchIndex(self.repos)
+
+    def test_matches_name_full_name_and_description(self):
+        """Queries match any of the three fields, case-insensitively"""
+        self.assertEqual(self.index.matches("COLLAB"), [0])
+        self.assertEqual(self.index.matches("acme/"), [3])
+        self.assertEqual(self.index.matches("homepage"), [1])
+        self.assertEqual(self.index.matches("e"), [0, 1, 2, 3])
+        self.assertEqual(self.index.matches(""), [0, 1, 2, 3])
+        self.assertEqual(self.index.matches("nothing here"), [])
+
+    def test_narrowing_matches_fresh_search(self):
+        """Typing character by character gives the same results as searching from scratch"""
+        for query in ("o", "ow", "own", "owne", "owner/d", "owner/do"):
+            narrowed = self.index.matches(query)
+            fresh = RepositorySearchIndex(self.repos).matches(query)
+            self.assertEqual(narrowed, fresh, query)
+        self.assertEqual(self.index.matches("owner/do"), [2])
+        # Deleting characters widens the result again
+        self.assertEqual(self.index.matches("own"), [0, 1, 2])
+
+    def test_update_indexes_appended_rows(self):
+        """Rows appended to the list are searchable after update()"""
+        self.assertEqual(self.index.matches("scripts"), [3])
+        self.repos.append(api_repo("more-scripts"))
+        self.index.update()
+        self.assertEqual(self.index.matches("scripts"), [3, 4])
+
+    def test_visibility_and_permission_filters(self):
+        """Flag filters combine with the text query"""
+        self.assertEqual(self.index.search(private=True), [1, 3])
+        self.assertEqual(self.index.search(permission="admin"), [0, 1])
+        self.assertEqual(self.index.search("o", private=False), [0, 2])
+        self.assertEqual(self.index.search("o", private=True, permission="admin"), [1])
+
+
+class TestFilteredListModel(unittest.TestCase):
+    """Test the list model's filtered view"""
+
+    def test_filter_keeps_selection(self):
+        """Checked repositories stay checked while hidden by a filter"""
+        model = RepositoryListModel()
+        model.extend(RepositoryList([api_repo("alpha"), api_repo("beta"), api_repo("alphabet")]))
+        model.set_selected(1, True)
+        model.set_filter("alpha")
+        self.assertEqual(len(model), 2)
+        self.assertEqual(model.total, 3)
+        self.assertEqual(model.row(1).name, "alphabet")
+        model.set_selected(1, True)
+        self.assertEqual(model.selected_full_names(), ["owner/beta", "owner/alphabet"])
+
+        # Pages arriving while filtered are filtered too
+        model.extend(RepositoryList([api_repo("alpha-2"), api_repo("gamma")]))
+        self.assertEqual([model.row(i).name for i in range(len(model))], ["alpha", "alphabet", "alpha-2"])
+
+        model.set_filter()
+        self.assertFalse(model.is_filtered)
+        self.assertEqual(len(model), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Tests for repository listing in the GitHub API client
+Runs against a local mock server, no token or network access required
+"""
+
+import sys
+import os
+import time
+import unittest
+
+# Add src and benchmarks directories to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, 'src'))
+sys.path.insert(0, os.path.join(current_dir, 'benchmarks'))
+
+from github_client import GitHubAPIClient, GitHubAPIError
+from mock_github_server import MockGitHubServer
+
+
+class FailingPageServer(MockGitHubServer):
+    """Mock server whose third repository page returns a server error"""
+
+    def route(self, method, path, query, headers, response_headers):
+        if path == "/user/repos" and query.get("page") == ["3"]:
+            return 502, {"message": "Server Error"}
+        return super().route(method, path, query, headers, response_headers)
+
+
+class TestParallelPagination(unittest.TestCase):
+    """Test Link-header driven page fan-out"""
+
+    def list_repositories(self, server, **client_args):
+        with GitHubAPIClient(server.base_url, prewarm_connections=0, **client_args) as client:
+            client.authenticate("mock-token")
+            return client.get_user_repositories()
+
+    def test_parallel_pages_keep_updated_order(self):
+        """Concurrently fetched pages are merged in sort=updated order"""
+        with MockGitHubServer(repo_count=950, latency=0.01) as server:
+            success, repos, message = self.list_repositories(server, max_workers=8)
+
+        self.assertTrue(success, message)
+        self.assertEqual(message, "Found 950 repositories")
+        self.assertEqual([repo["name"] for repo in repos], [f"repo-{i:06d}" for i in range(950)])
+        # One request for /user plus one per page, with no trailing empty page
+        self.assertEqual(server.requests_by_route["GET /user/repos"], 10)
+
+    def test_serial_fallback_without_link_header(self):
+        """Without a Link header pages are walked until a short page"""
+        with MockGitHubServer(repo_count=250, link_header=False) as server:
+            success, repos, _ = self.list_repositories(server)
+
+        self.assertTrue(success)
+        self.assertEqual(len(repos), 250)
+        self.assertEqual(server.requests_by_route["GET /user/repos"], 3)
+
+    def test_single_page_account(self):
+        """An account with one page makes a single listing request"""
+        with MockGitHubServer(repo_count=7) as server:
+            success, repos, _ = self.list_repositories(server)
+
+        self.assertTrue(success)
+        self.assertEqual(len(repos), 7)
+        self.assertEqual(repos[0]["url"], "https://github.com/mock-user/repo-000000")
+        self.assertEqual(server.requests_by_route["GET /user/repos"], 1)
+
+    def test_failed_page_fails_listing(self):
+        """An error on any page is reported instead of a partial list"""
+        with FailingPageServer(repo_count=500) as server:
+            success, repos, message = self.list_repositories(server)
+
+        self.assertFalse(success)
+        self.assertEqual(repos, [])
+        self.assertEqual(message, "Failed to fetch repositories: 502")
+
+
+class TestStreamingListing(unittest.TestCase):
+    """Test page-at-a-time repository iteration"""
+
+    def setUp(self):
+        self.server = MockGitHubServer(repo_count=450, latency=0.1)
+        self.server.start()
+        self.client = GitHubAPIClient(self.server.base_url, prewarm_connections=0, max_workers=2)
+        self.client.authenticate("mock-token")
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_first_page_arrives_after_one_request(self):
+        """The first page is yielded before the remaining pages are fetched"""
+        start = time.perf_counter()
+        pages = self.client.iter_user_repositories()
+        first = next(pages)
+        time_to_first_page = time.perf_counter() - start
+        rest = list(pages)
+        total = time.perf_counter() - start
+
+        self.assertEqual(len(first), 100)
+        self.assertEqual([len(page) for page in rest], [100, 100, 100, 50])
+        self.assertLess(time_to_first_page, total / 2)
+
+    def test_on_page_callback_sees_every_page(self):
+        """get_user_repositories reports each page to on_page in order"""
+        pages = []
+        success, repos, _ = self.client.get_user_repositories(on_page=pages.append)
+
+        self.assertTrue(success)
+        self.assertEqual([repo for page in pages for repo in page], repos)
+
+    def test_iterator_requires_authentication(self):
+        """Iterating without a token raises instead of yielding nothing"""
+        with self.assertRaises(GitHubAPIError):
+            next(GitHubAPIClient(self.server.base_url).iter_user_repositories())
+
+
+if __name__ == "__main__":
+    unittest.main()
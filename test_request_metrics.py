@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Tests for the request hooks and the metrics collector
+Runs against a local mock server, no token, network or display required
+"""
+
+import sys
+import os
+import io
+import json
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add src and benchmarks directories to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, 'src'))
+sys.path.insert(0, os.path.join(current_dir, 'benchmarks'))
+
+import cli
+import requests
+from github_client import GitHubAPIClient
+from mock_github_server import MockGitHubServer
+from rate_limit import RateLimitGovernor
+from request_metrics import RequestMetrics, endpoint_template
+
+
+class TestEndpointTemplate(unittest.TestCase):
+    """Test that URLs collapse to one series per endpoint"""
+
+    def test_templates(self):
+        self.assertEqual(endpoint_template("https://api.github.com/users/octocat"), "/users/{username}")
+        self.assertEqual(endpoint_template("https://ghe.example/api/v3/repos/o/r/collaborators/u"),
+                         "/repos/{owner}/{repo}/collaborators/{username}")
+        self.assertEqual(endpoint_template("https://api.github.com/user/repos?page=3"), "/user/repos")
+        self.assertEqual(endpoint_template("https://api.github.com/orgs/acme/teams/42"), "/orgs/acme/teams/{id}")
+
+
+class TestRequestMetrics(unittest.TestCase):
+    """Test hooks and collectors against the mock server"""
+
+    def setUp(self):
+        self.server = MockGitHubServer(repo_count=150, rate_limit=1000)
+        self.server.start()
+        self.client = GitHubAPIClient(self.server.base_url, prewarm_connections=0,
+                                      governor=RateLimitGovernor(writes_per_minute=0, writes_per_hour=0))
+        self.metrics = RequestMetrics().attach(self.client)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_hooks_see_every_attempt(self):
+        before, after = [], []
+        self.client.add_request_hooks(before=lambda event: before.append(event.status),
+                                      after=lambda event: after.append(event))
+        self.client.authenticate("mock-token")
+        self.assertEqual(before, [None])
+        (event,) = after
+        self.assertEqual((event.method, event.endpoint, event.status, event.resource), ("GET", "/user", 200, "core"))
+        self.assertGreater(event.bytes_received, 0)
+        self.assertEqual(event.rate_limit_remaining, 999)
+
+    def test_summary_counts_cache_hits_and_bytes(self):
+        self.client.authenticate("mock-token")
+        self.client.get_user_repositories()
+        self.client.get_user_repositories()
+        summary = self.metrics.summary()
+        self.assertEqual(summary["requests"], self.server.request_count)
+        self.assertEqual(summary["cache_hits"], self.server.not_modified_count)
+        self.assertEqual(summary["cache_hits"], 2)
+        self.assertEqual(summary["errors"], 0)
+        self.assertEqual(summary["rate_limit_remaining"], {"core": 1000 - self.server.request_count})
+        self.assertIn("API: 5 requests", self.metrics.status_line())
+
+        add = self.client.add_collaborator("mock-user/missing-repo", "octocat")
+        self.assertFalse(add[0])
+        self.assertEqual(self.metrics.summary()["errors"], 1)
+        self.assertGreater(self.metrics.summary()["bytes_sent"], 0)
+
+    def test_retries_counted(self):
+        self.server.secondary_every = 2
+        self.server.retry_after = "0"
+        self.client.authenticate("mock-token")
+        self.client.add_collaborators_bulk([f"mock-user/repo-{i}" for i in range(4)], "octocat", max_workers=1)
+        self.assertEqual(self.metrics.summary()["retries"], self.server.throttled_count)
+        self.assertGreater(self.server.throttled_count, 0)
+
+    def test_network_error_is_reported(self):
+        errors = []
+        self.client.add_request_hooks(after=lambda event: errors.append(event.error))
+        self.client.base_url = "http://127.0.0.1:9"  # Discard port, nothing listens
+        self.assertFalse(self.client.authenticate("mock-token")[0])
+        self.assertIsInstance(errors[0], requests.exceptions.ConnectionError)
+        self.assertEqual(self.metrics.summary()["errors"], 1)
+
+    def test_exports(self):
+        self.client.authenticate("mock-token")
+        self.client.verify_username("octocat")
+        text = self.metrics.to_openmetrics()
+        self.assertIn('github_client_request_duration_seconds_bucket{method="GET",endpoint="/users/{username}",'
+                      'le="+Inf"} 1', text)
+        self.assertIn('github_client_responses_total{method="GET",endpoint="/user",status="200"} 1', text)
+        self.assertIn('github_client_rate_limit_remaining{resource="core"} 998', text)
+        self.assertTrue(text.endswith("# EOF\n"))
+
+        snapshot = json.loads(self.metrics.to_json())
+        self.assertEqual([entry["endpoint"] for entry in snapshot["endpoints"]], ["/user", "/users/{username}"])
+        self.assertEqual(sum(snapshot["endpoints"][0]["buckets"]), 1)
+
+        self.metrics.reset()
+        self.assertEqual(self.metrics.summary()["requests"], 0)
+        self.assertEqual(self.metrics.status_line(), "")
+
+
+class TestCliMetrics(unittest.TestCase):
+    """Test the --metrics export of the CLI"""
+
+    def test_metrics_file_written(self):
+        directory = tempfile.mkdtemp()
+        try:
+            with MockGitHubServer(repo_count=3) as server, \
+                    patch.dict(os.environ, {"GITHUB_TOKEN": "mock-token"}):
+                for name in ("metrics.prom", "metrics.json"):
+                    path = os.path.join(directory, name)
+                    code = cli.main(["--base-url", server.base_url, "--metrics", path, "repos"],
+                                    out=io.StringIO(), err=io.StringIO())
+                    self.assertEqual(code, cli.EXIT_OK)
+            with open(os.path.join(directory, "metrics.prom")) as handle:
+                self.assertIn('endpoint="/user/repos"', handle.read())
+            with open(os.path.join(directory, "metrics.json")) as handle:
+                self.assertEqual(json.load(handle)["summary"]["requests"], 2)
+            self.assertEqual(sorted(os.listdir(directory)), ["metrics.json", "metrics.prom"])
+        finally:
+            shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests for the conditional-request (ETag) response cache
+Runs against a local mock server, no token or network access required
+"""
+
+import sys
+import os
+import unittest
+
+import requests
+
+# Add src and benchmarks directories to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, 'src'))
+sys.path.insert(0, os.path.join(current_dir, 'benchmarks'))
+
+from github_client import GitHubAPIClient
+from response_cache import ResponseCache
+from mock_github_server import MockGitHubServer
+
+
+def make_response(content, etag='"abc"'):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = content
+    response.headers["ETag"] = etag
+    return response
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test cache bookkeeping"""
+
+    def test_lru_entry_cap(self):
+        """The least recently used entry is evicted first"""
+        cache = ResponseCache(max_entries=2)
+        cache.store("a", make_response(b"1"))
+        cache.store("b", make_response(b"2"))
+        cache.get("a")
+        cache.store("c", make_response(b"3"))
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_byte_cap(self):
+        """Total body size stays under max_bytes"""
+        cache = ResponseCache(max_bytes=10)
+        cache.store("a", make_response(b"123456"))
+        cache.store("b", make_response(b"123456"))
+        self.assertEqual(cache.stats()["entries"], 1)
+        self.assertLessEqual(cache.stats()["bytes"], 10)
+
+    def test_responses_without_validators_are_not_cached(self):
+        """Only responses with an ETag or Last-Modified are stored"""
+        cache = ResponseCache()
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b"1"
+        cache.store("a", response)
+        self.assertEqual(cache.stats()["entries"], 0)
+
+    def test_key_separates_tokens_without_storing_them(self):
+        """Keys differ per token and never contain the token itself"""
+        key_a = ResponseCache.make_key("secret-a", "https://x/user/repos", {"page": 1})
+        key_b = ResponseCache.make_key("secret-b", "https://x/user/repos", {"page": 1})
+        self.assertNotEqual(key_a, key_b)
+        self.assertNotIn("secret-a", repr(key_a))
+
+
+class TestConditionalRequests(unittest.TestCase):
+    """Test 304 revalidation through the client"""
+
+    def setUp(self):
+        self.server = MockGitHubServer(repo_count=250)
+        self.server.start()
+        self.client = GitHubAPIClient(self.server.base_url, prewarm_connections=0)
+        self.client.authenticate("mock-token")
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_repeat_listing_served_from_304s(self):
+        """A second listing revalidates every page and reuses the cached bodies"""
+        success, first, _ = self.client.get_user_repositories()
+        self.assertTrue(success)
+        success, second, _ = self.client.get_user_repositories()
+        self.assertTrue(success)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(second), 250)
+        self.assertEqual(self.server.not_modified_count, 3)
+        self.assertEqual(self.client.cache_stats()["hits"], 3)
+
+    def test_changed_content_is_refetched(self):
+        """A changed resource fails revalidation and replaces the cached copy"""
+        self.client.get_user_repositories()
+        self.server.repo_count = 260
+        success, repos, _ = self.client.get_user_repositories()
+
+        self.assertTrue(success)
+        self.assertEqual(len(repos), 260)
+
+    def test_verify_username_uses_cache(self):
+        """Repeated user lookups are answered with 304s"""
+        self.assertTrue(self.client.verify_username("octocat")[0])
+        # Bypass the username TTL cache so the lookup is revalidated over HTTP
+        self.client.user_cache.clear()
+        exists, message = self.client.verify_username("octocat")
+        self.assertTrue(exists)
+        self.assertIn("Octocat", message)
+        self.assertEqual(self.server.not_modified_count, 1)
+
+    def test_other_token_does_not_share_entries(self):
+        """A different token never receives another identity's cached body"""
+        self.client.verify_username("octocat")
+        self.client.authenticate("other-token")
+        self.client.user_cache.clear()
+        self.client.verify_username("octocat")
+        self.assertEqual(self.server.not_modified_count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for the bitset selection model
+"""
+
+import sys
+import os
+import unittest
+
+# Add src directory to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, 'src'))
+
+from repo_records import RepositoryList
+from repo_list_view import RepositoryListModel
+from selection_model import Selection, bits_from_mask, mask_from_bits
+
+
+class TestSelection(unittest.TestCase):
+    """Test bulk and single-index operations"""
+
+    def test_bulk_operations(self):
+        """All, none and invert cover exactly range(size)"""
+        selection = Selection(10)
+        selection.select_all()
+        self.assertEqual(len(selection), 10)
+        selection.set(3, False)
+        selection.invert()
+        self.assertEqual(selection.positions(), [3])
+        selection.clear()
+        self.assertEqual(len(selection), 0)
+        self.assertNotIn(3, selection)
+
+    def test_add_positions_and_mask(self):
+        """Positions and 0/1 masks are unioned into the selection"""
+        selection = Selection(6)
+        selection.add_positions([5, 1])
+        selection.add_mask(bytes([0, 0, 1, 0, 0, 0]))
+        self.assertEqual(list(selection), [1, 2, 5])
+
+    def test_resize(self):
+        """Growing keeps the selection; shrinking drops indices past the end"""
+        selection = Selection(4)
+        selection.select_all()
+        selection.resize(8)
+        self.assertEqual(selection.positions(), [0, 1, 2, 3])
+        selection.invert()
+        self.assertEqual(selection.positions(), [4, 5, 6, 7])
+        selection.resize(5)
+        self.assertEqual(selection.positions(), [4])
+
+    def test_mask_round_trip(self):
+        """bits_from_mask and mask_from_bits are inverses"""
+        mask = bytes([1, 0, 0, 1, 1, 0, 0, 0])
+        self.assertEqual(bits_from_mask(mask), 0b11001)
+        self.assertEqual(mask_from_bits(0b11001, 8), mask)
+        self.assertEqual(bits_from_mask(b""), 0)
+        self.assertEqual(mask_from_bits(0, 3), bytes(3))
+
+    def test_large_selection(self):
+        """Selecting tens of thousands of indices needs no per-index Python work"""
+        selection = Selection(20000)
+        selection.select_all()
+        selection.set(19999, False)
+        self.assertEqual(len(selection), 19999)
+        self.assertEqual(len(selection.positions()), 19999)
+
+
+class TestModelSelection(unittest.TestCase):
+    """Test the list model's selection operations"""
+
+    def setUp(self):
+        self.model = RepositoryListModel()
+        self.model.extend(RepositoryList({
+            "name": name,
+            "full_name": f"owner/{name}",
+            "description": None,
+            "private": private,
+            "url": f"https://github.com/owner/{name}",
+            "permissions": {"admin": True},
+        } for name, private in (("api", True), ("web", False), ("api-docs", False))))
+
+    def test_select_matches(self):
+        """Select Shown adds the filtered rows to the selection"""
+        self.model.set_selected(1, True)
+        self.model.set_filter("api")
+        self.model.select_matches()
+        self.assertEqual(self.model.selected_full_names(), ["owner/api", "owner/web", "owner/api-docs"])
+
+    def test_select_visibility_and_invert(self):
+        """Visibility selection uses the flag column; invert covers every repository"""
+        self.model.select_visibility(private=False)
+        self.assertEqual(self.model.selected_full_names(), ["owner/web", "owner/api-docs"])
+        self.model.invert_selection()
+        self.assertEqual(self.model.selected_full_names(), ["owner/api"])
+        self.assertTrue(self.model.is_selected(0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Startup-time regression tests
+Imports the GUI module in a fresh interpreter under `python -X importtime`
+and checks that heavy modules stay out of the cold start and that the
+import fits the time budget.
+"""
+
+import sys
+import os
+import re
+import subprocess
+import unittest
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.join(current_dir, 'src')
+
+# Cumulative import time of main_app, best of RUNS; eager imports of requests
+# and sqlite3 used to put it near 100 ms
+STARTUP_IMPORT_BUDGET_MS = 60
+RUNS = 3
+# Loaded in the background or on first use, never before the window opens
+DEFERRED_MODULES = ("requests", "urllib3", "ssl", "http.client", "sqlite3", "json", "github_client",
+                    "request_metrics", "adaptive_concurrency", "asyncio")
+
+
+def import_times(module):
+    """Run `import module` in a fresh interpreter; return {module name: cumulative microseconds}"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=src_dir, env=dict(os.environ, PYTHONPATH=src_dir),
+        capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|\s+(\S+)", line)
+        if match:
+            times[match.group(2)] = int(match.group(1))
+    return times
+
+
+class TestStartupTime(unittest.TestCase):
+    """Test the cold-start import cost of the GUI"""
+
+    def test_heavy_modules_are_deferred(self):
+        imported = import_times("main_app")
+        self.assertIn("main_app", imported)
+        loaded = [name for name in DEFERRED_MODULES if name in imported]
+        self.assertEqual(loaded, [], "imported at startup")
+
+    def test_import_within_budget(self):
+        best = min(import_times("main_app")["main_app"] for _ in range(RUNS)) / 1000
+        self.assertLess(best, STARTUP_IMPORT_BUDGET_MS,
+                        f"main_app took {best:.1f} ms to import (budget {STARTUP_IMPORT_BUDGET_MS} ms)")
+
+    def test_entry_point_imports_nothing_heavy(self):
+        """main.py decides between GUI and CLI before importing either"""
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import main"],
+            cwd=current_dir, capture_output=True, text=True, check=True
+        )
+        for name in ("tkinter", "requests", "main_app", "cli"):
+            self.assertNotRegex(result.stderr, rf"\|\s+{re.escape(name)}\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Tests for the token pool
+Unit tests use fake governors; integration tests run against a local mock server
+"""
+
+import sys
+import os
+import unittest
+from unittest.mock import Mock
+
+import requests
+
+# Add src and benchmarks directories to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, 'src'))
+sys.path.insert(0, os.path.join(current_dir, 'benchmarks'))
+
+from github_client import GitHubAPIClient
+from rate_limit import RateLimitGovernor
+from token_pool import PooledToken, TokenPool, auth_headers
+from mock_github_server import MockGitHubServer
+
+
+def make_response(remaining):
+    return Mock(status_code=200, headers={"X-RateLimit-Remaining": str(remaining), "X-RateLimit-Reset": "9999999999"},
+                text="")
+
+
+class TestTokenPool(unittest.TestCase):
+    """Test token selection without a server"""
+
+    def setUp(self):
+        self.entries = [PooledToken(f"token-{i}", RateLimitGovernor()) for i in range(3)]
+        self.pool = TokenPool(self.entries)
+
+    def test_prefers_most_remaining_budget(self):
+        self.entries[0].governor.observe(make_response(10))
+        self.entries[1].governor.observe(make_response(4000))
+        self.entries[2].governor.observe(make_response(900))
+        self.assertIs(self.pool.select(), self.entries[1])
+
+    def test_unknown_budget_counts_as_full(self):
+        self.entries[0].governor.observe(make_response(4999))
+        self.entries[1].governor.observe(make_response(4999))
+        self.assertIs(self.pool.select(), self.entries[2])
+
+    def test_paused_token_is_ranked_last(self):
+        self.entries[0].governor.pause(30, "secondary")
+        self.assertIsNot(self.pool.rank()[0], self.entries[0])
+        self.assertIs(self.pool.rank()[-1], self.entries[0])
+
+    def test_revoked_token_is_dropped(self):
+        self.pool.set_admins("o/r", self.entries[:2])
+        self.pool.revoke(self.entries[1])
+        self.assertEqual(self.pool.admins_for("o/r"), [self.entries[0]])
+        self.assertIsNone(self.pool.admins_for("o/other"))
+        self.assertNotIn(self.entries[1], self.pool.active())
+        for entry in self.entries:
+            self.pool.revoke(entry)
+        self.assertIsNone(self.pool.select())
+
+    def test_primary_skips_revoked_tokens(self):
+        self.pool.revoke(self.entries[0])
+        self.assertIs(self.pool.primary, self.entries[1])
+
+    def test_stats(self):
+        self.entries[0].user = {"login": "alice"}
+        self.pool.set_admins("o/a", [self.entries[0]])
+        self.pool.set_admins("o/b", [self.entries[0], self.entries[2]])
+        stats = self.pool.stats()
+        self.assertEqual(len(stats), 3)
+        self.assertEqual((stats[0]["login"], stats[0]["admin_repositories"]), ("alice", 2))
+        self.assertEqual([stat["admin_repositories"] for stat in stats[1:]], [0, 1])
+
+
+class TestPooledClient(unittest.TestCase):
+    """Test a client with several tokens against the mock server"""
+
+    TOKENS = {
+        "token-a": {"login": "alice"},
+        "token-b": {"login": "bob", "admin": ["mock-user/repo-1"]},
+        "token-c": {"login": "carol", "admin": []},
+    }
+
+    def make_client(self, server):
+        return GitHubAPIClient(server.base_url, prewarm_connections=0, max_workers=1, pool_size=1,
+                               governor=RateLimitGovernor(writes_per_minute=0, writes_per_hour=0))
+
+    def test_reads_spread_across_tokens(self):
+        """Reads use every token and each token's budget is tracked on its own"""
+        with MockGitHubServer(tokens=self.TOKENS, rate_limit=100, known_users=[f"user-{i}" for i in range(30)]) as server:
+            with self.make_client(server) as client:
+                success, message = client.authenticate_tokens(list(self.TOKENS))
+                self.assertEqual((success, message), (True, "Successfully authenticated as alice with 3 tokens"))
+                results = client.verify_usernames([f"user-{i}" for i in range(30)])
+                stats = client.token_stats()
+
+        self.assertTrue(all(exists for _, exists, _ in results))
+        # 3 authentication checks plus 30 lookups
+        self.assertEqual(sum(server.requests_by_token.values()), 33)
+        self.assertEqual(sorted(server.requests_by_token.values()), [11, 11, 11])
+        self.assertEqual([stat["remaining"] for stat in stats], [89, 89, 89])
+        self.assertEqual([stat["login"] for stat in stats], ["alice", "bob", "carol"])
+
+    def test_user_endpoints_use_primary_token(self):
+        """The repository listing asks as the primary account"""
+        with MockGitHubServer(tokens=self.TOKENS, repo_count=5) as server:
+            with self.make_client(server) as client:
+                client.authenticate_tokens(["token-b", "token-a"])
+                server.reset_counters()
+                client.get_user_repositories()
+                self.assertEqual(client.authenticated_user["login"], "bob")
+
+        self.assertEqual(server.requests_by_token, {"token-b": 1})
+
+    def test_writes_go_to_admin_token(self):
+        """Writes go to a token with admin on the repository, checked once per repository"""
+        with MockGitHubServer(tokens=self.TOKENS) as server:
+            with self.make_client(server) as client:
+                client.authenticate_tokens(["token-c", "token-b"])
+                for _ in range(3):
+                    success, message = client.add_collaborator("mock-user/repo-1", "octocat")
+                    self.assertTrue(success, message)
+                stats = client.token_stats()
+
+        self.assertEqual(server.writes_by_token, {"token-b": 3})
+        self.assertEqual(server.requests_by_route["GET /repos/{repo}"], 2)
+        self.assertEqual([stat["admin_repositories"] for stat in stats], [0, 1])
+
+    def test_throttled_write_moves_to_another_admin_token(self):
+        """A secondary limit on one admin token sends the retry through another one"""
+        tokens = {"token-a": {"login": "alice"}, "token-b": {"login": "bob"}}
+        with MockGitHubServer(tokens=tokens, secondary_every=2, retry_after="30") as server:
+            with self.make_client(server) as client:
+                client.authenticate_tokens(["token-a", "token-b"])
+                server.reset_counters()
+                results = [client.add_collaborator("mock-user/repo-1", "octocat") for _ in range(2)]
+                paused = [entry.governor.required_wait() > 0 for entry in client.token_pool.entries]
+
+        self.assertTrue(all(success for success, _ in results), results)
+        self.assertEqual(server.throttled_count, 1)
+        self.assertEqual(server.writes_by_token, {"token-a": 2, "token-b": 1})
+        # Only the throttled token is held back; the one that took over is not paused
+        self.assertEqual(paused, [True, False])
+
+    def test_single_valid_token_needs_no_pool(self):
+        """With one valid token, writes are sent without per-repository admin checks"""
+        with MockGitHubServer(tokens=self.TOKENS) as server:
+            with self.make_client(server) as client:
+                client.authenticate_tokens(["token-a", "bogus"])
+                self.assertIsNone(client.token_pool)
+                server.reset_counters()
+                client.add_collaborator("mock-user/repo-1", "octocat")
+
+        self.assertNotIn("GET /repos/{repo}", server.requests_by_route)
+        self.assertEqual(server.requests_by_token, {"token-a": 1})
+
+    def test_revoked_primary_hands_over(self):
+        """After the primary token is revoked the next one answers the user endpoints"""
+        with MockGitHubServer(tokens=self.TOKENS, repo_count=3) as server:
+            with self.make_client(server) as client:
+                client.authenticate_tokens(["token-a", "token-b"])
+                server.revoked.add("token-a")
+                success, repos, message = client.get_user_repositories()
+                self.assertTrue(success, message)
+                self.assertEqual(len(repos), 3)
+                self.assertEqual((client.token, client.authenticated_user["login"]), ("token-b", "bob"))
+                self.assertIs(client.governor, client.token_pool.primary.governor)
+
+    def test_current_wait_covers_every_token(self):
+        with MockGitHubServer(tokens=self.TOKENS) as server:
+            with self.make_client(server) as client:
+                client.authenticate_tokens(["token-a", "token-b"])
+                self.assertIsNone(client.current_wait())
+                client.token_pool.entries[1].governor._start_wait("test", "secondary", 30)
+                reason, seconds = client.current_wait()
+        self.assertEqual(reason, "secondary")
+        self.assertAlmostEqual(seconds, 30, delta=1)
+
+    def test_write_without_admin_reports_permission_error(self):
+        """When no token has admin, GitHub's 403 is reported as with one token"""
+        with MockGitHubServer(tokens=self.TOKENS) as server:
+            with self.make_client(server) as client:
+                client.authenticate_tokens(["token-c", "token-b"])
+                success, message = client.add_collaborator("mock-user/repo-2", "octocat")
+
+        self.assertFalse(success)
+        self.assertIn("Permission denied", message)
+
+    def test_revoked_token_fails_over(self):
+        """A token answered with 401 is dropped and the request moves on"""
+        with MockGitHubServer(tokens=self.TOKENS, rate_limit=100) as server:
+            with self.make_client(server) as client:
+                client.authenticate_tokens(["token-a", "token-c"])
+                server.revoked.add("token-c")
+                results = client.verify_usernames(["octocat"] + [f"octocat{i}" for i in range(4)])
+                stats = client.token_stats()
+
+        self.assertEqual([exists for _, exists, _ in results], [True, False, False, False, False])
+        self.assertEqual([stat["revoked"] for stat in stats], [False, True])
+        self.assertEqual(server.requests_by_token.get("token-c"), 2)  # /user check and one rejected lookup
+
+    def test_exhausted_token_fails_over(self):
+        """A token whose budget ran out is held back instead of failing the request"""
+        with MockGitHubServer(tokens=self.TOKENS, rate_limit=3, known_users=["octocat", "hubot"]) as server:
+            with self.make_client(server) as client:
+                client.authenticate_tokens(["token-a", "token-b"])
+                # Spend token-a's budget behind the client's back
+                for _ in range(2):
+                    requests.get(f"{server.base_url}/users/ghost", headers=auth_headers("token-a"), timeout=5)
+                results = client.verify_usernames(["octocat", "hubot"])
+
+        self.assertEqual([exists for _, exists, _ in results], [True, True])
+        self.assertEqual(server.throttled_count, 1)
+
+    def test_rejected_tokens_are_reported(self):
+        with MockGitHubServer(tokens=self.TOKENS) as server:
+            with self.make_client(server) as client:
+                success, message = client.authenticate_tokens(["token-a", "bogus", "token-a"])
+                self.assertEqual((success, message), (True, "Successfully authenticated as alice with 1 token (1 rejected)"))
+                success, message = client.authenticate_tokens(["bogus", "token-b", "token-c"])
+                self.assertEqual(message, "Successfully authenticated as bob with 2 tokens (1 rejected)")
+                self.assertEqual(client.token, "token-b")
+                self.assertEqual(client.authenticate_tokens(["bogus", "other"]),
+                                 (False, "Invalid Personal Access Token"))
+                self.assertIsNone(client.token_pool)
+
+
+if __name__ == "__main__":
+    unittest.main()
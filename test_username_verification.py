@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Tests for batch username verification and its TTL cache
+Runs against a local mock server, no token or network access required
+"""
+
+import sys
+import os
+import time
+import unittest
+
+# Add src and benchmarks directories to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, 'src'))
+sys.path.insert(0, os.path.join(current_dir, 'benchmarks'))
+
+from github_client import GitHubAPIClient, MISSING_USER_CACHE_TTL
+from response_cache import TTLCache
+from mock_github_server import MockGitHubServer
+
+
+class FakeClock:
+    """Clock advanced by hand"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache(unittest.TestCase):
+    """Test expiry and LRU eviction"""
+
+    def test_entries_expire(self):
+        """Entries disappear after their own TTL"""
+        clock = FakeClock()
+        cache = TTLCache(clock=clock)
+        cache.set("short", 1, ttl=5)
+        cache.set("long", 2, ttl=50)
+        clock.now = 10
+
+        self.assertIsNone(cache.get("short"))
+        self.assertEqual(cache.get("long"), 2)
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted at the cap"""
+        cache = TTLCache(max_entries=2)
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.get("a")
+        cache.set("c", 3, ttl=60)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+
+
+class TestVerifyUsernames(unittest.TestCase):
+    """Test batch verification against the mock server"""
+
+    def setUp(self):
+        self.server = MockGitHubServer(latency=0.05, known_users=["octocat", "hubot"])
+        self.server.start()
+        self.clock = FakeClock()
+        self.client = GitHubAPIClient(self.server.base_url, prewarm_connections=0, max_workers=8,
+                                      user_cache=TTLCache(clock=self.clock))
+        self.client.authenticate("mock-token")
+        self.server.reset_counters()
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_dedupes_and_normalizes_case(self):
+        """Names are stripped and deduplicated case-insensitively, keeping input order"""
+        results = self.client.verify_usernames([" octocat", "OctoCat", "ghost", "", "hubot", "GHOST "])
+
+        self.assertEqual([(name, exists) for name, exists, _ in results],
+                         [("octocat", True), ("ghost", False), ("hubot", True)])
+        self.assertEqual(self.server.request_count, 3)
+
+    def test_cached_results_skip_the_network(self):
+        """Found and not-found results are both served from the cache"""
+        self.client.verify_usernames(["octocat", "ghost"])
+        self.server.reset_counters()
+        results = self.client.verify_usernames(["OCTOCAT", "ghost"])
+
+        self.assertEqual(self.server.request_count, 0)
+        self.assertEqual(results[0], ("OCTOCAT", True, "User 'OCTOCAT' found: Octocat"))
+        self.assertEqual(results[1], ("ghost", False, "User 'ghost' not found"))
+
+    def test_negative_results_expire_sooner(self):
+        """Not-found entries are re-checked after their shorter TTL"""
+        self.client.verify_usernames(["octocat", "ghost"])
+        self.server.reset_counters()
+        self.clock.now = MISSING_USER_CACHE_TTL + 1
+        self.client.verify_usernames(["octocat", "ghost"])
+
+        self.assertEqual(self.server.requests_by_route, {"GET /users/ghost": 1})
+
+    def test_misses_are_fetched_concurrently(self):
+        """Forty lookups with 50 ms latency take far less than forty round trips"""
+        names = [f"user-{i}" for i in range(40)]
+        start = time.perf_counter()
+        results = self.client.verify_usernames(names)
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(results), 40)
+        self.assertLess(elapsed, 1.0)
+
+    def test_graphql_backend_batches_misses(self):
+        """The GraphQL backend resolves all misses in one query"""
+        self.client.backend = "graphql"
+        results = self.client.verify_usernames(["octocat"] + [f"user-{i}" for i in range(30)])
+
+        self.assertEqual(self.server.request_count, 1)
+        self.assertTrue(results[0][1])
+        self.assertFalse(any(exists for _, exists, _ in results[1:]))
+
+    def test_long_list_is_batched_over_graphql(self):
+        """200 pasted handles take a few GraphQL queries, even on the REST backend"""
+        results = self.client.verify_usernames(["hubot"] + [f"user-{i}" for i in range(199)])
+
+        self.assertEqual(self.server.requests_by_route, {"POST /graphql": 4})
+        self.assertTrue(results[0][1])
+
+    def test_rest_fan_out_ignores_max_workers(self):
+        """Read lookups use the whole connection pool, not the write worker count"""
+        self.client.max_workers = 1
+        start = time.perf_counter()
+        self.client.verify_usernames([f"user-{i}" for i in range(20)])
+        elapsed = time.perf_counter() - start
+
+        # Twenty serial 50 ms lookups would take a second
+        self.assertLess(elapsed, 0.5)
+
+    def test_verify_username_shares_the_cache(self):
+        """The single-name API uses the same cache"""
+        self.assertEqual(self.client.verify_username("hubot"), (True, "User 'hubot' found: Hubot"))
+        self.client.verify_username("Hubot")
+        self.assertEqual(self.server.request_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()